@@ -5,6 +5,7 @@ from typing import Dict
 
 from ...services.file_reader import FileReader
 from ...services.class_finder import ClassFinder
+from ...services.analysis_service import AnalysisService
 from backend.security.oauth2 import get_current_active_user
 from ...services.uploaded_dir import get_user_upload_dir
 from ...models.userInAlchemy import UserInAlchemy
@@ -49,7 +50,7 @@ async def class_finder_route_testing():
 #     classes = ClassFinder.find_classes(content)
 #     return {"classes": classes}
 
-@router.get("/get_classes/{filename}")
+@router.get("/get_classes/{filename:path}")
 async def get_class_inheritance(
     filename: str,
     current_user: UserInAlchemy = Depends(get_current_active_user),
@@ -64,7 +65,6 @@ async def get_class_inheritance(
     Returns:
         dict: A dictionary containing class inheritance information.
     """
-    uploaded_dir = get_user_upload_dir(current_user.username)
-    content = FileReader.read_file(filename, uploaded_dir)
-    class_data = ClassFinder.find_classes_with_parents(content)
+    analysis = await AnalysisService().analyze_file_async(filename, current_user.username)
+    class_data = ClassFinder.find_classes_with_parents(analysis)
     return {"classes": class_data}
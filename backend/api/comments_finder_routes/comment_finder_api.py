@@ -2,6 +2,7 @@ import os
 from fastapi import APIRouter
 
 from backend.services.comment_finder import CommentFinder
+from backend.services.analysis_service import AnalysisService
 from backend.services.file_reader import FileReader
 from backend.security.oauth2 import get_current_active_user
 from fastapi import Depends
@@ -24,17 +25,21 @@ async def comments_finder_route_root():
     """
     return {"message": "Comments finder routes is working...."}
 
-@router.get("/get_comments/{filename}")
+@router.get("/get_comments/{filename:path}")
 async def comments_finder(
     filename: str,
+    structured: bool = False,
+    include_docstrings: bool = True,
         current_user: UserInAlchemy = Depends(get_current_active_user),
 ):
-    uploaded_dir = get_user_upload_dir(current_user.username)
     """
     Find all comments in a Python file.
     
     Args:
         filename (str): The name of the file to analyze
+        structured (bool): Return one record per comment/docstring with
+            line, column, text, inline and kind instead of a single string
+        include_docstrings (bool): Include docstrings in structured output
         
     Returns:
         dict: A dictionary containing all comments found in the file
@@ -42,6 +47,9 @@ async def comments_finder(
     Raises:
         HTTPException: If the file is not found (404) or not a Python file (400)
     """
-    content = FileReader.read_file(filename, uploaded_dir)
-    comments = CommentFinder.find_comments(content)
+    analysis = await AnalysisService().analyze_file_async(filename, current_user.username)
+    if structured:
+        comments = CommentFinder.extract_comments(analysis, include_docstrings)
+        return {"comments": comments, "count": len(comments)}
+    comments = CommentFinder.find_comments(analysis)
     return {"comments": comments}
\ No newline at end of file
@@ -1,13 +1,15 @@
 from ast import List
 import os
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from typing import Optional
+from fastapi import APIRouter, File, HTTPException, Query, UploadFile
 from fastapi import Depends
 from fastapi import Depends, HTTPException
 
-from backend.services.delete_file import FileDeleter
 from backend.services.file_writer import FileWriter
 from backend.services.check_validation import FileValidator
 from backend.services.file_reader import FileReader
+from backend.services.file_io import file_io
+from backend.services.file_service import FileService
 from backend.services.path_finder import PathFinder
 from backend.security.oauth2 import get_current_active_user
 from ...services.uploaded_dir import get_user_upload_dir
@@ -34,15 +36,22 @@ def is_valid_token(token: str) -> bool:
 
 
 @router.get("/get_all_files")
-async def all_files(current_user: UserInAlchemy = Depends(get_current_active_user)):
-    uploaded_dir = get_user_upload_dir(current_user.username)
+async def all_files(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+):
     """
-    Get a list of all files in the uploads directory.
+    Get a page of the files in the uploads directory, including nested ones.
     
+    Args:
+        limit (int): Maximum number of paths to return
+        cursor (str): next_cursor of the previous page
+        
     Returns:
-        dict: A dictionary containing a list of all filenames
+        dict: A dictionary containing relative file paths and the next cursor
     """
-    return {"files": os.listdir(uploaded_dir)}
+    return await FileService().get_user_files(current_user.username, limit, cursor)
 
 # multiple file upload
 @router.post("/upload")
@@ -68,14 +77,14 @@ async def upload_files(
     for file in files:
         if FileValidator.isPython(file.filename):
             file_path = PathFinder.find_path(file.filename, uploaded_dir)
-            message = FileWriter.write_file(file_path, file)
+            message = await file_io.run(FileWriter.write_file, file_path, file)
             # return message
         else:
             raise HTTPException(status_code=400, detail="File is not a python file")
     return message
 
 # get contents
-@router.get("/get_contents/{file_name}")
+@router.get("/get_contents/{file_name:path}")
 async def get_file_contents(
     file_name: str, 
     current_user: UserInAlchemy = Depends(get_current_active_user)
@@ -93,14 +102,13 @@ async def get_file_contents(
     Raises:
         HTTPException: If the file is not found (404) or not a Python file (400)
     """
-    return {"content": FileReader.read_file(file_name, uploaded_dir)}
+    return {"content": await file_io.run(FileReader.read_file, file_name, uploaded_dir)}
 
 # delete file
-@router.delete("/delete/{file_name}")
+@router.delete("/delete/{file_name:path}")
 async def delete_file(
     file_name: str, current_user: UserInAlchemy = Depends(get_current_active_user)
 ):
-    uploaded_dir = get_user_upload_dir(current_user.username)
     """
     Delete a specific file.
     
@@ -113,6 +121,4 @@ async def delete_file(
     Raises:
         HTTPException: If the file is not found (404) or an error occurs during deletion (500)
     """
-    file_path = PathFinder.find_path(file_name, uploaded_dir)
-    message = FileDeleter.delete_file(file_path)
-    return message
\ No newline at end of file
+    return await FileService().delete_file(file_name, current_user.username)
\ No newline at end of file
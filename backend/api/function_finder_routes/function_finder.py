@@ -4,6 +4,7 @@ from fastapi import APIRouter
 from backend.services.file_reader import FileReader
 from backend.services.function_under_class import ClassFunctionFinder
 from backend.services.function_finder import FunctionFinder
+from backend.services.analysis_service import AnalysisService
 from backend.security.oauth2 import get_current_active_user
 from fastapi import Depends
 from ...services.uploaded_dir import get_user_upload_dir
@@ -17,12 +18,11 @@ router = APIRouter(
 
 
 # all functions
-@router.get("/get_functions/{filename}")
+@router.get("/get_functions/{filename:path}")
 async def function_finder(
     filename: str,
         current_user: UserInAlchemy = Depends(get_current_active_user),
 ):
-    uploaded_dir = get_user_upload_dir(current_user.username)
     """
     Get a list of all functions of a files.
 
@@ -32,17 +32,16 @@ async def function_finder(
     Returns:
         dict: A dictionary containing a list of all funtion names found in the file
     """
-    content = FileReader.read_file(filename, uploaded_dir)
-    functions = FunctionFinder.find_functions(content)
+    analysis = await AnalysisService().analyze_file_async(filename, current_user.username)
+    functions = FunctionFinder.find_functions(analysis)
     return {"functions": functions}
     
 # functions under class
-@router.get("/get_functions_under_classes/{filename}")
+@router.get("/get_functions_under_classes/{filename:path}")
 async def function_under_classes(
     filename: str,
         current_user: UserInAlchemy = Depends(get_current_active_user),
 ):
-    uploaded_dir = get_user_upload_dir(current_user.username)
     """
     Get a list of all functions under all classes of a files.
 
@@ -52,6 +51,6 @@ async def function_under_classes(
     Returns:
         dict: A dictionary containing a list of all funtion names under all classes found in the file
     """
-    content = FileReader.read_file(filename, uploaded_dir)
-    functions = ClassFunctionFinder.find_functions_by_class(content)
+    analysis = await AnalysisService().analyze_file_async(filename, current_user.username)
+    functions = ClassFunctionFinder.find_functions_by_class(analysis)
     return {"functions_under_classes": functions}
\ No newline at end of file
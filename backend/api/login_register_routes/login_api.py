@@ -8,7 +8,7 @@ from ...database.database import get_db
 from ...models.user import UserInDB
 from ...security.oauth2 import create_access_token
 from ...security.oauth2 import get_current_active_user
-from ...security.auth import authenticate_user
+from ...security.auth import authenticate_user_async
 from ...models.userInAlchemy import UserInAlchemy
 from ...services.crud_user import getUserByUsername
 
@@ -20,7 +20,7 @@ router = APIRouter(
 
 @router.post("/")
 async def login(username: str, password: str, db: Session = Depends(get_db)):
-    user = authenticate_user(username, password, db)
+    user = await authenticate_user_async(username, password, db)
     if not user:
         raise HTTPException(status_code=400, detail="Incorrect username or password")
     
@@ -10,6 +10,7 @@ from ...database.database import get_db
 from ...models.user import User
 from ...models.userInAlchemy import UserInAlchemy
 from ...services.crud_user import userCreator
+from ...security.password_hasher import password_hasher
 
 
 router = APIRouter(
@@ -30,7 +31,8 @@ async def create_user(payload: Annotated[FormData, Form()], db: Session = Depend
         raise HTTPException(status_code=400, detail="Passwords do not match")
 
     user = User(username=payload.username, email=payload.email, full_name="")
-    userCreator(user, payload.password, payload.email, db=db)
+    hashed_password = await password_hasher.hash_async(payload.password)
+    userCreator(user, payload.password, payload.email, db=db, hashed_password=hashed_password)
     return {"message": "User created successfully"}
 
 # @router.post("/")
@@ -11,7 +11,7 @@ from fastapi.responses import JSONResponse
 
 from ...models.token import Token
 from ...security.oauth2 import create_access_token
-from ...security.auth import authenticate_user
+from ...security.auth import authenticate_user_async
 from ...security.oauth2 import get_current_active_user
 from ...models.user import User
 from ...models.userInAlchemy import UserInAlchemy
@@ -39,7 +39,7 @@ async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: Annotated[Session, Depends(get_db)],
 ) -> Token:
-    user = authenticate_user(form_data.username, form_data.password, db)
+    user = await authenticate_user_async(form_data.username, form_data.password, db)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -8,10 +8,9 @@ from ...database.database import get_db
 from ...models.user import UserInDB
 from ...security.oauth2 import create_access_token
 from ...security.oauth2 import get_current_active_user
-from ...security.auth import authenticate_user
+from ...security.auth import authenticate_user_async
 from ...models.userInAlchemy import UserInAlchemy
 from ...models.user import User, UserInDB
-from ...services.crud_user import getUserByUsername
 from ...security.oauth2 import get_current_active_user
 from fastapi import Depends
 
@@ -32,7 +31,7 @@ async def get_user(current_user: UserInAlchemy = Depends(get_current_active_user
     
 @router.post("/get-user-by-username")
 async def getUser(username: str, password: str, db: Session = Depends(get_db)):
-    user = getUserByUsername(username, password, db=db)
+    user = await authenticate_user_async(username, password, db)
     if not user:
         return {"message": "Invalid username or password"}
     return user
@@ -8,15 +8,16 @@ related to authentication and coordinates with the AuthService.
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base_controller import BaseController
 from ..services.auth_service import AuthService
 from ..services.user_service import UserService
-from ..repositories.user_repository import UserRepository
+from ..repositories.user_repository import AsyncUserRepository
 from ..models.token import Token
 from ..models.userInAlchemy import UserInAlchemy
-from ..database.database import get_db
+from ..database.database import get_async_db
+from ..core.config import settings
 
 
 # OAuth2 scheme
@@ -24,9 +25,9 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
 # Dependency functions for current user
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> UserInAlchemy:
     """
     Dependency to get current authenticated user.
@@ -38,11 +39,11 @@ def get_current_user(
     Returns:
         Current authenticated user
     """
-    user_repository = UserRepository(db)
+    user_repository = AsyncUserRepository(db)
     user_service = UserService(user_repository)
     auth_service = AuthService(user_service)
     
-    return auth_service.get_current_user(token)
+    return await auth_service.get_current_user(token)
 
 
 def get_current_active_user(
@@ -68,6 +69,29 @@ def get_current_active_user(
     return current_user
 
 
+def get_current_admin_user(
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+) -> UserInAlchemy:
+    """
+    Dependency to get the current user if it is an administrator.
+    
+    Args:
+        current_user: Current active user
+        
+    Returns:
+        Current administrator
+        
+    Raises:
+        HTTPException: If the user is not listed in SECURITY_ADMIN_USERNAMES
+    """
+    if current_user.username not in settings.security.admin_usernames:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator privileges required"
+        )
+    return current_user
+
+
 # Router for authentication endpoints
 router = APIRouter(
     prefix="/auth",
@@ -78,7 +102,7 @@ router = APIRouter(
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Authenticate user and return access token.
@@ -91,11 +115,11 @@ async def login(
         Access token and token type
     """
     # Get service with dependencies
-    user_repository = UserRepository(db)
+    user_repository = AsyncUserRepository(db)
     user_service = UserService(user_repository)
     auth_service = AuthService(user_service)
     
-    return auth_service.login_user(
+    return await auth_service.login_user(
         username=form_data.username,
         password=form_data.password
     )
@@ -105,7 +129,7 @@ async def login(
 async def login_simple(
     username: str,
     password: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Simple login endpoint for backward compatibility.
@@ -119,11 +143,11 @@ async def login_simple(
         Access token and token type
     """
     # Get service with dependencies
-    user_repository = UserRepository(db)
+    user_repository = AsyncUserRepository(db)
     user_service = UserService(user_repository)
     auth_service = AuthService(user_service)
     
-    token = auth_service.login_user(username, password)
+    token = await auth_service.login_user(username, password)
     
     return {
         "access_token": token.access_token,
@@ -134,7 +158,7 @@ async def login_simple(
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
     current_user: UserInAlchemy = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Refresh access token for current user.
@@ -147,7 +171,7 @@ async def refresh_token(
         New access token
     """
     # Get service with dependencies
-    user_repository = UserRepository(db)
+    user_repository = AsyncUserRepository(db)
     user_service = UserService(user_repository)
     auth_service = AuthService(user_service)
     
@@ -157,7 +181,7 @@ async def refresh_token(
 @router.get("/verify")
 async def verify_token(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Verify if the provided token is valid.
@@ -170,7 +194,7 @@ async def verify_token(
         Token verification status
     """
     # Get service with dependencies
-    user_repository = UserRepository(db)
+    user_repository = AsyncUserRepository(db)
     user_service = UserService(user_repository)
     auth_service = AuthService(user_service)
     
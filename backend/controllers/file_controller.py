@@ -5,8 +5,8 @@ This module provides the FileController class that handles all HTTP requests
 related to file operations and coordinates with the FileService.
 """
 
-from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status
+from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, File, Query, UploadFile, HTTPException, status
 from sqlalchemy.orm import Session
 
 from .base_controller import BaseController
@@ -42,21 +42,25 @@ class FileController(BaseController[FileService]):
     def _setup_routes(self):
         """Set up the routes for this controller."""
         
-        @self.router.get("/", response_model=Dict[str, List[str]])
+        @self.router.get("/", response_model=Dict[str, Any])
         async def get_all_files(
+            limit: int = Query(100, ge=1, le=1000),
+            cursor: Optional[str] = None,
             current_user: UserInAlchemy = Depends(get_current_active_user)
         ):
             """
-            Get all files for the current user.
+            Get one page of the current user's files, including nested ones.
             
             Args:
+                limit: Maximum number of paths to return
+                cursor: next_cursor of the previous page
                 current_user: Current authenticated user
                 
             Returns:
-                Dictionary containing list of filenames
+                Relative file paths and the cursor of the next page
             """
             file_service = FileService()
-            return file_service.get_user_files(current_user.username)
+            return await file_service.get_user_files(current_user.username, limit, cursor)
         
         @self.router.post("/upload", response_model=Dict[str, Any])
         async def upload_files(
@@ -80,9 +84,9 @@ class FileController(BaseController[FileService]):
                 )
             
             file_service = FileService()
-            return file_service.upload_files(files, current_user.username)
+            return await file_service.upload_files(files, current_user.username)
         
-        @self.router.get("/{filename}", response_model=Dict[str, Any])
+        @self.router.get("/{filename:path}", response_model=Dict[str, Any])
         async def get_file_content(
             filename: str,
             current_user: UserInAlchemy = Depends(get_current_active_user)
@@ -91,16 +95,16 @@ class FileController(BaseController[FileService]):
             Get the content of a specific file.
             
             Args:
-                filename: Name of the file to retrieve
+                filename: Relative path of the file to retrieve
                 current_user: Current authenticated user
                 
             Returns:
                 File content and metadata
             """
             file_service = FileService()
-            return file_service.get_file_content(filename, current_user.username)
+            return await file_service.get_file_content(filename, current_user.username)
         
-        @self.router.delete("/{filename}", response_model=Dict[str, str])
+        @self.router.delete("/{filename:path}", response_model=Dict[str, str])
         async def delete_file(
             filename: str,
             current_user: UserInAlchemy = Depends(get_current_active_user)
@@ -109,14 +113,14 @@ class FileController(BaseController[FileService]):
             Delete a specific file.
             
             Args:
-                filename: Name of the file to delete
+                filename: Relative path of the file to delete
                 current_user: Current authenticated user
                 
             Returns:
                 Deletion success message
             """
             file_service = FileService()
-            return file_service.delete_file(filename, current_user.username)
+            return await file_service.delete_file(filename, current_user.username)
         
         @self.router.post("/validate", response_model=Dict[str, bool])
         async def validate_file(filename: str):
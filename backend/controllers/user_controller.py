@@ -7,14 +7,14 @@ related to user operations and coordinates with the UserService.
 
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from .base_controller import BaseController
 from ..services.user_service import UserService
-from ..repositories.user_repository import UserRepository
+from ..repositories.user_repository import AsyncUserRepository
 from ..models.user import User
 from ..models.userInAlchemy import UserInAlchemy
-from ..database.database import get_db
+from ..database.database import get_async_db
 
 
 class UserController(BaseController[UserService]):
@@ -48,7 +48,7 @@ class UserController(BaseController[UserService]):
             password: str,
             email: str,
             full_name: str = None,
-            db: Session = Depends(get_db)
+            db: AsyncSession = Depends(get_async_db)
         ):
             """
             Register a new user.
@@ -71,10 +71,10 @@ class UserController(BaseController[UserService]):
             )
             
             # Get service with repository
-            user_repository = UserRepository(db)
+            user_repository = AsyncUserRepository(db)
             user_service = UserService(user_repository)
             
-            created_user = user_service.register_user(user_data, password, email)
+            created_user = await user_service.register_user(user_data, password, email)
             
             return {
                 "message": "User registered successfully",
@@ -107,7 +107,7 @@ class UserController(BaseController[UserService]):
             full_name: str = None,
             email: str = None,
             current_user: UserInAlchemy = Depends(self._get_current_user_dependency),
-            db: Session = Depends(get_db)
+            db: AsyncSession = Depends(get_async_db)
         ):
             """
             Update current user information.
@@ -141,10 +141,10 @@ class UserController(BaseController[UserService]):
             )
             
             # Get service with repository
-            user_repository = UserRepository(db)
+            user_repository = AsyncUserRepository(db)
             user_service = UserService(user_repository)
             
-            updated_user = user_service.update_user(current_user.username, user_data)
+            updated_user = await user_service.update_user(current_user.username, user_data)
             
             return User(
                 username=updated_user.username,
@@ -162,7 +162,7 @@ class UserController(BaseController[UserService]):
         pass
 
 
-def get_user_controller(db: Session = Depends(get_db)) -> UserController:
+def get_user_controller(db: AsyncSession = Depends(get_async_db)) -> UserController:
     """
     Dependency to get user controller with injected dependencies.
     
@@ -172,6 +172,6 @@ def get_user_controller(db: Session = Depends(get_db)) -> UserController:
     Returns:
         UserController instance
     """
-    user_repository = UserRepository(db)
+    user_repository = AsyncUserRepository(db)
     user_service = UserService(user_repository)
     return UserController(user_service)
\ No newline at end of file
@@ -7,7 +7,12 @@ including database settings, security settings, and environment-specific configu
 
 import os
 from typing import List, Optional
-from pydantic import BaseSettings, Field
+from pydantic import Field
+
+try:
+    from pydantic_settings import BaseSettings
+except ImportError:  # pydantic < 2
+    from pydantic import BaseSettings
 
 
 class DatabaseSettings(BaseSettings):
@@ -23,13 +28,64 @@ class DatabaseSettings(BaseSettings):
         env="DATABASE_ECHO",
         description="Enable SQLAlchemy query logging"
     )
+    async_url: Optional[str] = Field(
+        default=None,
+        env="DATABASE_ASYNC_URL",
+        description="Async driver URL; derived from url (aiosqlite/asyncpg) when unset"
+    )
     connect_args: dict = Field(
-        default_factory=lambda: {"check_same_thread": False},
+        default_factory=dict,
         description="Additional database connection arguments"
     )
+    pool_size: int = Field(
+        default=5,
+        env="DATABASE_POOL_SIZE",
+        description="Connections kept open in the pool"
+    )
+    max_overflow: int = Field(
+        default=10,
+        env="DATABASE_MAX_OVERFLOW",
+        description="Connections opened beyond pool_size under load"
+    )
+    pool_timeout: float = Field(
+        default=30.0,
+        env="DATABASE_POOL_TIMEOUT",
+        description="Seconds to wait for a pooled connection"
+    )
+    pool_recycle: int = Field(
+        default=1800,
+        env="DATABASE_POOL_RECYCLE",
+        description="Seconds after which pooled connections are replaced (-1 disables)"
+    )
+    pool_pre_ping: bool = Field(
+        default=True,
+        env="DATABASE_POOL_PRE_PING",
+        description="Test pooled connections before use"
+    )
+    sqlite_wal: bool = Field(
+        default=True,
+        env="DATABASE_SQLITE_WAL",
+        description="Use write-ahead logging for file-based SQLite databases"
+    )
+    sqlite_synchronous: str = Field(
+        default="NORMAL",
+        env="DATABASE_SQLITE_SYNCHRONOUS",
+        description="SQLite synchronous pragma"
+    )
+    sqlite_cache_size_kib: int = Field(
+        default=64 * 1024,  # 64MB
+        env="DATABASE_SQLITE_CACHE_SIZE_KIB",
+        description="SQLite page cache per connection in KiB"
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000,
+        env="DATABASE_SQLITE_BUSY_TIMEOUT_MS",
+        description="Milliseconds SQLite waits for a lock before failing"
+    )
 
     class Config:
         env_file = ".env"
+        extra = "ignore"
         env_prefix = "DATABASE_"
 
 
@@ -51,9 +107,55 @@ class SecuritySettings(BaseSettings):
         env="ACCESS_TOKEN_EXPIRE_MINUTES",
         description="Access token expiration time in minutes"
     )
+    user_cache_ttl_seconds: float = Field(
+        default=60.0,
+        env="USER_CACHE_TTL_SECONDS",
+        description="How long an authenticated user is served from memory (0 disables the cache)"
+    )
+    user_cache_max_size: int = Field(
+        default=10000,
+        env="USER_CACHE_MAX_SIZE",
+        description="Maximum number of users kept in the authentication cache"
+    )
+    admin_usernames: List[str] = Field(
+        default=[],
+        env="ADMIN_USERNAMES",
+        description="Users allowed to list and provision accounts"
+    )
+    bcrypt_rounds: int = Field(
+        default=12,
+        env="BCRYPT_ROUNDS",
+        description="bcrypt cost factor; hashes with another cost are upgraded on login"
+    )
+    password_workers: int = Field(
+        default=2,
+        env="PASSWORD_WORKERS",
+        description="Threads that hash and verify passwords"
+    )
+    password_max_pending: int = Field(
+        default=32,
+        env="PASSWORD_MAX_PENDING",
+        description="Password operations allowed to wait for a thread before requests get 503"
+    )
+    password_retry_after_seconds: int = Field(
+        default=1,
+        env="PASSWORD_RETRY_AFTER_SECONDS",
+        description="Retry-After sent with 503 responses when password hashing is saturated"
+    )
+    password_bulk_workers: int = Field(
+        default=os.cpu_count() or 4,
+        env="PASSWORD_BULK_WORKERS",
+        description="Threads hashing passwords for bulk registration (kept apart from logins)"
+    )
+    bulk_register_max_rows: int = Field(
+        default=5000,
+        env="BULK_REGISTER_MAX_ROWS",
+        description="Maximum accounts per bulk registration request"
+    )
     
     class Config:
         env_file = ".env"
+        extra = "ignore"
         env_prefix = "SECURITY_"
 
 
@@ -83,6 +185,7 @@ class CORSSettings(BaseSettings):
 
     class Config:
         env_file = ".env"
+        extra = "ignore"
         env_prefix = "CORS_"
 
 
@@ -99,6 +202,26 @@ class FileSettings(BaseSettings):
         env="MAX_FILE_SIZE",
         description="Maximum file size in bytes"
     )
+    upload_chunk_size: int = Field(
+        default=1024 * 1024,  # 1MB
+        env="UPLOAD_CHUNK_SIZE",
+        description="Bytes read from an upload per write when streaming it to disk"
+    )
+    io_workers: int = Field(
+        default=8,
+        env="IO_WORKERS",
+        description="Threads that run blocking file-system calls for async handlers"
+    )
+    archive_max_members: int = Field(
+        default=10000,
+        env="ARCHIVE_MAX_MEMBERS",
+        description="Maximum number of entries in an uploaded archive"
+    )
+    archive_max_total_size: int = Field(
+        default=200 * 1024 * 1024,  # 200MB
+        env="ARCHIVE_MAX_TOTAL_SIZE",
+        description="Maximum total size in bytes of the files extracted from an archive"
+    )
     allowed_extensions: List[str] = Field(
         default=[".py"],
         env="ALLOWED_EXTENSIONS",
@@ -107,9 +230,130 @@ class FileSettings(BaseSettings):
 
     class Config:
         env_file = ".env"
+        extra = "ignore"
         env_prefix = "FILE_"
 
 
+class AnalysisSettings(BaseSettings):
+    """Code analysis configuration settings."""
+    
+    cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,  # 64MB
+        env="ANALYSIS_CACHE_MAX_BYTES",
+        description="Memory budget for cached analysis results in bytes"
+    )
+    max_workers: int = Field(
+        default=0,
+        env="ANALYSIS_MAX_WORKERS",
+        description="Worker processes for analysis (0 = number of CPUs)"
+    )
+    worker_start_method: str = Field(
+        default="spawn",
+        env="ANALYSIS_WORKER_START_METHOD",
+        description="multiprocessing start method for analysis workers"
+    )
+    project_chunk_size: int = Field(
+        default=16,
+        env="ANALYSIS_PROJECT_CHUNK_SIZE",
+        description="Files sent to a worker process per task in project analysis"
+    )
+    timeout_seconds: float = Field(
+        default=30.0,
+        env="ANALYSIS_TIMEOUT_SECONDS",
+        description="Wall-clock budget of one analysis task (0 = unlimited)"
+    )
+    cpu_limit_seconds: float = Field(
+        default=20.0,
+        env="ANALYSIS_CPU_LIMIT_SECONDS",
+        description="CPU budget of one analysis task, enforced with RLIMIT_CPU (0 = unlimited)"
+    )
+    memory_limit_mb: int = Field(
+        default=1024,
+        env="ANALYSIS_MEMORY_LIMIT_MB",
+        description="Address space of an analysis worker process, enforced with RLIMIT_AS (0 = unlimited)"
+    )
+    kill_grace_seconds: float = Field(
+        default=5.0,
+        env="ANALYSIS_KILL_GRACE_SECONDS",
+        description="Time past the timeout before a stuck worker pool is killed and restarted"
+    )
+    max_concurrency: int = Field(
+        default=0,
+        env="ANALYSIS_MAX_CONCURRENCY",
+        description="Analyses a process runs at once for requests (0 = number of workers)"
+    )
+    max_queue: int = Field(
+        default=64,
+        env="ANALYSIS_MAX_QUEUE",
+        description="Analyses allowed to wait for a slot before requests get 503"
+    )
+    retry_after_seconds: int = Field(
+        default=2,
+        env="ANALYSIS_RETRY_AFTER_SECONDS",
+        description="Retry-After sent with 503 responses when analysis is saturated"
+    )
+    disk_cache_path: str = Field(
+        default="cache/analysis.db",
+        env="ANALYSIS_DISK_CACHE_PATH",
+        description="SQLite file of the persistent analysis cache shared by workers (empty = disabled)"
+    )
+    disk_cache_max_bytes: int = Field(
+        default=512 * 1024 * 1024,  # 512MB
+        env="ANALYSIS_DISK_CACHE_MAX_BYTES",
+        description="Size cap of the persistent analysis cache in compressed bytes"
+    )
+    disk_cache_warm_start: bool = Field(
+        default=True,
+        env="ANALYSIS_DISK_CACHE_WARM_START",
+        description="Load recently used analyses from disk into memory at startup"
+    )
+    prewarm_max_files: int = Field(
+        default=50,
+        env="ANALYSIS_PREWARM_MAX_FILES",
+        description="Files of one upload analysed in the background ahead of the first view"
+    )
+    workspace_max_users: int = Field(
+        default=32,
+        env="ANALYSIS_WORKSPACE_MAX_USERS",
+        description="Users whose project workspace (analyses and symbol index) is kept in memory"
+    )
+    workspace_refresh_seconds: float = Field(
+        default=2.0,
+        env="ANALYSIS_WORKSPACE_REFRESH_SECONDS",
+        description="How often a workspace rescans the upload directory for changes made by other workers"
+    )
+
+    class Config:
+        env_file = ".env"
+        extra = "ignore"
+        env_prefix = "ANALYSIS_"
+
+
+class JobSettings(BaseSettings):
+    """Background job configuration settings."""
+    
+    max_workers: int = Field(
+        default=2,
+        env="JOBS_MAX_WORKERS",
+        description="Jobs executed concurrently by the in-process worker pool"
+    )
+    stale_after_seconds: int = Field(
+        default=300,
+        env="JOBS_STALE_AFTER_SECONDS",
+        description="Running jobs without updates for this long are re-queued on startup"
+    )
+    progress_interval_seconds: float = Field(
+        default=1.0,
+        env="JOBS_PROGRESS_INTERVAL_SECONDS",
+        description="Minimum interval between persisted progress updates"
+    )
+
+    class Config:
+        env_file = ".env"
+        extra = "ignore"
+        env_prefix = "JOBS_"
+
+
 class AppSettings(BaseSettings):
     """Main application configuration settings."""
     
@@ -141,6 +385,7 @@ class AppSettings(BaseSettings):
 
     class Config:
         env_file = ".env"
+        extra = "ignore"
 
 
 class Settings:
@@ -158,6 +403,8 @@ class Settings:
         self.security = SecuritySettings()
         self.cors = CORSSettings()
         self.file = FileSettings()
+        self.analysis = AnalysisSettings()
+        self.jobs = JobSettings()
     
     @property
     def is_development(self) -> bool:
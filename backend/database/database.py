@@ -1,10 +1,100 @@
-from sqlalchemy import create_engine
+"""
+Database engines and session factories.
+
+The engines are built from DatabaseSettings, so the same code runs against
+a local SQLite file or a shared PostgreSQL server used by several Uvicorn
+workers. Pooling is configured for server databases; file-based SQLite
+connections get pragmas for concurrent readers and writers.
+
+get_db yields a synchronous Session for scripts, tests and worker threads.
+get_async_db yields an AsyncSession for async endpoints; its engine uses an
+async driver (aiosqlite or asyncpg) and is only created on first use.
+"""
+
+import threading
+from typing import Any, AsyncIterator, Dict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///User.db"
+from ..core.config import DatabaseSettings, settings
+
+
+def _is_memory_sqlite(url) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def engine_options(database: DatabaseSettings) -> Dict[str, Any]:
+    """
+    Build create_engine keyword arguments from the database settings.
+
+    Args:
+        database: Database configuration
+
+    Returns:
+        Keyword arguments for sqlalchemy.create_engine
+    """
+    url = make_url(database.url)
+    connect_args = dict(database.connect_args)
+    options: Dict[str, Any] = {
+        "echo": database.echo,
+        "pool_pre_ping": database.pool_pre_ping,
+    }
+
+    if url.get_backend_name() == "sqlite":
+        # Sessions are used from worker threads (jobs, file I/O pool)
+        connect_args.setdefault("check_same_thread", False)
+        connect_args.setdefault("timeout", database.sqlite_busy_timeout_ms / 1000)
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+    if not _is_memory_sqlite(url):
+        options.update(
+            pool_size=database.pool_size,
+            max_overflow=database.max_overflow,
+            pool_timeout=database.pool_timeout,
+            pool_recycle=database.pool_recycle,
+        )
+
+    options["connect_args"] = connect_args
+    return options
+
+
+def create_database_engine(database: DatabaseSettings = settings.database) -> Engine:
+    """
+    Create the SQLAlchemy engine described by the database settings.
+
+    Args:
+        database: Database configuration
+
+    Returns:
+        Configured engine
+    """
+    engine = create_engine(database.url, **engine_options(database))
+    if engine.dialect.name == "sqlite":
+        _install_sqlite_pragmas(engine, database)
+    return engine
+
+
+def _install_sqlite_pragmas(engine: Engine, database: DatabaseSettings) -> None:
+    """Apply performance pragmas to every new SQLite connection."""
+    use_wal = database.sqlite_wal and not _is_memory_sqlite(engine.url)
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            if use_wal:
+                # Readers no longer block the writer and vice versa
+                cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute(f"PRAGMA synchronous={database.sqlite_synchronous}")
+            cursor.execute(f"PRAGMA cache_size=-{int(database.sqlite_cache_size_kib)}")
+            cursor.execute(f"PRAGMA busy_timeout={int(database.sqlite_busy_timeout_ms)}")
+        finally:
+            cursor.close()
+
+
+engine = create_database_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -15,4 +105,98 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Async driver used for each sync driver's backend
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def async_database_url(database: DatabaseSettings) -> str:
+    """
+    Get the async driver URL for the configured database.
+
+    Args:
+        database: Database configuration
+
+    Returns:
+        database.async_url, or url with its driver swapped for the async one
+
+    Raises:
+        ValueError: If no async driver is known for the backend
+    """
+    if database.async_url:
+        return database.async_url
+    url = make_url(database.url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}'; set DATABASE_ASYNC_URL")
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(
+        hide_password=False
+    )
+
+
+def create_async_database_engine(database: DatabaseSettings = settings.database):
+    """
+    Create the async SQLAlchemy engine described by the database settings.
+
+    Args:
+        database: Database configuration
+
+    Returns:
+        Configured AsyncEngine
+    """
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    options = engine_options(database)
+    url = make_url(async_database_url(database))
+    if url.get_backend_name() == "sqlite":
+        # aiosqlite runs each connection on its own thread already
+        options["connect_args"].pop("check_same_thread", None)
+    engine = create_async_engine(url, **options)
+    if engine.dialect.name == "sqlite":
+        _install_sqlite_pragmas(engine.sync_engine, database)
+    return engine
+
+
+_async_engine = None
+_async_session_factory = None
+_async_lock = threading.Lock()
+
+
+def get_async_session_factory():
+    """
+    Get the process-wide AsyncSession factory, creating the engine on first use.
+
+    Returns:
+        async_sessionmaker bound to the async engine
+    """
+    global _async_engine, _async_session_factory
+    with _async_lock:
+        if _async_session_factory is None:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
+            _async_engine = create_async_database_engine()
+            # Loaded attributes stay usable after commit without lazy IO
+            _async_session_factory = async_sessionmaker(
+                _async_engine, autoflush=False, expire_on_commit=False
+            )
+        return _async_session_factory
+
+
+async def get_async_db() -> AsyncIterator[Any]:
+    """FastAPI dependency yielding an AsyncSession."""
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close the async engine's pooled connections if it was created."""
+    global _async_engine, _async_session_factory
+    with _async_lock:
+        engine, _async_engine, _async_session_factory = _async_engine, None, None
+    if engine is not None:
+        await engine.dispose()
@@ -5,13 +5,25 @@ This module sets up the FastAPI application using dependency injection,
 repository pattern, and service-oriented architecture following SOLID principles.
 """
 
+import asyncio
+
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 
-from .routers import user_router, file_router
+from .routers import user_router, file_router, analysis_router, job_router, symbol_router
 from .controllers.auth_controller import router as auth_router
-from .database.database import Base as UserBase, engine as UserEngine, get_db
+from .core.config import settings
+from .database.database import Base as UserBase, engine as UserEngine, get_db, dispose_async_engine
+from .services.analysis_cache import analysis_cache
+from .services.single_flight import analysis_flights
+from .services.analysis_scheduler import analysis_scheduler
+from .services.analysis_executor import analysis_executor
+from .services.file_io import file_io
+from .services.job_runner import job_runner
+from .services.project_workspace import project_workspaces
+from .security.password_hasher import password_hasher
+from .security.user_cache import user_cache
 
 # Legacy route imports (to be refactored later)
 from .api.comments_finder_routes.comment_finder_api import router as comment_routers
@@ -56,6 +68,30 @@ def create_application() -> FastAPI:
     # Include legacy routers (to be refactored)
     include_legacy_routers(app)
 
+    @app.on_event("startup")
+    def recover_jobs():
+        """Re-queue background jobs left unfinished by a previous worker."""
+        job_runner.recover()
+
+    @app.on_event("startup")
+    def warm_analysis_cache():
+        """Load recently used analyses from the persistent cache in the background."""
+        if settings.analysis.disk_cache_warm_start:
+            file_io.executor.submit(analysis_cache.warm_start)
+
+    @app.on_event("shutdown")
+    def shutdown_workers():
+        """Stop job threads, analysis worker processes and I/O and password threads."""
+        job_runner.shutdown(wait=False)
+        analysis_executor.shutdown(wait=False)
+        file_io.shutdown(wait=False)
+        password_hasher.shutdown(wait=False)
+
+    @app.on_event("shutdown")
+    async def close_async_engine():
+        """Close the pooled connections of the async database engine."""
+        await dispose_async_engine()
+
     # Add root endpoint
     @app.get("/", tags=["root"])
     async def root():
@@ -95,6 +131,30 @@ def create_application() -> FastAPI:
             "database": db_status,
             "version": "2.0.0"
         }
+    
+    @app.get("/metrics", tags=["health"])
+    async def metrics():
+        """
+        Runtime counters for in-process caches.
+        
+        Returns:
+            Cache statistics
+        """
+        # The persistent cache tier queries SQLite and the workspaces take
+        # thread locks, so both are read on the file I/O threads
+        cache_stats, workspace_stats = await asyncio.gather(
+            file_io.run(analysis_cache.stats),
+            file_io.run(project_workspaces.stats),
+        )
+        return {
+            "analysis_cache": cache_stats,
+            "analysis_flights": analysis_flights.stats(),
+            "analysis_scheduler": analysis_scheduler.stats(),
+            "analysis_executor": analysis_executor.stats(),
+            "project_workspaces": workspace_stats,
+            "user_cache": user_cache.stats(),
+            "password_hasher": password_hasher.stats()
+        }
 
     return app
 
@@ -114,6 +174,15 @@ def include_routers(app: FastAPI) -> None:
     
     # File management routes
     app.include_router(file_router.router)
+    
+    # Project analysis routes
+    app.include_router(analysis_router.router)
+    
+    # Background job routes
+    app.include_router(job_router.router)
+    
+    # Cross-file symbol search routes
+    app.include_router(symbol_router.router)
 
 
 def include_legacy_routers(app: FastAPI) -> None:
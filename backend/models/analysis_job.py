@@ -0,0 +1,119 @@
+"""
+SQLAlchemy analysis job model for database operations.
+
+This module contains the SQLAlchemy model that persists background analysis
+jobs, so that their status and results survive a worker restart.
+"""
+
+from sqlalchemy import Column, String, Integer, Float, Text, JSON, DateTime, func
+from ..database.database import Base as UserBase
+
+
+class JobStatus:
+    """Allowed values of AnalysisJob.status."""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    UNFINISHED = (PENDING, RUNNING)
+
+
+class AnalysisJob(UserBase):
+    """
+    SQLAlchemy model for background analysis jobs.
+
+    This model represents the analysis_jobs table that tracks submitted
+    jobs, their progress and their results.
+    """
+    __tablename__ = "analysis_jobs"
+
+    id = Column(
+        String(36),
+        primary_key=True,
+        index=True,
+        doc="Job identifier (UUID4)"
+    )
+    username = Column(
+        String(50),
+        index=True,
+        nullable=False,
+        doc="Owner of the job"
+    )
+    kind = Column(
+        String(50),
+        nullable=False,
+        doc="Job type, e.g. project_analysis"
+    )
+    params = Column(
+        JSON,
+        nullable=True,
+        doc="Job parameters"
+    )
+    status = Column(
+        String(20),
+        default=JobStatus.PENDING,
+        index=True,
+        nullable=False,
+        doc="pending, running, succeeded or failed"
+    )
+    completed = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        doc="Work units completed"
+    )
+    total = Column(
+        Integer,
+        default=0,
+        nullable=False,
+        doc="Total work units"
+    )
+    progress = Column(
+        Float,
+        default=0.0,
+        nullable=False,
+        doc="Completion ratio between 0 and 1"
+    )
+    result = Column(
+        JSON,
+        nullable=True,
+        doc="Job result once succeeded"
+    )
+    error = Column(
+        Text,
+        nullable=True,
+        doc="Error message once failed"
+    )
+    worker_id = Column(
+        String(255),
+        nullable=True,
+        doc="Worker process that claimed the job"
+    )
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        doc="Timestamp when the job was submitted"
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        doc="Timestamp of the last status or progress update"
+    )
+    started_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp when the job started running"
+    )
+    finished_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        doc="Timestamp when the job succeeded or failed"
+    )
+
+    def __repr__(self):
+        """String representation of the job."""
+        return f"<AnalysisJob(id='{self.id}', kind='{self.kind}', status='{self.status}')>"
@@ -45,4 +45,16 @@ class UserInDB(User):
 
     class Config:
         """Pydantic configuration."""
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class UserRegistration(BaseModel):
+    """
+    One account of a bulk registration request.
+    
+    Rows come from a JSON list or a CSV file with the same column names.
+    """
+    username: str = Field(..., min_length=3, max_length=50, description="Unique username")
+    password: str = Field(..., min_length=1, description="Plain text password")
+    email: EmailStr = Field(..., description="User email address")
+    full_name: Optional[str] = Field(None, max_length=100, description="User's full name")
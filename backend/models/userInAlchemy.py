@@ -5,6 +5,8 @@ This module contains the SQLAlchemy model for user data persistence.
 This model is separate from Pydantic models to follow clean architecture.
 """
 
+from datetime import datetime, timezone
+
 from sqlalchemy import Column, String, Boolean, DateTime, func
 from ..database.database import Base as UserBase
 
@@ -50,6 +52,9 @@ class UserInAlchemy(UserBase):
     )
     created_at = Column(
         DateTime(timezone=True),
+        # Set by the application as well, so every row stores the same
+        # precision and keyset pages ordered by created_at compare exactly
+        default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
         nullable=False,
         doc="Timestamp when user was created"
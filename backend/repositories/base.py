@@ -5,8 +5,15 @@ This module provides abstract base classes for implementing the Repository patte
 which separates data access logic from business logic.
 """
 
+import base64
+import binascii
+import json
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, List, Any
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, TypeVar, Optional, List, Any, Dict, Iterator, Sequence, Union
+from sqlalchemy import delete, insert, inspect as sa_inspect, literal, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 # Generic type for model entities
@@ -14,6 +21,75 @@ ModelType = TypeVar('ModelType')
 CreateSchemaType = TypeVar('CreateSchemaType')
 UpdateSchemaType = TypeVar('UpdateSchemaType')
 
+# Rows per INSERT/UPDATE/DELETE statement in the bulk operations
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass
+class Page(Generic[ModelType]):
+    """
+    One page of a keyset-paginated listing.
+    
+    next_cursor is None on the last page.
+    """
+    items: List[ModelType]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(order_by: Optional[str], values: Sequence[Any]) -> str:
+    """
+    Encode the sort key of the last row of a page as an opaque cursor.
+    
+    Args:
+        order_by: Sort column the page was listed by (None for the primary key)
+        values: Sort key values of the last row
+        
+    Returns:
+        URL-safe cursor string
+    """
+    encoded = [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    payload = json.dumps({"o": order_by, "k": encoded}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, order_by: Optional[str], size: int) -> List[Any]:
+    """
+    Decode a cursor created by encode_cursor.
+    
+    Args:
+        cursor: Cursor string
+        order_by: Sort column of the current listing
+        size: Number of sort key values expected
+        
+    Returns:
+        Sort key values of the row the previous page ended with
+        
+    Raises:
+        ValueError: If the cursor is malformed or was made for another ordering
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        values = payload["k"]
+        cursor_order_by = payload["o"]
+    except (binascii.Error, ValueError, UnicodeError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if cursor_order_by != order_by or not isinstance(values, list) or len(values) != size:
+        raise ValueError("Cursor does not match the requested ordering")
+    return [
+        datetime.fromisoformat(value["dt"]) if isinstance(value, dict) else value
+        for value in values
+    ]
+
+
+def iter_batches(items: Sequence[Any], batch_size: int) -> Iterator[Sequence[Any]]:
+    """Yield consecutive slices of at most batch_size items."""
+    batch_size = max(1, batch_size)
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
 
 class BaseRepository(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """
@@ -58,6 +134,69 @@ class BaseRepository(ABC, Generic[ModelType, CreateSchemaType, UpdateSchemaType]
     def delete(self, id: Any) -> ModelType:
         """Delete a record by ID."""
         pass
+    
+    def _primary_key_names(self) -> List[str]:
+        """Attribute names of the model's primary key columns."""
+        mapper = sa_inspect(self.model)
+        return [mapper.get_property_by_column(column).key for column in mapper.primary_key]
+    
+    def _sort_key_names(self, order_by: Optional[str]) -> List[str]:
+        """
+        Attribute names a keyset page is ordered by.
+        
+        The primary key is appended to order_by as a tie-breaker, so the
+        sort key is unique and no row is skipped or repeated between pages.
+        
+        Raises:
+            ValueError: If order_by is not a column of the model
+        """
+        primary_key = self._primary_key_names()
+        if order_by is None:
+            return primary_key
+        if order_by not in sa_inspect(self.model).column_attrs:
+            raise ValueError(f"Cannot order {self.model.__name__} by '{order_by}'")
+        return [order_by] + [name for name in primary_key if name != order_by]
+    
+    def _page_statement(self, limit: int, cursor: Optional[str], order_by: Optional[str]):
+        """Build the SELECT for one keyset page, fetching one extra row."""
+        names = self._sort_key_names(order_by)
+        columns = [getattr(self.model, name) for name in names]
+        statement = select(self.model).order_by(*columns).limit(limit + 1)
+        if cursor:
+            values = decode_cursor(cursor, order_by, len(names))
+            # Seek past the previous page instead of counting rows with OFFSET
+            statement = statement.where(
+                tuple_(*columns) > tuple_(*[
+                    literal(value, type_=column.type) for column, value in zip(columns, values)
+                ])
+            )
+        return statement
+    
+    def _make_page(self, rows: List[ModelType], limit: int, order_by: Optional[str]) -> Page[ModelType]:
+        """Turn the rows of _page_statement into a page and its next cursor."""
+        if len(rows) <= limit:
+            return Page(items=rows, next_cursor=None)
+        items = rows[:limit]
+        last = items[-1]
+        values = [getattr(last, name) for name in self._sort_key_names(order_by)]
+        return Page(items=items, next_cursor=encode_cursor(order_by, values))
+    
+    def _delete_statement(self, ids: Sequence[Any]):
+        """Build a DELETE for the rows with the given primary keys."""
+        names = self._primary_key_names()
+        if len(names) == 1:
+            return delete(self.model).where(getattr(self.model, names[0]).in_(ids))
+        columns = [getattr(self.model, name) for name in names]
+        return delete(self.model).where(tuple_(*columns).in_([tuple(id) for id in ids]))
+    
+    @staticmethod
+    def _to_dict(obj_in: Union[Dict[str, Any], Any], exclude_unset: bool = False) -> Dict[str, Any]:
+        """Convert a Pydantic schema (v1 or v2) or a dict to column values."""
+        if isinstance(obj_in, dict):
+            return dict(obj_in)
+        if hasattr(obj_in, 'model_dump'):
+            return obj_in.model_dump(exclude_unset=exclude_unset)
+        return obj_in.dict(exclude_unset=exclude_unset)
 
 
 class CRUDRepository(BaseRepository[ModelType, CreateSchemaType, UpdateSchemaType]):
@@ -114,6 +253,33 @@ class CRUDRepository(BaseRepository[ModelType, CreateSchemaType, UpdateSchemaTyp
         """
         return self.db.query(self.model).offset(skip).limit(limit).all()
     
+    def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None
+    ) -> Page[ModelType]:
+        """
+        Get one page of records using keyset pagination.
+        
+        Unlike get_multi, the cost of a page does not grow with its
+        position: the query seeks to the cursor through the index.
+        
+        Args:
+            limit: Maximum number of records to return
+            cursor: next_cursor of the previous page, or None for the first page
+            order_by: Non-null column to sort by (e.g. "created_at"); the
+                primary key is used when None
+            
+        Returns:
+            Page of records and the cursor of the next page
+            
+        Raises:
+            ValueError: If order_by or the cursor is invalid
+        """
+        rows = self.db.execute(self._page_statement(limit, cursor, order_by)).scalars().all()
+        return self._make_page(list(rows), limit, order_by)
+    
     def update(self, db_obj: ModelType, obj_in: UpdateSchemaType) -> ModelType:
         """
         Update an existing record.
@@ -157,4 +323,284 @@ class CRUDRepository(BaseRepository[ModelType, CreateSchemaType, UpdateSchemaTyp
             
         self.db.delete(obj)
         self.db.commit()
-        return obj
\ No newline at end of file
+        return obj
+    
+    def bulk_create(
+        self,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """
+        Insert many records in one transaction.
+        
+        Rows are sent as executemany batches and committed once; created
+        instances are not loaded back. Every row must have the same keys.
+        
+        Args:
+            objs_in: Pydantic schemas or dicts with data to create
+            batch_size: Rows per INSERT statement
+            
+        Returns:
+            Number of records created
+        """
+        rows = [self._to_dict(obj_in) for obj_in in objs_in]
+        try:
+            for batch in iter_batches(rows, batch_size):
+                self.db.execute(insert(self.model.__table__), batch)
+            self.db.commit()
+        except BaseException:
+            self.db.rollback()
+            raise
+        return len(rows)
+    
+    def bulk_update(
+        self,
+        updates: Sequence[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """
+        Update many records by primary key in one transaction.
+        
+        Args:
+            updates: Dicts holding the primary key and the columns to change
+            batch_size: Rows per UPDATE statement
+            
+        Returns:
+            Number of records updated
+        """
+        rows = [dict(row) for row in updates]
+        try:
+            for batch in iter_batches(rows, batch_size):
+                self.db.execute(update(self.model), batch)
+            self.db.commit()
+        except BaseException:
+            self.db.rollback()
+            raise
+        return len(rows)
+    
+    def bulk_delete(self, ids: Sequence[Any], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Delete many records by primary key in one transaction.
+        
+        Args:
+            ids: Primary key values (tuples for composite keys)
+            batch_size: Keys per DELETE statement
+            
+        Returns:
+            Number of records deleted
+        """
+        deleted = 0
+        try:
+            for batch in iter_batches(list(ids), batch_size):
+                deleted += self.db.execute(self._delete_statement(batch)).rowcount
+            self.db.commit()
+        except BaseException:
+            self.db.rollback()
+            raise
+        return deleted
+
+class AsyncCRUDRepository(BaseRepository[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    CRUDRepository counterpart for AsyncSession.
+    
+    The methods mirror CRUDRepository but are coroutines, so async
+    endpoints can await database work instead of blocking the event loop.
+    """
+    
+    def __init__(self, model: type[ModelType], db: AsyncSession):
+        """
+        Initialize the repository with a model and async database session.
+        
+        Args:
+            model: The SQLAlchemy model class
+            db: Async database session
+        """
+        super().__init__(model, db)
+    
+    async def create(self, obj_in: CreateSchemaType) -> ModelType:
+        """
+        Create a new record in the database.
+        
+        Args:
+            obj_in: Pydantic schema with data to create
+            
+        Returns:
+            Created database model instance
+        """
+        if hasattr(obj_in, 'model_dump'):
+            obj_data = obj_in.model_dump()
+        else:
+            obj_data = obj_in.dict()
+            
+        db_obj = self.model(**obj_data)
+        self.db.add(db_obj)
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+    
+    async def get(self, id: Any) -> Optional[ModelType]:
+        """
+        Get a record by its primary key.
+        
+        Args:
+            id: Primary key value
+            
+        Returns:
+            Database model instance or None if not found
+        """
+        result = await self.db.execute(select(self.model).where(self.model.id == id))
+        return result.scalars().first()
+    
+    async def get_multi(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
+        """
+        Get multiple records with pagination.
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            List of database model instances
+        """
+        result = await self.db.execute(select(self.model).offset(skip).limit(limit))
+        return list(result.scalars().all())
+    
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None
+    ) -> Page[ModelType]:
+        """
+        Get one page of records using keyset pagination.
+        
+        Args:
+            limit: Maximum number of records to return
+            cursor: next_cursor of the previous page, or None for the first page
+            order_by: Non-null column to sort by; the primary key is used when None
+            
+        Returns:
+            Page of records and the cursor of the next page
+            
+        Raises:
+            ValueError: If order_by or the cursor is invalid
+        """
+        result = await self.db.execute(self._page_statement(limit, cursor, order_by))
+        return self._make_page(list(result.scalars().all()), limit, order_by)
+    
+    async def update(self, db_obj: ModelType, obj_in: UpdateSchemaType) -> ModelType:
+        """
+        Update an existing record.
+        
+        Args:
+            db_obj: Existing database model instance
+            obj_in: Pydantic schema with updated data
+            
+        Returns:
+            Updated database model instance
+        """
+        if hasattr(obj_in, 'model_dump'):
+            obj_data = obj_in.model_dump(exclude_unset=True)
+        else:
+            obj_data = obj_in.dict(exclude_unset=True)
+            
+        for field, value in obj_data.items():
+            setattr(db_obj, field, value)
+            
+        self.db.add(db_obj)
+        await self.db.commit()
+        await self.db.refresh(db_obj)
+        return db_obj
+    
+    async def delete(self, id: Any) -> ModelType:
+        """
+        Delete a record by its primary key.
+        
+        Args:
+            id: Primary key value
+            
+        Returns:
+            Deleted database model instance
+            
+        Raises:
+            ValueError: If record not found
+        """
+        obj = await self.get(id)
+        if not obj:
+            raise ValueError(f"Record with id {id} not found")
+            
+        await self.db.delete(obj)
+        await self.db.commit()
+        return obj
+    
+    async def bulk_create(
+        self,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """
+        Insert many records in one transaction.
+        
+        Args:
+            objs_in: Pydantic schemas or dicts with the same keys
+            batch_size: Rows per INSERT statement
+            
+        Returns:
+            Number of records created
+        """
+        rows = [self._to_dict(obj_in) for obj_in in objs_in]
+        try:
+            for batch in iter_batches(rows, batch_size):
+                await self.db.execute(insert(self.model.__table__), batch)
+            await self.db.commit()
+        except BaseException:
+            await self.db.rollback()
+            raise
+        return len(rows)
+    
+    async def bulk_update(
+        self,
+        updates: Sequence[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> int:
+        """
+        Update many records by primary key in one transaction.
+        
+        Args:
+            updates: Dicts holding the primary key and the columns to change
+            batch_size: Rows per UPDATE statement
+            
+        Returns:
+            Number of records updated
+        """
+        rows = [dict(row) for row in updates]
+        try:
+            for batch in iter_batches(rows, batch_size):
+                await self.db.execute(update(self.model), batch)
+            await self.db.commit()
+        except BaseException:
+            await self.db.rollback()
+            raise
+        return len(rows)
+    
+    async def bulk_delete(self, ids: Sequence[Any], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Delete many records by primary key in one transaction.
+        
+        Args:
+            ids: Primary key values (tuples for composite keys)
+            batch_size: Keys per DELETE statement
+            
+        Returns:
+            Number of records deleted
+        """
+        deleted = 0
+        try:
+            for batch in iter_batches(list(ids), batch_size):
+                result = await self.db.execute(self._delete_statement(batch))
+                deleted += result.rowcount
+            await self.db.commit()
+        except BaseException:
+            await self.db.rollback()
+            raise
+        return deleted
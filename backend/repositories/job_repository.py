@@ -0,0 +1,233 @@
+"""
+Job repository for handling analysis-job database operations.
+
+This module provides the JobRepository class that encapsulates
+all database operations related to background analysis jobs.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session, defer
+
+from .base import CRUDRepository
+from ..models.analysis_job import AnalysisJob, JobStatus
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobRepository(CRUDRepository[AnalysisJob, dict, dict]):
+    """
+    Repository class for AnalysisJob entity operations.
+
+    Status transitions are written with conditional UPDATE statements so
+    that two worker processes cannot claim the same job.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize the job repository.
+
+        Args:
+            db: Database session
+        """
+        super().__init__(AnalysisJob, db)
+
+    def create_job(self, username: str, kind: str, params: Optional[Dict[str, Any]] = None) -> AnalysisJob:
+        """
+        Create a new pending job.
+
+        Args:
+            username: Owner of the job
+            kind: Job type
+            params: Optional job parameters
+
+        Returns:
+            Created job instance
+        """
+        job = AnalysisJob(
+            id=str(uuid.uuid4()),
+            username=username,
+            kind=kind,
+            params=params or {},
+            status=JobStatus.PENDING,
+            completed=0,
+            total=0,
+            progress=0.0,
+        )
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+        return job
+
+    def get_for_user(self, job_id: str, username: str) -> Optional[AnalysisJob]:
+        """
+        Get a job by id if it belongs to the user.
+
+        Args:
+            job_id: Job identifier
+            username: Owner of the job
+
+        Returns:
+            Job instance or None if not found
+        """
+        return self.db.query(self.model).filter(
+            self.model.id == job_id,
+            self.model.username == username
+        ).first()
+
+    def list_for_user(self, username: str, limit: int = 20) -> List[AnalysisJob]:
+        """
+        List the user's most recent jobs.
+
+        Args:
+            username: Owner of the jobs
+            limit: Maximum number of jobs to return
+
+        Returns:
+            Jobs, newest first; their results are loaded on first access
+        """
+        return self.db.query(self.model).options(defer(self.model.result)).filter(
+            self.model.username == username
+        ).order_by(self.model.created_at.desc()).limit(limit).all()
+
+    def list_unfinished(self) -> List[AnalysisJob]:
+        """
+        List pending and running jobs, oldest first.
+
+        Returns:
+            Unfinished jobs
+        """
+        return self.db.query(self.model).filter(
+            self.model.status.in_(JobStatus.UNFINISHED)
+        ).order_by(self.model.created_at).all()
+
+    def claim(self, job_id: str, worker_id: str) -> bool:
+        """
+        Atomically move a pending job to running.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Identifier of the claiming worker
+
+        Returns:
+            True if this worker claimed the job
+        """
+        now = _utcnow()
+        result = self.db.execute(
+            update(self.model)
+            .where(self.model.id == job_id, self.model.status == JobStatus.PENDING)
+            .values(status=JobStatus.RUNNING, worker_id=worker_id, started_at=now, updated_at=now)
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def requeue(self, job_id: str, worker_id: Optional[str]) -> bool:
+        """
+        Move a running job back to pending if it is still owned by worker_id.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker that owned the job when it was inspected
+
+        Returns:
+            True if the job was re-queued
+        """
+        result = self.db.execute(
+            update(self.model)
+            .where(
+                self.model.id == job_id,
+                self.model.status == JobStatus.RUNNING,
+                self.model.worker_id == worker_id
+            )
+            .values(status=JobStatus.PENDING, worker_id=None, updated_at=_utcnow())
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def update_progress(self, job_id: str, worker_id: str, completed: int, total: int) -> bool:
+        """
+        Record job progress; this also refreshes the job's heartbeat.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker that claimed the job
+            completed: Work units completed
+            total: Total work units
+
+        Returns:
+            True if the job is still running under worker_id
+        """
+        result = self.db.execute(
+            update(self.model)
+            .where(*self._owned_by(job_id, worker_id))
+            .values(
+                completed=completed,
+                total=total,
+                progress=(completed / total) if total else 0.0,
+                updated_at=_utcnow()
+            )
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def mark_succeeded(self, job_id: str, worker_id: str, result: Any) -> bool:
+        """
+        Store the job result and mark it succeeded.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker that claimed the job
+            result: JSON-compatible result
+
+        Returns:
+            True if the job was still running under worker_id
+        """
+        now = _utcnow()
+        outcome = self.db.execute(
+            update(self.model)
+            .where(*self._owned_by(job_id, worker_id))
+            .values(
+                status=JobStatus.SUCCEEDED,
+                result=result,
+                progress=1.0,
+                finished_at=now,
+                updated_at=now
+            )
+        )
+        self.db.commit()
+        return outcome.rowcount == 1
+
+    def mark_failed(self, job_id: str, worker_id: str, error: str) -> bool:
+        """
+        Store the job error and mark it failed.
+
+        Args:
+            job_id: Job identifier
+            worker_id: Worker that claimed the job
+            error: Error message
+
+        Returns:
+            True if the job was still running under worker_id
+        """
+        now = _utcnow()
+        result = self.db.execute(
+            update(self.model)
+            .where(*self._owned_by(job_id, worker_id))
+            .values(status=JobStatus.FAILED, error=error, finished_at=now, updated_at=now)
+        )
+        self.db.commit()
+        return result.rowcount == 1
+
+    def _owned_by(self, job_id: str, worker_id: str) -> Tuple[Any, ...]:
+        """Conditions matching a job still running under the worker that claimed it."""
+        # A worker whose job was re-queued as stale must not overwrite the new owner's state
+        return (
+            self.model.id == job_id,
+            self.model.status == JobStatus.RUNNING,
+            self.model.worker_id == worker_id,
+        )
@@ -5,14 +5,34 @@ This module provides the UserRepository class that encapsulates
 all database operations related to users.
 """
 
-from typing import Optional
+from typing import Optional, Sequence, Set, Tuple
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .base import CRUDRepository
+from .base import DEFAULT_BATCH_SIZE, AsyncCRUDRepository, CRUDRepository, iter_batches
 from ..models.userInAlchemy import UserInAlchemy
 from ..models.user import User, UserInDB
 
 
+def _taken_statement(usernames: Sequence[str], emails: Sequence[str]):
+    """Select the usernames and emails among the given ones that are in use."""
+    return select(UserInAlchemy.username, UserInAlchemy.email).where(
+        or_(UserInAlchemy.username.in_(usernames), UserInAlchemy.email.in_(emails))
+    )
+
+
+def _pairs(usernames: Sequence[str], emails: Sequence[str], batch_size: int):
+    """Split both lists into batches and pair them up for _taken_statement."""
+    username_batches = list(iter_batches(list(usernames), batch_size))
+    email_batches = list(iter_batches(list(emails), batch_size))
+    for index in range(max(len(username_batches), len(email_batches))):
+        yield (
+            username_batches[index] if index < len(username_batches) else [],
+            email_batches[index] if index < len(email_batches) else [],
+        )
+
+
 class UserRepository(CRUDRepository[UserInAlchemy, UserInDB, User]):
     """
     Repository class for User entity operations.
@@ -126,6 +146,23 @@ class UserRepository(CRUDRepository[UserInAlchemy, UserInDB, User]):
         self.db.refresh(db_user)
         return db_user
     
+    def update_hashed_password(self, username: str, hashed_password: str) -> bool:
+        """
+        Replace a user's password hash, e.g. after a bcrypt cost change.
+        
+        Args:
+            username: The username of the user
+            hashed_password: New password hash
+            
+        Returns:
+            True if the user was found and updated
+        """
+        updated = self.db.query(self.model).filter(
+            self.model.username == username
+        ).update({self.model.hashed_password: hashed_password}, synchronize_session="fetch")
+        self.db.commit()
+        return updated == 1
+    
     def delete_by_username(self, username: str) -> Optional[UserInAlchemy]:
         """
         Delete a user by username.
@@ -142,4 +179,222 @@ class UserRepository(CRUDRepository[UserInAlchemy, UserInDB, User]):
         
         self.db.delete(db_user)
         self.db.commit()
-        return db_user
\ No newline at end of file
+        return db_user
+
+    def find_taken(
+        self,
+        usernames: Sequence[str],
+        emails: Sequence[str],
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Find which of many usernames and emails are already registered.
+        
+        One query checks both columns for a whole batch, instead of two
+        queries per user.
+        
+        Args:
+            usernames: Usernames to check
+            emails: Email addresses to check
+            batch_size: Values of each list per query
+            
+        Returns:
+            Taken usernames and taken emails
+        """
+        wanted_usernames, wanted_emails = set(usernames), set(emails)
+        taken_usernames: Set[str] = set()
+        taken_emails: Set[str] = set()
+        for username_batch, email_batch in _pairs(usernames, emails, batch_size):
+            for username, email in self.db.execute(_taken_statement(username_batch, email_batch)):
+                if username in wanted_usernames:
+                    taken_usernames.add(username)
+                if email in wanted_emails:
+                    taken_emails.add(email)
+        return taken_usernames, taken_emails
+
+
+class AsyncUserRepository(AsyncCRUDRepository[UserInAlchemy, UserInDB, User]):
+    """
+    Async repository class for User entity operations.
+    
+    This class mirrors UserRepository on an AsyncSession; every method is
+    a coroutine with the same arguments and return value.
+    """
+    
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize the async user repository.
+        
+        Args:
+            db: Async database session
+        """
+        super().__init__(UserInAlchemy, db)
+    
+    async def get_by_username(self, username: str) -> Optional[UserInAlchemy]:
+        """
+        Get a user by username.
+        
+        Args:
+            username: The username to search for
+            
+        Returns:
+            User instance or None if not found
+        """
+        result = await self.db.execute(
+            select(self.model).where(self.model.username == username)
+        )
+        return result.scalars().first()
+    
+    async def get_by_email(self, email: str) -> Optional[UserInAlchemy]:
+        """
+        Get a user by email address.
+        
+        Args:
+            email: The email address to search for
+            
+        Returns:
+            User instance or None if not found
+        """
+        result = await self.db.execute(
+            select(self.model).where(self.model.email == email)
+        )
+        return result.scalars().first()
+    
+    async def create_user(self, user_data: UserInDB) -> UserInAlchemy:
+        """
+        Create a new user with hashed password.
+        
+        Args:
+            user_data: UserInDB schema containing user data with hashed password
+            
+        Returns:
+            Created user instance
+        """
+        db_user = UserInAlchemy(**user_data.model_dump())
+        self.db.add(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
+        return db_user
+    
+    async def username_exists(self, username: str) -> bool:
+        """
+        Check if a username already exists.
+        
+        Args:
+            username: The username to check
+            
+        Returns:
+            True if username exists, False otherwise
+        """
+        result = await self.db.execute(
+            select(self.model.username).where(self.model.username == username)
+        )
+        return result.first() is not None
+    
+    async def email_exists(self, email: str) -> bool:
+        """
+        Check if an email already exists.
+        
+        Args:
+            email: The email to check
+            
+        Returns:
+            True if email exists, False otherwise
+        """
+        result = await self.db.execute(
+            select(self.model.username).where(self.model.email == email)
+        )
+        return result.first() is not None
+    
+    async def update_user_by_username(self, username: str, user_data: User) -> Optional[UserInAlchemy]:
+        """
+        Update a user by username.
+        
+        Args:
+            username: The username of the user to update
+            user_data: Updated user data
+            
+        Returns:
+            Updated user instance or None if not found
+        """
+        db_user = await self.get_by_username(username)
+        if not db_user:
+            return None
+        
+        update_data = user_data.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(db_user, field, value)
+        
+        self.db.add(db_user)
+        await self.db.commit()
+        await self.db.refresh(db_user)
+        return db_user
+    
+    async def update_hashed_password(self, username: str, hashed_password: str) -> bool:
+        """
+        Replace a user's password hash, e.g. after a bcrypt cost change.
+        
+        Args:
+            username: The username of the user
+            hashed_password: New password hash
+            
+        Returns:
+            True if the user was found and updated
+        """
+        result = await self.db.execute(
+            update(self.model)
+            .where(self.model.username == username)
+            .values(hashed_password=hashed_password)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+    
+    async def delete_by_username(self, username: str) -> Optional[UserInAlchemy]:
+        """
+        Delete a user by username.
+        
+        Args:
+            username: The username of the user to delete
+            
+        Returns:
+            Deleted user instance or None if not found
+        """
+        db_user = await self.get_by_username(username)
+        if not db_user:
+            return None
+        
+        await self.db.delete(db_user)
+        await self.db.commit()
+        return db_user
+
+    async def find_taken(
+        self,
+        usernames: Sequence[str],
+        emails: Sequence[str],
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Find which of many usernames and emails are already registered.
+        
+        One query checks both columns for a whole batch, instead of two
+        queries per user.
+        
+        Args:
+            usernames: Usernames to check
+            emails: Email addresses to check
+            batch_size: Values of each list per query
+            
+        Returns:
+            Taken usernames and taken emails
+        """
+        wanted_usernames, wanted_emails = set(usernames), set(emails)
+        taken_usernames: Set[str] = set()
+        taken_emails: Set[str] = set()
+        for username_batch, email_batch in _pairs(usernames, emails, batch_size):
+            result = await self.db.execute(_taken_statement(username_batch, email_batch))
+            for username, email in result:
+                if username in wanted_usernames:
+                    taken_usernames.add(username)
+                if email in wanted_emails:
+                    taken_emails.add(email)
+        return taken_usernames, taken_emails
@@ -0,0 +1,193 @@
+"""
+Analysis router with clean OOP structure.
+
+This module provides project-level code analysis routes using the new OOP
+architecture with proper dependency injection and separation of concerns.
+"""
+
+from typing import Dict, Any, Optional
+from fastapi import APIRouter, Depends, Query
+
+from ..controllers.auth_controller import get_current_active_user
+from ..services.call_graph_service import CallGraphService
+from ..services.class_hierarchy_service import ClassHierarchyService
+from ..services.import_graph_service import ImportGraphService
+from ..services.project_analysis_service import ProjectAnalysisService
+from ..services.syntax_check_service import SyntaxCheckService
+from ..models.userInAlchemy import UserInAlchemy
+
+
+router = APIRouter(
+    prefix="/analysis",
+    tags=["analysis"],
+    dependencies=[Depends(get_current_active_user)]
+)
+
+
+@router.get("/project", response_model=Dict[str, Any])
+async def analyze_project(
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+):
+    """
+    Analyze every Python file uploaded by the current user.
+    
+    Files are analyzed in parallel worker processes; unchanged files are
+    served from the analysis cache.
+    
+    Args:
+        current_user: Current authenticated user
+        
+    Returns:
+        Project report with a summary and per-file results
+    """
+    project_service = ProjectAnalysisService()
+    return await project_service.analyze_project(current_user.username)
+
+
+@router.get("/syntax", response_model=Dict[str, Any])
+async def check_syntax(
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+):
+    """
+    Compile every Python file uploaded by the current user.
+    
+    Files are compiled in parallel worker processes; files whose content
+    was checked before are served from the cache.
+    
+    Args:
+        current_user: Current authenticated user
+        
+    Returns:
+        Summary and one entry per file that does not compile, with line,
+        column, error type and message
+    """
+    syntax_service = SyntaxCheckService()
+    return await syntax_service.check_files(current_user.username)
+
+
+@router.get("/classes", response_model=Dict[str, Any])
+async def get_class_hierarchy(
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+):
+    """
+    Get every class of the current user's project with resolved bases.
+    
+    Bases are resolved through imports between the uploaded modules, so
+    classes with the same name in different modules are told apart; each
+    class is identified as "module:qualname".
+    
+    Args:
+        current_user: Current authenticated user
+        
+    Returns:
+        Classes by file and the external bases they derive from
+    """
+    hierarchy_service = ClassHierarchyService()
+    return await hierarchy_service.get_hierarchy(current_user.username)
+
+
+@router.get("/classes/{class_id}", response_model=Dict[str, Any])
+async def get_class(
+    class_id: str,
+    transitive: bool = True,
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+):
+    """
+    Get one class with its method resolution order and subclasses.
+    
+    Args:
+        class_id: "module:qualname", or a class name or dotted path
+        transitive: Include indirect subclasses
+        current_user: Current authenticated user
+        
+    Returns:
+        Class details with its C3 MRO and subclasses
+    """
+    hierarchy_service = ClassHierarchyService()
+    return await hierarchy_service.get_class(current_user.username, class_id, transitive)
+
+
+@router.get("/imports", response_model=Dict[str, Any])
+async def get_import_graph(
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+):
+    """
+    Get the module import graph of the current user's project.
+    
+    Relative and absolute imports are resolved to uploaded modules; cycles
+    are reported between imports that run at module import time.
+    
+    Args:
+        current_user: Current authenticated user
+        
+    Returns:
+        Modules with fan-in/fan-out and the import cycles between them
+    """
+    import_graph_service = ImportGraphService()
+    return await import_graph_service.get_import_graph(current_user.username)
+
+
+@router.get("/calls/callers", response_model=Dict[str, Any])
+async def get_callers(
+    symbol: str,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+):
+    """
+    Get the functions and methods calling a symbol.
+    
+    Args:
+        symbol: "module:qualname", or a qualname, dotted path or name
+        limit: Maximum number of callers to return
+        current_user: Current authenticated user
+        
+    Returns:
+        The symbol and its callers with their number of call sites
+    """
+    call_graph_service = CallGraphService()
+    return await call_graph_service.get_callers(current_user.username, symbol, limit)
+
+
+@router.get("/calls/callees", response_model=Dict[str, Any])
+async def get_callees(
+    symbol: str,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+):
+    """
+    Get the functions and methods a symbol calls.
+    
+    Calls that cannot be resolved to project code are reported as
+    external nodes named after the called expression.
+    
+    Args:
+        symbol: "module:qualname", or a qualname, dotted path or name
+        limit: Maximum number of callees to return
+        current_user: Current authenticated user
+        
+    Returns:
+        The symbol and its callees with their number of call sites
+    """
+    call_graph_service = CallGraphService()
+    return await call_graph_service.get_callees(current_user.username, symbol, limit)
+
+
+@router.get("/calls/graph", response_model=Dict[str, Any])
+async def export_call_graph(
+    limit: int = Query(1000, ge=1, le=10000),
+    cursor: Optional[str] = None,
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+):
+    """
+    Export one page of the current user's call graph.
+    
+    Args:
+        limit: Maximum number of nodes to return
+        cursor: next_cursor of the previous page
+        current_user: Current authenticated user
+        
+    Returns:
+        Nodes with their outgoing edges and the cursor of the next page
+    """
+    call_graph_service = CallGraphService()
+    return await call_graph_service.export_graph(current_user.username, limit, cursor)
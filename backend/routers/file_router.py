@@ -5,12 +5,18 @@ This module provides file-related routes using the new OOP architecture
 with proper dependency injection and separation of concerns.
 """
 
-from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, File, UploadFile, HTTPException, status
+from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, File, Query, UploadFile, HTTPException, status
+from sqlalchemy.orm import Session
 
 from ..controllers.auth_controller import get_current_active_user
+from ..services.archive_service import ArchiveService
+from ..services.file_io import file_io
 from ..services.file_service import FileService
+from ..services.job_service import JobService
+from ..repositories.job_repository import JobRepository
 from ..models.userInAlchemy import UserInAlchemy
+from ..database.database import get_db
 
 
 router = APIRouter(
@@ -20,37 +26,63 @@ router = APIRouter(
 )
 
 
-@router.get("/", response_model=Dict[str, List[str]])
+def _submit_job(
+    db: Session,
+    username: str,
+    kind: str,
+    params: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Persist and schedule a job (blocking; run it on the file I/O threads)."""
+    job_service = JobService(JobRepository(db))
+    job = job_service.submit_job(username, kind, params)
+    return JobService.to_dict(job, include_result=False)
+
+
+@router.get("/", response_model=Dict[str, Any])
 async def get_all_files(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
     current_user: UserInAlchemy = Depends(get_current_active_user)
 ):
     """
-    Get all files for the current user.
+    Get one page of the current user's files, including nested ones.
     
     Args:
+        limit: Maximum number of paths to return
+        cursor: next_cursor of the previous page
         current_user: Current authenticated user
         
     Returns:
-        Dictionary containing list of filenames
+        Relative file paths and the cursor of the next page
     """
     file_service = FileService()
-    return file_service.get_user_files(current_user.username)
+    return await file_service.get_user_files(current_user.username, limit, cursor)
 
 
 @router.post("/upload", response_model=Dict[str, Any])
 async def upload_files(
     files: List[UploadFile] = File(...),
-    current_user: UserInAlchemy = Depends(get_current_active_user)
+    prewarm: bool = True,
+    check_syntax: bool = False,
+    current_user: UserInAlchemy = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
 ):
     """
     Upload multiple Python files.
     
     Args:
         files: List of files to upload
+        prewarm: Analyse the files in the background right after upload
+        check_syntax: Also submit a syntax check job for the uploaded
+            files; its result is the batch's persisted error log. Opt-in,
+            since it compiles the files again after the warm-up parse and
+            writes a job row; GET /analysis/syntax reports on demand
         current_user: Current authenticated user
+        db: Database session
         
     Returns:
-        Upload success message and count
+        Upload success message, count, the files queued for warm-up and,
+        with check_syntax, the submitted job
     """
     if not files:
         raise HTTPException(
@@ -59,10 +91,52 @@ async def upload_files(
         )
     
     file_service = FileService()
-    return file_service.upload_files(files, current_user.username)
+    result = await file_service.upload_files(files, current_user.username, prewarm=prewarm)
+    if check_syntax and result["files"]:
+        result["syntax_check"] = await file_io.run(
+            _submit_job, db, current_user.username, "syntax_check", {"files": result["files"]}
+        )
+    return result
+
+
+@router.post("/upload_archive", response_model=Dict[str, Any])
+async def upload_archive(
+    archive: UploadFile = File(...),
+    analyze: bool = False,
+    check_syntax: bool = False,
+    current_user: UserInAlchemy = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Upload a zip, tar or tar.gz archive and extract its Python files.
+    
+    Relative paths inside the archive are kept; other members are skipped.
+    
+    Args:
+        archive: Archive to extract
+        analyze: Submit a project analysis job once extraction finished
+        check_syntax: Also submit a syntax check job for the extracted
+            files, persisted as the batch's error log (opt-in, as on /upload)
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Extracted files and, with analyze or check_syntax, the submitted jobs
+    """
+    archive_service = ArchiveService()
+    result = await file_io.run(archive_service.extract_archive, archive, current_user.username)
+    if analyze:
+        result["job"] = await file_io.run(
+            _submit_job, db, current_user.username, "project_analysis"
+        )
+    if check_syntax and result["files"]:
+        result["syntax_check"] = await file_io.run(
+            _submit_job, db, current_user.username, "syntax_check", {"files": result["files"]}
+        )
+    return result
 
 
-@router.get("/{filename}", response_model=Dict[str, Any])
+@router.get("/{filename:path}", response_model=Dict[str, Any])
 async def get_file_content(
     filename: str,
     current_user: UserInAlchemy = Depends(get_current_active_user)
@@ -71,17 +145,17 @@ async def get_file_content(
     Get the content of a specific file.
     
     Args:
-        filename: Name of the file to retrieve
+        filename: Relative path of the file to retrieve
         current_user: Current authenticated user
         
     Returns:
         File content and metadata
     """
     file_service = FileService()
-    return file_service.get_file_content(filename, current_user.username)
+    return await file_service.get_file_content(filename, current_user.username)
 
 
-@router.delete("/{filename}", response_model=Dict[str, str])
+@router.delete("/{filename:path}", response_model=Dict[str, str])
 async def delete_file(
     filename: str,
     current_user: UserInAlchemy = Depends(get_current_active_user)
@@ -90,14 +164,14 @@ async def delete_file(
     Delete a specific file.
     
     Args:
-        filename: Name of the file to delete
+        filename: Relative path of the file to delete
         current_user: Current authenticated user
         
     Returns:
         Deletion success message
     """
     file_service = FileService()
-    return file_service.delete_file(filename, current_user.username)
+    return await file_service.delete_file(filename, current_user.username)
 
 
 @router.post("/validate", response_model=Dict[str, bool])
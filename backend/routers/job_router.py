@@ -0,0 +1,89 @@
+"""
+Job router with clean OOP structure.
+
+This module provides routes to submit background analysis jobs and poll
+their status, progress and results.
+"""
+
+from typing import Dict, Any, List
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+
+from ..controllers.auth_controller import get_current_active_user
+from ..services.job_service import JobService
+from ..repositories.job_repository import JobRepository
+from ..models.userInAlchemy import UserInAlchemy
+from ..database.database import get_db
+
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"],
+    dependencies=[Depends(get_current_active_user)]
+)
+
+
+@router.post("/", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(
+    kind: str = "project_analysis",
+    current_user: UserInAlchemy = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Submit a background analysis job.
+    
+    Args:
+        kind: Job type, e.g. project_analysis
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Job id and initial status
+    """
+    job_service = JobService(JobRepository(db))
+    job = job_service.submit_job(current_user.username, kind)
+    return JobService.to_dict(job, include_result=False)
+
+
+@router.get("/", response_model=List[Dict[str, Any]])
+async def list_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    current_user: UserInAlchemy = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    List the current user's most recent jobs.
+    
+    Args:
+        limit: Maximum number of jobs to return
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Jobs without their results, newest first
+    """
+    job_service = JobService(JobRepository(db))
+    jobs = job_service.list_jobs(current_user.username, limit)
+    return [JobService.to_dict(job, include_result=False) for job in jobs]
+
+
+@router.get("/{job_id}", response_model=Dict[str, Any])
+async def get_job(
+    job_id: str,
+    current_user: UserInAlchemy = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the status, progress and, once finished, the result of a job.
+    
+    Args:
+        job_id: Job identifier
+        current_user: Current authenticated user
+        db: Database session
+        
+    Returns:
+        Job status with its result when it succeeded
+    """
+    job_service = JobService(JobRepository(db))
+    job = job_service.get_job(job_id, current_user.username)
+    return JobService.to_dict(job)
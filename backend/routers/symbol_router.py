@@ -0,0 +1,43 @@
+"""
+Symbol router with clean OOP structure.
+
+This module provides cross-file symbol search over the current user's
+uploaded project.
+"""
+
+from typing import Any, Dict, Optional
+from fastapi import APIRouter, Depends, Query
+
+from ..controllers.auth_controller import get_current_active_user
+from ..services.symbol_service import SymbolService
+from ..models.userInAlchemy import UserInAlchemy
+
+
+router = APIRouter(
+    prefix="/symbols",
+    tags=["symbols"],
+    dependencies=[Depends(get_current_active_user)]
+)
+
+
+@router.get("/search", response_model=Dict[str, Any])
+async def search_symbols(
+    q: str = Query("", max_length=200),
+    kind: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    current_user: UserInAlchemy = Depends(get_current_active_user)
+):
+    """
+    Find classes, functions and methods by name prefix across all files.
+    
+    Args:
+        q: Case-insensitive name prefix, e.g. "get_" or "UserService"
+        kind: Only return "class", "function" or "method" symbols
+        limit: Maximum number of symbols to return
+        current_user: Current authenticated user
+        
+    Returns:
+        Matching symbols with file and line
+    """
+    symbol_service = SymbolService()
+    return await symbol_service.search(current_user.username, q, kind=kind, limit=limit)
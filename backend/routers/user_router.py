@@ -5,16 +5,16 @@ This module provides user-related routes using the new OOP architecture
 with proper dependency injection and separation of concerns.
 """
 
-from typing import Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import Dict, Any, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..controllers.auth_controller import get_current_active_user
+from ..controllers.auth_controller import get_current_active_user, get_current_admin_user
 from ..services.user_service import UserService
-from ..repositories.user_repository import UserRepository
+from ..repositories.user_repository import AsyncUserRepository
 from ..models.user import User
 from ..models.userInAlchemy import UserInAlchemy
-from ..database.database import get_db
+from ..database.database import get_async_db
 
 
 router = APIRouter(
@@ -29,7 +29,7 @@ async def register_user(
     password: str,
     email: str,
     full_name: str = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Register a new user.
@@ -52,10 +52,10 @@ async def register_user(
     )
     
     # Get service with repository
-    user_repository = UserRepository(db)
+    user_repository = AsyncUserRepository(db)
     user_service = UserService(user_repository)
     
-    created_user = user_service.register_user(user_data, password, email)
+    created_user = await user_service.register_user(user_data, password, email)
     
     return {
         "message": "User registered successfully",
@@ -90,7 +90,7 @@ async def update_current_user(
     full_name: str = None,
     email: str = None,
     current_user: UserInAlchemy = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Update current user information.
@@ -124,14 +124,88 @@ async def update_current_user(
     )
     
     # Get service with repository
-    user_repository = UserRepository(db)
+    user_repository = AsyncUserRepository(db)
     user_service = UserService(user_repository)
     
-    updated_user = user_service.update_user(current_user.username, user_data)
+    updated_user = await user_service.update_user(current_user.username, user_data)
     
     return User(
         username=updated_user.username,
         email=updated_user.email,
         full_name=updated_user.full_name,
         disabled=updated_user.disabled
-    )
\ No newline at end of file
+    )
+
+
+@router.get("/", response_model=Dict[str, Any])
+async def list_users(
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    order_by: Literal["username", "created_at"] = "username",
+    current_user: UserInAlchemy = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    List users page by page (administrators only).
+    
+    Args:
+        limit: Maximum number of users per page
+        cursor: next_cursor returned with the previous page
+        order_by: Sort by username or creation time
+        current_user: Current administrator
+        db: Database session
+        
+    Returns:
+        Users and the cursor of the next page (None on the last page)
+    """
+    user_repository = AsyncUserRepository(db)
+    user_service = UserService(user_repository)
+    
+    return await user_service.list_users(
+        limit=limit,
+        cursor=cursor,
+        order_by=None if order_by == "username" else order_by
+    )
+
+
+@router.post("/bulk_register", response_model=Dict[str, Any])
+async def bulk_register_users(
+    request: Request,
+    current_user: UserInAlchemy = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Register many users at once (administrators only).
+    
+    The body is a JSON list of {username, password, email, full_name}
+    objects, CSV with those columns as header (Content-Type: text/csv), or
+    a multipart upload of a .json/.csv file in the "file" field.
+    
+    Args:
+        request: Incoming request with the users
+        current_user: Current administrator
+        db: Database session
+        
+    Returns:
+        Number of created and failed users and a result per row
+    """
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Upload the users as a .csv or .json file in the 'file' field"
+            )
+        content = await upload.read()
+        is_csv = (upload.filename or "").lower().endswith(".csv")
+        content_type = "text/csv" if is_csv else "application/json"
+    else:
+        content = await request.body()
+    
+    user_repository = AsyncUserRepository(db)
+    user_service = UserService(user_repository)
+    
+    entries = user_service.parse_registrations(content, content_type)
+    return await user_service.register_users(entries)
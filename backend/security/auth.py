@@ -5,14 +5,15 @@ This module provides functions for password hashing, verification,
 and user authentication using bcrypt.
 """
 
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from ..models.userInAlchemy import UserInAlchemy
+from .password_hasher import password_hasher
+from .user_cache import user_cache
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context (cost from SecuritySettings.bcrypt_rounds)
+pwd_context = password_hasher.context
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -61,6 +62,57 @@ def authenticate_user(username: str, password: str, db: Session) -> Optional[Use
     
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    verified, new_hash = password_hasher.verify_and_update(password, user.hashed_password)
+    if not verified:
         return None
-    return user
\ No newline at end of file
+    if new_hash:
+        rehash_password(user_repository, username, new_hash)
+    return user
+
+
+async def authenticate_user_async(username: str, password: str, db: Session) -> Optional[UserInAlchemy]:
+    """
+    Authenticate a user without blocking the event loop.
+    
+    Password verification runs on the bounded password executor; a hash
+    created with an outdated bcrypt cost is replaced transparently.
+    
+    Args:
+        username: User's username
+        password: Plain text password
+        db: Database session
+        
+    Returns:
+        User instance if authentication successful, None otherwise
+        
+    Raises:
+        HTTPException: 503 if the password executor is saturated
+    """
+    from ..repositories.user_repository import UserRepository
+    
+    user_repository = UserRepository(db)
+    user = user_repository.get_by_username(username)
+    
+    if not user:
+        return None
+    verified, new_hash = await password_hasher.verify_and_update_async(
+        password, user.hashed_password
+    )
+    if not verified:
+        return None
+    if new_hash:
+        rehash_password(user_repository, username, new_hash)
+    return user
+
+
+def rehash_password(user_repository, username: str, new_hash: str) -> None:
+    """
+    Store an upgraded password hash after a successful login.
+    
+    Args:
+        user_repository: UserRepository bound to the current session
+        username: User's username
+        new_hash: Hash created with the current bcrypt settings
+    """
+    user_repository.update_hashed_password(username, new_hash)
+    user_cache.invalidate(username)
\ No newline at end of file
@@ -12,6 +12,7 @@ from ..models.token import TokenData
 from ..services.crud_user import getUserByUsernameWithoutPassword
 from ..database.database import get_db
 from ..models.userInAlchemy import UserInAlchemy
+from .user_cache import user_cache
 from sqlalchemy.orm import Session
 
 load_dotenv()
@@ -55,7 +56,11 @@ async def get_current_user(
     except InvalidTokenError:
         raise credentials_exception
 
-    user = getUserByUsernameWithoutPassword(username=token_data.username, db=db)
+    # Served from memory on a hit; the session only connects on a miss
+    user = user_cache.get_or_load(
+        token_data.username,
+        lambda: getUserByUsernameWithoutPassword(username=token_data.username, db=db)
+    )
     if user is None:
         raise credentials_exception
     return user
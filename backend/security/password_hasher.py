@@ -0,0 +1,235 @@
+"""
+Bounded executor for password hashing.
+
+bcrypt is deliberately slow: one hash or verification costs hundreds of
+milliseconds of CPU. Running it inside an async handler blocks the event
+loop for every other request. PasswordHasher runs it on a small dedicated
+thread pool instead (bcrypt releases the GIL) and rejects work with 503
+once too many operations are waiting, so a burst of logins degrades only
+logins. Bulk registration hashes on a second, wider pool so onboarding a
+class does not starve logins either.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from ..core.config import settings
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    bcrypt hashing with a thread pool and an admission limit.
+
+    At most max_workers operations run at once and at most max_pending
+    more may queue; further requests fail fast with 503 and Retry-After.
+    """
+
+    def __init__(
+        self,
+        rounds: int,
+        max_workers: int,
+        max_pending: int,
+        retry_after_seconds: int = 1,
+        bulk_workers: int = 1
+    ):
+        """
+        Initialize the password hasher.
+
+        Args:
+            rounds: bcrypt cost factor for new hashes
+            max_workers: Threads running bcrypt
+            max_pending: Operations allowed to queue behind the running ones
+            retry_after_seconds: Retry-After value for rejected requests
+            bulk_workers: Threads hashing the passwords of a bulk registration
+        """
+        self.rounds = rounds
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+        self.retry_after_seconds = retry_after_seconds
+        self.context = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__rounds=rounds
+        )
+        self.bulk_workers = max(1, bulk_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._bulk_executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._bulk_chunks = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured cost (blocking)."""
+        return self.context.hash(password)
+
+    def verify(self, password: str, hashed_password: str) -> bool:
+        """Verify a password against a hash (blocking)."""
+        return self.context.verify(password, hashed_password)
+
+    def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and rehash it if its hash uses outdated settings (blocking).
+
+        Returns:
+            Whether the password matched, and a replacement hash or None
+        """
+        return self.context.verify_and_update(password, hashed_password)
+
+    async def hash_async(self, password: str) -> str:
+        """Hash a password on the password pool."""
+        return await self._run(self.hash, password)
+
+    async def verify_async(self, password: str, hashed_password: str) -> bool:
+        """Verify a password on the password pool."""
+        return await self._run(self.verify, password, hashed_password)
+
+    async def verify_and_update_async(
+        self,
+        password: str,
+        hashed_password: str
+    ) -> Tuple[bool, Optional[str]]:
+        """Verify and, if needed, rehash a password on the password pool."""
+        return await self._run(self.verify_and_update, password, hashed_password)
+
+    async def hash_many_async(self, passwords: Sequence[str]) -> List[str]:
+        """
+        Hash many passwords in parallel on the bulk pool.
+
+        Only one batch runs at a time; a second concurrent batch is
+        rejected with 503 and Retry-After.
+
+        Args:
+            passwords: Plain text passwords
+
+        Returns:
+            Hashes in the order of passwords
+
+        Raises:
+            HTTPException: 503 if another batch is still being hashed
+        """
+        if not passwords:
+            return []
+        # A few chunks per thread keeps the threads busy until the end
+        chunk_size = max(1, -(-len(passwords) // (self.bulk_workers * 4)))
+        chunks = [passwords[i:i + chunk_size] for i in range(0, len(passwords), chunk_size)]
+
+        with self._lock:
+            if self._bulk_chunks:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Another bulk registration is being processed, please retry",
+                    headers={"Retry-After": str(self.retry_after_seconds)},
+                )
+            self._bulk_chunks = len(chunks)
+            if self._bulk_executor is None:
+                self._bulk_executor = ThreadPoolExecutor(
+                    max_workers=self.bulk_workers,
+                    thread_name_prefix="password-bulk"
+                )
+            executor = self._bulk_executor
+
+        futures = []
+        try:
+            for chunk in chunks:
+                future = executor.submit(self._hash_chunk, chunk)
+                future.add_done_callback(self._release_bulk)
+                futures.append(future)
+        except BaseException:
+            # Chunks that were never submitted will not release themselves
+            with self._lock:
+                self._bulk_chunks -= len(chunks) - len(futures)
+            raise
+        results = await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+        return [hashed for chunk in results for hashed in chunk]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get executor statistics.
+
+        Returns:
+            Limits, in-flight operations and completed/rejected counters
+        """
+        with self._lock:
+            return {
+                "rounds": self.rounds,
+                "max_workers": self.max_workers,
+                "max_pending": self.max_pending,
+                "in_flight": self._in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "bulk_workers": self.bulk_workers,
+                "bulk_running": self._bulk_chunks > 0,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the password threads if they were started.
+
+        Args:
+            wait: Wait for running operations to finish
+        """
+        with self._lock:
+            executors = (self._executor, self._bulk_executor)
+            self._executor = self._bulk_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=wait)
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many concurrent password operations, please retry",
+                    headers={"Retry-After": str(self.retry_after_seconds)},
+                )
+            self._in_flight += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password"
+                )
+            executor = self._executor
+
+        # Released when the thread finishes, even if the request was cancelled
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _hash_chunk(self, passwords: Sequence[str]) -> List[str]:
+        return [self.context.hash(password) for password in passwords]
+
+    def _release_bulk(self, _future: Any) -> None:
+        with self._lock:
+            self._bulk_chunks -= 1
+            self.completed += 1
+
+    def _release(self, _future: Any) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self.completed += 1
+
+
+# Global hasher shared by the authentication code in this process
+password_hasher = PasswordHasher(
+    rounds=settings.security.bcrypt_rounds,
+    max_workers=settings.security.password_workers,
+    max_pending=settings.security.password_max_pending,
+    retry_after_seconds=settings.security.password_retry_after_seconds,
+    bulk_workers=settings.security.password_bulk_workers,
+)
@@ -0,0 +1,217 @@
+"""
+In-memory cache of authenticated users.
+
+Every protected route resolves the user named in the access token. Serving
+that lookup from memory removes a database round trip from every
+authenticated request. Entries expire after a short TTL and are dropped
+explicitly whenever a user is updated, disabled or deleted.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..core.config import settings
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """
+    Immutable snapshot of a user row.
+
+    ORM instances are bound to the session of the request that loaded them,
+    so the cache stores plain copies that can be shared between requests
+    and threads.
+    """
+    username: str
+    email: Optional[str]
+    full_name: Optional[str]
+    disabled: bool
+    hashed_password: str
+
+    @classmethod
+    def from_model(cls, user: Any) -> "CachedUser":
+        """Copy the fields of a UserInAlchemy instance."""
+        return cls(
+            username=user.username,
+            email=user.email,
+            full_name=user.full_name,
+            disabled=bool(user.disabled),
+            hashed_password=user.hashed_password,
+        )
+
+
+class UserCache:
+    """
+    Thread-safe LRU cache of users with a per-entry TTL.
+
+    Lookups that miss call a loader; a load that overlaps an invalidation
+    of the same user is not cached, so a stale row can never outlive the
+    update that replaced it.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached users
+            ttl_seconds: Lifetime of an entry in seconds (0 disables caching)
+        """
+        self.max_size = max(0, max_size)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, CachedUser]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are cached at all."""
+        return self.ttl_seconds > 0 and self.max_size > 0
+
+    def get(self, username: str) -> Optional[CachedUser]:
+        """
+        Get a cached user.
+
+        Args:
+            username: Username to look up
+
+        Returns:
+            Cached user or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, user = entry
+            if expires_at <= time.monotonic():
+                del self._entries[username]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(username)
+            self.hits += 1
+            return user
+
+    def get_or_load(self, username: str, loader: Callable[[], Any]) -> Optional[CachedUser]:
+        """
+        Get a user from the cache, loading and caching it on a miss.
+
+        Args:
+            username: Username to look up
+            loader: Callable returning the UserInAlchemy row or None
+
+        Returns:
+            Cached user snapshot, or None if the user does not exist
+        """
+        user = self.get(username)
+        if user is not None:
+            return user
+
+        with self._lock:
+            generation = (self._epoch, self._generations.get(username, 0))
+        model = loader()
+        if model is None:
+            return None
+        user = CachedUser.from_model(model)
+        self._put(username, user, generation)
+        return user
+
+    async def get_or_load_async(
+        self,
+        username: str,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Optional[CachedUser]:
+        """
+        Async variant of get_or_load for loaders that query an AsyncSession.
+
+        Args:
+            username: Username to look up
+            loader: Coroutine function returning the UserInAlchemy row or None
+
+        Returns:
+            Cached user snapshot, or None if the user does not exist
+        """
+        user = self.get(username)
+        if user is not None:
+            return user
+
+        with self._lock:
+            generation = (self._epoch, self._generations.get(username, 0))
+        model = await loader()
+        if model is None:
+            return None
+        user = CachedUser.from_model(model)
+        self._put(username, user, generation)
+        return user
+
+    def invalidate(self, username: str) -> None:
+        """
+        Drop a user, e.g. after it was updated, disabled or deleted.
+
+        Args:
+            username: Username to drop
+        """
+        with self._lock:
+            self._generations[username] = self._generations.get(username, 0) + 1
+            if self._entries.pop(username, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop all users."""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Size, limits, hit/miss counters and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "expirations": self.expirations,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _put(self, username: str, user: CachedUser, generation: Tuple[int, int]) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if (self._epoch, self._generations.get(username, 0)) != generation:
+                return
+            self._entries[username] = (time.monotonic() + self.ttl_seconds, user)
+            self._entries.move_to_end(username)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Global cache shared by the authentication dependencies in this process
+user_cache = UserCache(
+    max_size=settings.security.user_cache_max_size,
+    ttl_seconds=settings.security.user_cache_ttl_seconds,
+)
@@ -1,5 +1,6 @@
 from .check_validation import FileValidator
 from .class_finder import ClassFinder
+from .code_analyzer import CodeAnalyzer, FileAnalysis
 from .comment_finder import CommentFinder
 from .delete_file import FileDeleter
 from .email_validation_check import EmailValidator
@@ -12,6 +13,8 @@ from .path_finder import PathFinder
 __all__ = [
     'FileValidator',
     'ClassFinder',
+    'CodeAnalyzer',
+    'FileAnalysis',
     'CommentFinder',
     'FileDeleter',
     'EmailValidator',
@@ -0,0 +1,139 @@
+"""
+Running chunks of files on the analysis pool with per-file failures.
+
+Files are sent to the workers in batches to amortise the task overhead,
+but budgets (time, CPU, memory, nesting depth) are enforced per task. A
+batch that goes over its budget is therefore split and its files retried
+one per task: the files that fit are kept, and only the file that really
+exceeds the budget is reported, instead of failing the whole project.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from .analysis_executor import AnalysisBudgetError
+from .analysis_scheduler import AnalysisScheduler
+
+# (filename, source) pairs sent to one worker task
+Batch = List[Tuple[str, str]]
+# (filename, result) pairs returned by a worker task
+BatchResults = List[Tuple[str, Any]]
+
+
+def budget_failure(filename: str, error: AnalysisBudgetError) -> Dict[str, str]:
+    """
+    Describe a file whose analysis went over its budget.
+
+    Args:
+        filename: Relative path of the file
+        error: The budget error of its task
+
+    Returns:
+        Error entry with the file, the message and the exceeded budget
+    """
+    return {"file": filename, "error": error.detail["message"], "budget": error.budget}
+
+
+async def map_batches(
+    scheduler: AnalysisScheduler,
+    fn: Callable[[Batch], BatchResults],
+    batches: List[Batch],
+    store: Callable[[BatchResults], Awaitable[None]]
+) -> List[Dict[str, str]]:
+    """
+    Run batches through the scheduler, storing each successful batch.
+
+    Args:
+        scheduler: Admission control in front of the pool
+        fn: Module-level worker function taking one batch
+        batches: Batches to run
+        store: Coroutine function receiving the results of one batch
+
+    Returns:
+        Error entries of the files that went over budget
+
+    Raises:
+        HTTPException: 503 if the scheduler rejects the request
+    """
+    errors: List[Dict[str, str]] = []
+    retry: List[Batch] = []
+    await _collect(
+        batches, await scheduler.map(fn, batches, return_exceptions=True), store, retry, errors
+    )
+    if retry:
+        try:
+            results = await scheduler.map(fn, retry, return_exceptions=True)
+        except HTTPException as e:
+            # Saturated before the retry: report the split files instead of failing
+            errors.extend({"file": batch[0][0], "error": str(e.detail)} for batch in retry)
+        else:
+            # Single-file batches are never split again
+            await _collect(retry, results, store, [], errors)
+    return errors
+
+
+def run_batches(
+    executor: Any,
+    fn: Callable[[Batch], BatchResults],
+    batches: List[Batch],
+    store: Callable[[BatchResults], None],
+    finished: Optional[Callable[[int], None]] = None
+) -> List[Dict[str, str]]:
+    """
+    Blocking variant of map_batches that submits straight to a pool.
+
+    Args:
+        executor: Object with submit(fn, *args) returning a concurrent future
+        fn: Module-level worker function taking one batch
+        batches: Batches to run
+        store: Callable receiving the results of one batch
+        finished: Optional callback receiving the number of files done
+
+    Returns:
+        Error entries of the files that went over budget
+    """
+    errors: List[Dict[str, str]] = []
+    pending = {executor.submit(fn, batch): batch for batch in batches}
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            batch = pending.pop(future)
+            try:
+                results = future.result()
+            except AnalysisBudgetError as e:
+                if len(batch) > 1:
+                    for item in batch:
+                        pending[executor.submit(fn, [item])] = [item]
+                    continue
+                errors.append(budget_failure(batch[0][0], e))
+            else:
+                store(results)
+            if finished is not None:
+                finished(len(batch))
+    return errors
+
+
+async def _collect(
+    batches: List[Batch],
+    results: List[Any],
+    store: Callable[[BatchResults], Awaitable[None]],
+    retry: List[Batch],
+    errors: List[Dict[str, str]]
+) -> None:
+    """Store successful batches, queue split retries and record failures."""
+    unexpected: Optional[BaseException] = None
+    for batch, result in zip(batches, results):
+        if isinstance(result, AnalysisBudgetError):
+            if len(batch) > 1:
+                retry.extend([item] for item in batch)
+            else:
+                errors.append(budget_failure(batch[0][0], result))
+        elif isinstance(result, BaseException):
+            unexpected = unexpected or result
+        else:
+            await store(result)
+    # Successful batches are cached before an unexpected error propagates
+    if unexpected is not None:
+        raise unexpected
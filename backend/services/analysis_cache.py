@@ -0,0 +1,357 @@
+"""
+Content-addressed, in-process cache for analysis results.
+
+Entries are keyed by a hash of the analysed source plus the analyzer name
+and version, so identical bytes are parsed once no matter which route or
+which file name asks for them. The cache is bounded by an approximate
+memory budget and evicts least recently used entries first.
+
+An optional DiskAnalysisStore adds a persistent second tier shared by all
+workers on the host: puts are written through to it, load() falls back to
+it on a memory miss, and warm_start() fills a fresh worker's memory from
+the most recently used entries on disk.
+"""
+
+import hashlib
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from ..core.config import settings
+from .analysis_store import DiskAnalysisStore
+from .code_analyzer import ANALYZER_NAME, ANALYZER_VERSION, FileAnalysis
+from .syntax_checker import SYNTAX_CHECKER_NAME, SyntaxCheck
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(content: str) -> str:
+    """
+    Hash source text for content addressing.
+
+    Args:
+        content: Source text
+
+    Returns:
+        Hex encoded SHA-256 digest of the UTF-8 encoded text
+    """
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class AnalysisCache:
+    """
+    Thread-safe LRU cache with a memory budget and hit/miss counters.
+
+    Besides content keys, the cache tracks which user file last resolved
+    to which key so that uploads and deletions can drop stale entries.
+    """
+
+    def __init__(self, max_bytes: int, store: Optional[DiskAnalysisStore] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Memory budget for cached values in bytes
+            store: Optional persistent tier behind the memory cache
+        """
+        self.max_bytes = max_bytes
+        self.store = store
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._current_bytes = 0
+        self._path_keys: Dict[str, str] = {}
+        self._key_paths: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        if store is not None:
+            store.register(ANALYZER_NAME, FileAnalysis.from_dict)
+            store.register(SYNTAX_CHECKER_NAME, SyntaxCheck.from_dict)
+
+    @staticmethod
+    def make_key(
+        digest: str,
+        analyzer: str = ANALYZER_NAME,
+        version: str = ANALYZER_VERSION
+    ) -> str:
+        """
+        Build a cache key from a content hash and analyzer identity.
+
+        Args:
+            digest: Content hash of the analysed source
+            analyzer: Name of the analyzer that produced the value
+            version: Version of that analyzer
+
+        Returns:
+            Cache key
+        """
+        return f"{analyzer}:{version}:{digest}"
+
+    @staticmethod
+    def path_key(username: str, filename: str) -> str:
+        """
+        Build the key identifying a user's file.
+
+        Args:
+            username: Owner of the file
+            filename: File name relative to the user's upload directory
+
+        Returns:
+            Path key
+        """
+        return f"{username}/{filename}"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def load(self, key: str) -> Optional[Any]:
+        """
+        Look up a value in memory, then in the persistent store.
+
+        May block on disk I/O; async callers should use get() and run
+        load_stored() on the I/O pool.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if neither tier has it
+        """
+        value = self.get(key)
+        if value is None:
+            value = self.load_stored(key)
+        return value
+
+    def load_stored(self, key: str) -> Optional[Any]:
+        """
+        Look up a value in the persistent store and promote it into memory.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value or None on a miss or without a store
+        """
+        if self.store is None:
+            return None
+        value = self.store.get(key)
+        if value is not None:
+            with self._lock:
+                self.disk_hits += 1
+                self._insert(key, value, self._sizeof(value))
+        return value
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        path_key: Optional[str] = None,
+        persist: bool = True
+    ) -> None:
+        """
+        Store a value, evicting least recently used entries as needed.
+
+        Values larger than the whole budget are not kept in memory.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            path_key: Optional user file that resolved to this key
+            persist: Also write the value to the persistent store, which
+                may block; async callers pass False and run persist() on
+                the I/O pool
+        """
+        size = self._sizeof(value)
+        with self._lock:
+            if path_key is not None:
+                self._bind_path(path_key, key)
+            self._insert(key, value, size)
+        if persist:
+            self.persist(key, value)
+
+    def persist(self, key: str, value: Any) -> None:
+        """
+        Write a value to the persistent store, if there is one.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self.store is not None:
+            self.store.put(key, value)
+
+    def warm_start(self) -> int:
+        """
+        Fill memory from the most recently used entries of the store.
+
+        Stops once the memory budget is reached; entries already in memory
+        are kept.
+
+        Returns:
+            Number of entries loaded
+        """
+        if self.store is None:
+            return 0
+        loaded = 0
+        for key, value in self.store.recent():
+            size = self._sizeof(value)
+            with self._lock:
+                if self._current_bytes + size > self.max_bytes:
+                    break
+                if key in self._entries:
+                    continue
+                self._insert(key, value, size)
+            loaded += 1
+        logger.info("Warmed analysis cache with %d entries from %s", loaded, self.store.path)
+        return loaded
+
+    def bind_path(self, path_key: str, key: str) -> None:
+        """
+        Record that a user file currently resolves to a cache key.
+
+        Args:
+            path_key: Key identifying the user file
+            key: Cache key of its current content
+        """
+        with self._lock:
+            self._bind_path(path_key, key)
+
+    def invalidate_path(self, path_key: str) -> None:
+        """
+        Forget a user file and drop its entry if no other file shares it.
+
+        Args:
+            path_key: Key identifying the user file
+        """
+        with self._lock:
+            self._unbind_path(path_key)
+
+    def discard(self, key: str) -> None:
+        """
+        Drop a single entry if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        """Drop all entries and path bindings; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._path_keys.clear()
+            self._key_paths.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters and occupancy.
+
+        Returns:
+            Dictionary with hits, misses, hit rate, evictions and usage
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "disk_hits": self.disk_hits,
+                "disk": self.store.stats() if self.store is not None else None,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _insert(self, key: str, value: Any, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._current_bytes -= previous[1]
+        self._entries[key] = (value, size)
+        self._current_bytes += size
+        while self._current_bytes > self.max_bytes and self._entries:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._current_bytes -= evicted_size
+            self.evictions += 1
+
+    def _bind_path(self, path_key: str, key: str) -> None:
+        if self._path_keys.get(path_key) == key:
+            return
+        self._unbind_path(path_key)
+        self._path_keys[path_key] = key
+        self._key_paths.setdefault(key, set()).add(path_key)
+
+    def _unbind_path(self, path_key: str) -> None:
+        key = self._path_keys.pop(path_key, None)
+        if key is None:
+            return
+        paths = self._key_paths.get(key)
+        if paths is not None:
+            paths.discard(path_key)
+            if paths:
+                return
+            del self._key_paths[key]
+        self._discard(key)
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= entry[1]
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        approximate_size = getattr(value, "approximate_size", None)
+        if callable(approximate_size):
+            return approximate_size()
+        return sys.getsizeof(value)
+
+
+def create_disk_store() -> Optional[DiskAnalysisStore]:
+    """
+    Build the persistent analysis store configured in the settings.
+
+    Returns:
+        The store, or None if it is disabled
+    """
+    if not settings.analysis.disk_cache_path:
+        return None
+    return DiskAnalysisStore(
+        settings.analysis.disk_cache_path,
+        max_bytes=settings.analysis.disk_cache_max_bytes,
+    )
+
+
+# Global cache shared by all analysis routes in this process
+analysis_cache = AnalysisCache(
+    max_bytes=settings.analysis.cache_max_bytes,
+    store=create_disk_store(),
+)
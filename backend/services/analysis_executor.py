@@ -0,0 +1,480 @@
+"""
+Process pool for CPU-bound analysis work.
+
+Parsing is CPU-bound and holds the GIL, so it is fanned out to worker
+processes instead of threads. The pool is created lazily on first use and
+shared by every analysis service in the process.
+
+Every task runs under a budget, so a pathological upload (deep nesting,
+giant literals, million-line generated files) cannot take the API down:
+
+- the worker's address space is capped with RLIMIT_AS, so allocations
+  fail with MemoryError instead of exhausting the host;
+- each task gets RLIMIT_CPU seconds of CPU and a wall-clock alarm,
+  delivered as signals that abort the task inside the worker;
+- a watchdog in the API process kills the pool when a task overruns its
+  wall-clock timeout anyway (e.g. stuck in C code), and a pool whose
+  worker died is replaced on the next submission.
+
+Tasks over budget fail with AnalysisBudgetError (422). Killing a pool
+takes every task running in it down, so the other tasks are run again:
+after a timeout once more on the new pool (a second kill fails them with
+a retryable 503), after a worker died one at a time in a single-worker
+pool, where only the task that kills its worker is reported.
+"""
+
+import heapq
+import itertools
+import math
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+from fastapi import HTTPException, status
+
+from ..core.config import settings
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+class BudgetExceeded(Exception):
+    """Raised inside a worker process when a task exceeds a budget."""
+
+    def __init__(self, budget: str, limit: Optional[float]):
+        super().__init__(budget, limit)
+        self.budget = budget
+        self.limit = limit
+
+
+class AnalysisBudgetError(HTTPException):
+    """Error returned to the client when an analysis exceeded its budget."""
+
+    def __init__(self, budget: str, limit: Optional[float] = None):
+        messages = {
+            "time": "Analysis took longer than the allowed time",
+            "cpu": "Analysis used more CPU time than allowed",
+            "memory": "Analysis needed more memory than allowed",
+            "depth": "Code is nested too deeply to analyse",
+            "process": "Analysis worker process died",
+        }
+        super().__init__(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail={
+                "error": "analysis_exceeded_budget",
+                "budget": budget,
+                "limit": limit,
+                "message": messages.get(budget, "Analysis exceeded its budget"),
+            },
+        )
+        self.budget = budget
+
+
+class _BudgetSignal(BaseException):
+    """Raised by the worker signal handler; not an Exception, so analyzers cannot swallow it."""
+
+    def __init__(self, signum: int):
+        super().__init__(signum)
+        self.signum = signum
+
+
+def _raise_budget_signal(signum: int, frame: Any) -> None:
+    raise _BudgetSignal(signum)
+
+
+def init_worker(memory_limit_bytes: int) -> None:
+    """
+    Initialize a worker process: cap its memory and install budget handlers.
+
+    Args:
+        memory_limit_bytes: RLIMIT_AS for the process (0 = unlimited)
+    """
+    if resource is not None and memory_limit_bytes:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        limit = memory_limit_bytes if hard == resource.RLIM_INFINITY else min(memory_limit_bytes, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    for name in ("SIGXCPU", "SIGALRM"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), _raise_budget_signal)
+
+
+def run_with_budget(
+    fn: Callable[..., Any],
+    args: Sequence[Any],
+    cpu_seconds: float,
+    timeout_seconds: float,
+    memory_limit_bytes: int
+) -> Any:
+    """
+    Run a task inside a worker process under CPU and wall-clock budgets.
+
+    Args:
+        fn: Task function
+        args: Task arguments
+        cpu_seconds: CPU seconds the task may use (0 = unlimited)
+        timeout_seconds: Wall-clock seconds the task may take (0 = unlimited)
+        memory_limit_bytes: Address space limit, reported on MemoryError
+
+    Returns:
+        The task's result
+
+    Raises:
+        BudgetExceeded: If the task exceeded a budget
+    """
+    restore_cpu = None
+    if resource is not None and cpu_seconds:
+        # RLIMIT_CPU counts the whole process, so move it past the CPU used so far
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        limit = math.ceil(usage.ru_utime + usage.ru_stime + cpu_seconds)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+        restore_cpu = (soft, hard)
+    use_alarm = bool(timeout_seconds) and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.setitimer(signal.ITIMER_REAL, timeout_seconds)
+
+    try:
+        return fn(*args)
+    except _BudgetSignal as e:
+        if getattr(signal, "SIGXCPU", None) == e.signum:
+            raise BudgetExceeded("cpu", cpu_seconds) from None
+        raise BudgetExceeded("time", timeout_seconds) from None
+    except MemoryError:
+        raise BudgetExceeded("memory", memory_limit_bytes or None) from None
+    except RecursionError:
+        raise BudgetExceeded("depth", sys.getrecursionlimit()) from None
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        if restore_cpu is not None:
+            resource.setrlimit(resource.RLIMIT_CPU, restore_cpu)
+
+
+class _Watchdog:
+    """Single background thread calling back for futures still running at their deadline."""
+
+    def __init__(self, on_expire: Callable[[Future, Any], None]):
+        self._on_expire = on_expire
+        self._deadlines: List[Tuple[float, int, Future, Any]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, future: Future, seconds: float, context: Any) -> None:
+        with self._condition:
+            heapq.heappush(
+                self._deadlines,
+                (time.monotonic() + seconds, next(self._counter), future, context)
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="analysis-watchdog", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._deadlines:
+                    self._condition.wait()
+                deadline, _, future, context = self._deadlines[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._deadlines)
+            if not future.done():
+                self._on_expire(future, context)
+
+
+class AnalysisExecutor:
+    """
+    Lazily created, process-wide ProcessPoolExecutor with per-task budgets.
+
+    The pool is only started when analysis work is first submitted, so
+    importing the application does not spawn processes.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        start_method: str,
+        timeout_seconds: float = 0,
+        cpu_limit_seconds: float = 0,
+        memory_limit_mb: int = 0,
+        kill_grace_seconds: float = 5
+    ):
+        """
+        Initialize the executor wrapper.
+
+        Args:
+            max_workers: Number of worker processes (0 = number of CPUs)
+            start_method: multiprocessing start method for the workers
+            timeout_seconds: Wall-clock budget per task (0 = unlimited)
+            cpu_limit_seconds: CPU budget per task (0 = unlimited)
+            memory_limit_mb: Address space limit per worker process (0 = unlimited)
+            kill_grace_seconds: Time past the timeout before the pool is killed
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.start_method = start_method
+        self.timeout_seconds = timeout_seconds
+        self.cpu_limit_seconds = cpu_limit_seconds
+        self.memory_limit_bytes = memory_limit_mb * 1024 * 1024
+        self.kill_grace_seconds = kill_grace_seconds
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._watchdog = _Watchdog(self._expire)
+        self._expired: Set[Future] = set()
+        # Pools killed because one of their tasks overran its timeout
+        self._killed: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+        # Tasks whose worker pool died, rerun one at a time to find the culprit
+        self._isolated: Optional[ProcessPoolExecutor] = None
+        self._isolation: Deque[Tuple[Callable[..., Any], Sequence[Any], Future]] = deque()
+        self._isolating = False
+        self.restarts = 0
+        self.budget_errors: Dict[str, int] = {}
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """The underlying pool, started on first access."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._new_pool(self.max_workers)
+            return self._executor
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Run a picklable function in a worker process under the task budgets.
+
+        Args:
+            fn: Module-level function to run
+            *args: Picklable arguments
+
+        Returns:
+            Future for the result; fails with AnalysisBudgetError if the
+            task exceeded a budget or its worker died while it ran alone,
+            or with a 503 HTTPException if other tasks' timeouts killed it
+            twice
+        """
+        outer: Future = Future()
+        outer.set_running_or_notify_cancel()
+        self._start(fn, args, outer, retried=False, isolated=False)
+        return outer
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Budgets, pool restarts and budget errors by kind
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "timeout_seconds": self.timeout_seconds,
+                "cpu_limit_seconds": self.cpu_limit_seconds,
+                "memory_limit_bytes": self.memory_limit_bytes,
+                "restarts": self.restarts,
+                "budget_errors": dict(self.budget_errors),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes if they were started.
+
+        Args:
+            wait: Wait for running tasks to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            isolated, self._isolated = self._isolated, None
+        for pool in (executor, isolated):
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _new_pool(self, max_workers: int) -> ProcessPoolExecutor:
+        """Create a worker pool running the budget initializer."""
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(self.start_method),
+            initializer=init_worker,
+            initargs=(self.memory_limit_bytes,),
+        )
+
+    def _pool(self, isolated: bool) -> ProcessPoolExecutor:
+        """The shared pool, or the single-worker pool for isolated reruns."""
+        if not isolated:
+            return self.executor
+        with self._lock:
+            if self._isolated is None:
+                self._isolated = self._new_pool(1)
+            return self._isolated
+
+    def _start(
+        self,
+        fn: Callable[..., Any],
+        args: Sequence[Any],
+        outer: Future,
+        retried: bool,
+        isolated: bool
+    ) -> None:
+        """Submit one attempt of a task."""
+        call = (
+            run_with_budget, fn, args,
+            self.cpu_limit_seconds, self.timeout_seconds, self.memory_limit_bytes
+        )
+        pool = self._pool(isolated)
+        try:
+            inner = pool.submit(*call)
+        except BrokenProcessPool:
+            self._restart(pool)
+            pool = self._pool(isolated)
+            inner = pool.submit(*call)
+
+        if self.timeout_seconds:
+            self._watchdog.watch(inner, self.timeout_seconds + self.kill_grace_seconds, pool)
+        inner.add_done_callback(
+            lambda done: self._settle(done, outer, pool, fn, args, retried, isolated)
+        )
+
+    def _settle(
+        self,
+        inner: Future,
+        outer: Future,
+        pool: ProcessPoolExecutor,
+        fn: Callable[..., Any],
+        args: Sequence[Any],
+        retried: bool,
+        isolated: bool
+    ) -> None:
+        """Copy the worker's outcome to the caller's future, translating budget failures."""
+        try:
+            self._resolve(inner, outer, pool, fn, args, retried, isolated)
+        finally:
+            if isolated:
+                self._run_isolated(finished=True)
+
+    def _resolve(
+        self,
+        inner: Future,
+        outer: Future,
+        pool: ProcessPoolExecutor,
+        fn: Callable[..., Any],
+        args: Sequence[Any],
+        retried: bool,
+        isolated: bool
+    ) -> None:
+        """Translate a finished attempt into the caller's outcome, or rerun it."""
+        expired = inner in self._expired
+        self._expired.discard(inner)
+        if inner.cancelled():
+            outer.set_exception(CancelledError())
+            return
+        error = inner.exception()
+        if error is None:
+            outer.set_result(inner.result())
+            return
+
+        if isinstance(error, BudgetExceeded):
+            error = AnalysisBudgetError(error.budget, error.limit)
+        elif isinstance(error, BrokenProcessPool):
+            self._restart(pool)
+            if expired:
+                error = AnalysisBudgetError("time", self.timeout_seconds)
+            elif isolated:
+                # It ran alone, so its own worker died
+                error = AnalysisBudgetError("process")
+            elif pool not in self._killed:
+                # A worker died and any task of the pool may have killed it
+                self._isolate(fn, args, outer)
+                return
+            elif not retried:
+                # Killed for another task's timeout: run it once more on the new pool
+                try:
+                    self._start(fn, args, outer, retried=True, isolated=False)
+                except Exception as e:
+                    outer.set_exception(e)
+                return
+            else:
+                # Killed twice for other tasks' timeouts; nothing wrong with this one
+                error = HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Analysis was interrupted, please retry",
+                    headers={"Retry-After": "1"},
+                )
+        if isinstance(error, AnalysisBudgetError):
+            with self._lock:
+                self.budget_errors[error.budget] = self.budget_errors.get(error.budget, 0) + 1
+        outer.set_exception(error)
+
+    def _isolate(self, fn: Callable[..., Any], args: Sequence[Any], outer: Future) -> None:
+        """Queue a task for a rerun on its own in the single-worker pool."""
+        with self._lock:
+            self._isolation.append((fn, args, outer))
+        self._run_isolated(finished=False)
+
+    def _run_isolated(self, finished: bool) -> None:
+        """Start the next isolated rerun once the previous one has settled."""
+        while True:
+            with self._lock:
+                if finished:
+                    self._isolating = False
+                    finished = False
+                if self._isolating or not self._isolation:
+                    return
+                self._isolating = True
+                fn, args, outer = self._isolation.popleft()
+            try:
+                self._start(fn, args, outer, retried=True, isolated=True)
+                return
+            except Exception as e:
+                outer.set_exception(e)
+                finished = True
+
+    def _expire(self, inner: Future, pool: ProcessPoolExecutor) -> None:
+        """Kill the pool of a task that ignored its in-worker alarm."""
+        self._expired.add(inner)
+        self._killed.add(pool)
+        self._restart(pool)
+
+    def _restart(self, pool: ProcessPoolExecutor) -> None:
+        """Discard a broken or stuck pool; the next submission starts a new one."""
+        with self._lock:
+            if self._executor is pool:
+                self._executor = None
+            elif self._isolated is pool:
+                self._isolated = None
+            else:
+                return
+            self.restarts += 1
+        # Killing the workers fails every task of the pool with BrokenProcessPool
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            try:
+                process.kill()
+            except (OSError, ValueError):
+                pass
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Global pool shared by the analysis services in this process
+analysis_executor = AnalysisExecutor(
+    max_workers=settings.analysis.max_workers,
+    start_method=settings.analysis.worker_start_method,
+    timeout_seconds=settings.analysis.timeout_seconds,
+    cpu_limit_seconds=settings.analysis.cpu_limit_seconds,
+    memory_limit_mb=settings.analysis.memory_limit_mb,
+    kill_grace_seconds=settings.analysis.kill_grace_seconds,
+)
@@ -0,0 +1,227 @@
+"""
+Admission control for analysis work started by HTTP requests.
+
+Parsing is CPU-bound. Run on the event loop or the file I/O threads, a
+few huge files are enough to stall /health and the file routes for every
+user. The scheduler sends parses to the analysis process pool, caps how
+many this process runs at once and lets only a bounded number of requests
+wait for a slot; beyond that requests fail fast with 503 and Retry-After
+instead of piling up.
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Sequence, TypeVar
+
+from fastapi import HTTPException, status
+
+from ..core.config import settings
+from .analysis_executor import analysis_executor
+
+T = TypeVar("T")
+
+# Queue waits kept for the percentiles reported by stats()
+WAIT_SAMPLES = 1024
+
+
+class AnalysisScheduler:
+    """
+    Concurrency cap and bounded FIFO wait queue in front of a worker pool.
+
+    Slots are handed directly from a finishing task to the oldest waiter,
+    so waiting requests are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        executor: Any,
+        max_concurrency: int,
+        max_queue: int,
+        retry_after_seconds: int = 1
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            executor: Object with submit(fn, *args) returning a concurrent future
+            max_concurrency: Tasks allowed to run at once
+            max_queue: Requests allowed to wait for a slot
+            retry_after_seconds: Retry-After value for rejected requests
+        """
+        self.executor = executor
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.retry_after_seconds = retry_after_seconds
+        self._lock = threading.Lock()
+        self._running = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self.admitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.max_wait_seconds = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a picklable function on the pool once a slot is free.
+
+        Args:
+            fn: Module-level function to run
+            *args: Picklable arguments
+
+        Returns:
+            The function's result
+
+        Raises:
+            HTTPException: 503 with Retry-After if the wait queue is full
+        """
+        self._admit()
+        return await self._execute(fn, args)
+
+    async def map(
+        self,
+        fn: Callable[[Any], T],
+        items: Sequence[Any],
+        return_exceptions: bool = False
+    ) -> List[T]:
+        """
+        Run fn for each item, admitting the whole request at once.
+
+        The request counts as a single entry of the wait queue, so a large
+        request cannot be rejected halfway through: it waits for one slot
+        at a time and rejoins the back of the queue for the next, so
+        requests arriving meanwhile take turns with its tasks instead of
+        queueing behind all of them.
+
+        Args:
+            fn: Module-level function taking one item
+            items: Picklable items
+            return_exceptions: Return the exception of a failed item in
+                its place instead of raising the first one
+
+        Returns:
+            Results in the order of items
+
+        Raises:
+            HTTPException: 503 with Retry-After if the wait queue is full
+        """
+        if not items:
+            return []
+        self._admit()
+        tasks = []
+        for item in items:
+            await self._acquire_timed()
+            tasks.append(self._submit(fn, (item,)))
+        return list(await asyncio.gather(*tasks, return_exceptions=return_exceptions))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler statistics.
+
+        Returns:
+            Limits, running and queued tasks, counters and queue wait times
+        """
+        with self._lock:
+            waits = sorted(self._waits)
+            return {
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": len(self._waiters),
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "completed": self.completed,
+                "queue_wait_seconds": {
+                    "mean": statistics.fmean(waits) if waits else 0.0,
+                    "p50": waits[len(waits) // 2] if waits else 0.0,
+                    "p95": waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0,
+                    "max": self.max_wait_seconds,
+                },
+            }
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self._running >= self.max_concurrency and len(self._waiters) >= self.max_queue:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Analysis is at capacity, please retry",
+                    headers={"Retry-After": str(self.retry_after_seconds)},
+                )
+            self.admitted += 1
+
+    async def _execute(self, fn: Callable[..., T], args: Sequence[Any]) -> T:
+        await self._acquire_timed()
+        return await self._submit(fn, args)
+
+    async def _acquire_timed(self) -> None:
+        enqueued_at = time.monotonic()
+        await self._acquire()
+        self._record_wait(time.monotonic() - enqueued_at)
+
+    def _submit(self, fn: Callable[..., T], args: Sequence[Any]) -> "asyncio.Future[T]":
+        """Start a task on a slot already taken; the slot is freed when it ends."""
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        # Released when the worker finishes, even if the request was cancelled
+        future.add_done_callback(lambda _future: self._release(completed=True))
+        return asyncio.wrap_future(future)
+
+    async def _acquire(self) -> None:
+        """Take a slot, waiting in FIFO order if none is free."""
+        with self._lock:
+            if self._running < self.max_concurrency and not self._waiters:
+                self._running += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self._release()
+            raise
+
+    def _release(self, completed: bool = False) -> None:
+        """Hand the slot to the oldest waiter, or free it."""
+        with self._lock:
+            if completed:
+                self.completed += 1
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.get_loop().call_soon_threadsafe(self._wake, waiter)
+            else:
+                self._running -= 1
+
+    def _wake(self, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            # Cancelled between the hand-over and now: pass the slot on
+            self._release()
+        else:
+            waiter.set_result(None)
+
+    def _record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._waits.append(seconds)
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+
+# Global scheduler for analysis started by requests in this process
+analysis_scheduler = AnalysisScheduler(
+    executor=analysis_executor,
+    max_concurrency=settings.analysis.max_concurrency or analysis_executor.max_workers,
+    max_queue=settings.analysis.max_queue,
+    retry_after_seconds=settings.analysis.retry_after_seconds,
+)
@@ -0,0 +1,230 @@
+"""
+Analysis service for serving code analysis results.
+
+This module provides the AnalysisService class that reads a user's file,
+looks up its FileAnalysis in the content-addressed cache (memory first,
+then the persistent store) and only parses the file when the exact same
+content has not been analysed before.
+Concurrent async requests for the same content share one parse, which
+runs on the analysis process pool under the scheduler's admission control.
+Freshly uploaded files can be analysed in the background ahead of the
+first request for them.
+"""
+
+import asyncio
+import logging
+import sys
+from typing import List, Optional, Set, Tuple
+
+from fastapi import HTTPException, status
+
+from ..core.config import settings
+
+from .base_service import BaseService
+from .analysis_cache import AnalysisCache, analysis_cache, content_hash
+from .analysis_executor import AnalysisBudgetError
+from .analysis_scheduler import AnalysisScheduler, analysis_scheduler
+from .code_analyzer import CodeAnalyzer, FileAnalysis
+from .file_io import FileIO, file_io
+from .check_validation import FileValidator
+from .file_reader import FileReader
+from .path_finder import PathFinder
+from .project_workspace import WorkspaceRegistry, project_workspaces
+from .single_flight import SingleFlight, analysis_flights
+from .uploaded_dir import get_user_upload_dir
+
+logger = logging.getLogger(__name__)
+
+# Running warm-ups; the event loop only keeps weak references to tasks
+_prewarm_tasks: Set["asyncio.Task[None]"] = set()
+
+
+class AnalysisService(BaseService[AnalysisCache]):
+    """
+    Service class for code analysis operations.
+
+    All analysis routes go through this service so that the class,
+    function, method and comment views of one file share a single parse.
+    """
+
+    def __init__(
+        self,
+        cache: AnalysisCache = analysis_cache,
+        io: FileIO = file_io,
+        flights: SingleFlight = analysis_flights,
+        scheduler: AnalysisScheduler = analysis_scheduler,
+        workspaces: WorkspaceRegistry = project_workspaces
+    ):
+        """
+        Initialize the analysis service.
+
+        Args:
+            cache: Analysis result cache used as the data source
+            io: Thread pool used by the async entry points
+            flights: Coalescer for concurrent identical analyses
+            scheduler: Admission control for parses started by requests
+            workspaces: Project workspaces to notify when files change
+        """
+        super().__init__(cache)
+        self.io = io
+        self.flights = flights
+        self.scheduler = scheduler
+        self.workspaces = workspaces
+
+    def analyze_file(self, filename: str, username: str) -> FileAnalysis:
+        """
+        Get the analysis of one of the user's uploaded files.
+
+        Args:
+            filename: Relative path of the file to analyze
+            username: Username of the file owner
+
+        Returns:
+            FileAnalysis for the current file content
+
+        Raises:
+            HTTPException: If the file is not found or not a Python file
+        """
+        filename = PathFinder.normalize(filename)
+        uploaded_dir = get_user_upload_dir(username)
+        content = FileReader.read_file(filename, uploaded_dir)
+        return self.analyze_source(
+            content,
+            path_key=AnalysisCache.path_key(username, filename)
+        )
+
+    async def analyze_file_async(self, filename: str, username: str) -> FileAnalysis:
+        """
+        Non-blocking variant of analyze_file for async route handlers.
+
+        The file is read on the I/O pool and, on a cache miss, parsed in a
+        worker process, so neither blocks the event loop. Concurrent
+        requests for the same user, content and analyzer wait for a single
+        parse.
+
+        Args:
+            filename: Relative path of the file to analyze
+            username: Username of the file owner
+
+        Returns:
+            FileAnalysis for the current file content
+
+        Raises:
+            HTTPException: If the file is not found or not a Python file,
+                or 503 if the analysis workers are saturated
+        """
+        filename = PathFinder.normalize(filename)
+        content, key = await self.io.run(self._read_and_key, filename, username)
+        path_key = AnalysisCache.path_key(username, filename)
+
+        analysis = await self.flights.do(
+            (username, key),
+            lambda: self._analyze_scheduled(content, key, path_key)
+        )
+        # Callers that joined another request's parse may use another name
+        self.repository.bind_path(path_key, key)
+        return analysis
+
+    def analyze_source(self, content: str, path_key: Optional[str] = None) -> FileAnalysis:
+        """
+        Get the analysis of source text, parsing it only on a cache miss.
+
+        Args:
+            content: Python source text
+            path_key: Optional key of the user file the content came from
+
+        Returns:
+            FileAnalysis for the content
+        """
+        return self._analyze_keyed(
+            content,
+            AnalysisCache.make_key(content_hash(content)),
+            path_key
+        )
+
+    def prewarm_files(self, filenames: List[str], username: str) -> List[str]:
+        """
+        Analyse files in the background so the first view is a cache hit.
+
+        The files are analysed one after another in a single task, so a
+        warm-up holds at most one place in the scheduler queue and never
+        crowds out interactive requests; it stops when the scheduler is
+        saturated. A request arriving mid warm-up joins the running parse.
+
+        Args:
+            filenames: Relative paths of the files to analyse
+            username: Username of the file owner
+
+        Returns:
+            Filenames queued for warm-up, at most ANALYSIS_PREWARM_MAX_FILES
+        """
+        queued = [
+            filename for filename in filenames if FileValidator.isPython(filename)
+        ][:settings.analysis.prewarm_max_files]
+        if queued:
+            task = asyncio.get_running_loop().create_task(self._prewarm(queued, username))
+            _prewarm_tasks.add(task)
+            task.add_done_callback(_prewarm_tasks.discard)
+        return queued
+
+    def invalidate_file(self, filename: str, username: str) -> None:
+        """
+        Drop cached analysis for a user's file after it changed or was removed.
+
+        The user's project workspace rescans on its next use.
+
+        Args:
+            filename: Name of the file
+            username: Username of the file owner
+        """
+        self.repository.invalidate_path(
+            AnalysisCache.path_key(username, PathFinder.normalize(filename))
+        )
+        self.workspaces.mark_stale(username)
+
+    async def _prewarm(self, filenames: List[str], username: str) -> None:
+        """Analyse files in order, giving up when the scheduler is saturated."""
+        for filename in filenames:
+            try:
+                await self.analyze_file_async(filename, username)
+            except HTTPException as e:
+                if e.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
+                    logger.info("Analysis warm-up for %s stopped: workers saturated", username)
+                    return
+                # Removed or replaced since the upload, or over budget
+                logger.debug("Analysis warm-up skipped %s/%s: %s", username, filename, e.detail)
+            except Exception:
+                logger.exception("Analysis warm-up failed for %s/%s", username, filename)
+
+    @staticmethod
+    def _read_and_key(filename: str, username: str) -> Tuple[str, str]:
+        """Read a user's file and compute its cache key (blocking)."""
+        content = FileReader.read_file(filename, get_user_upload_dir(username))
+        return content, AnalysisCache.make_key(content_hash(content))
+
+    async def _analyze_scheduled(self, content: str, key: str, path_key: str) -> FileAnalysis:
+        """Serve the analysis for a known cache key, parsing in a worker on a miss."""
+        analysis = self.repository.get(key)
+        if analysis is None:
+            analysis = await self.io.run(self.repository.load_stored, key)
+        if analysis is None:
+            analysis = await self.scheduler.run(CodeAnalyzer.analyze, content)
+            self.repository.put(key, analysis, path_key=path_key, persist=False)
+            await self.io.run(self.repository.persist, key, analysis)
+        return analysis
+
+    def _analyze_keyed(self, content: str, key: str, path_key: Optional[str]) -> FileAnalysis:
+        """Serve the analysis for a known cache key, parsing on a miss."""
+        analysis = self.repository.load(key)
+        if analysis is None:
+            try:
+                analysis = CodeAnalyzer.analyze(content)
+            except RecursionError:
+                # Reported like a worker's budget failure, and never cached
+                raise AnalysisBudgetError("depth", sys.getrecursionlimit()) from None
+            except MemoryError:
+                raise AnalysisBudgetError("memory") from None
+            self.repository.put(key, analysis, path_key=path_key)
+        elif path_key is not None:
+            self.repository.bind_path(path_key, key)
+        return analysis
@@ -0,0 +1,285 @@
+"""
+Persistent, on-disk tier of the analysis cache.
+
+Analysis results are content-addressed, so they stay valid across deploys
+until the analyzer version changes. DiskAnalysisStore keeps them in a
+SQLite file as zlib-compressed JSON, bounded by a size cap with least
+recently used eviction. SQLite in WAL mode lets every Uvicorn worker on
+the host read and write the same file concurrently.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        accessed_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)",
+    "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO meta (name, value) VALUES ('total_bytes', 0)",
+)
+
+
+class DiskAnalysisStore:
+    """
+    SQLite-backed key/value store for serialized analyses.
+
+    Values are stored as compressed JSON of their to_dict() form and
+    rebuilt with the decoder registered for the key's analyzer. Failures
+    are logged and reported as misses: the store only makes analysis
+    faster, it is never the reason a request fails.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int,
+        busy_timeout_ms: int = 5000,
+        touch_interval_seconds: float = 60.0
+    ):
+        """
+        Initialize the store; the database file is created on first use.
+
+        Args:
+            path: SQLite database file
+            max_bytes: Cap on the compressed size of all entries
+            busy_timeout_ms: How long to wait for another process's write lock
+            touch_interval_seconds: Minimum age of an access time before a
+                hit refreshes it; keeps hot reads from turning into writes
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.busy_timeout_ms = busy_timeout_ms
+        self.touch_interval_seconds = touch_interval_seconds
+        self._decoders: Dict[str, Callable[[Dict[str, Any]], Any]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+        self._initialized = False
+
+    def register(self, analyzer: str, decoder: Callable[[Dict[str, Any]], Any]) -> None:
+        """
+        Register how values produced by an analyzer are rebuilt.
+
+        Args:
+            analyzer: Analyzer name, the first segment of cache keys
+            decoder: Callable turning to_dict() output back into a value
+        """
+        self._decoders[analyzer] = decoder
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Load a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded value, or None on a miss or error
+        """
+        decoder = self._decoder(key)
+        if decoder is None:
+            return None
+        try:
+            db = self._connection()
+            row = db.execute(
+                "SELECT value, accessed_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count("misses")
+                return None
+            value = decoder(self._decode(row[0]))
+        except (OSError, sqlite3.Error, ValueError, KeyError, TypeError, zlib.error) as e:
+            self._failed("read", key, e)
+            return None
+        self._count("hits")
+
+        now = time.time()
+        if now - row[1] >= self.touch_interval_seconds:
+            try:
+                with self._transaction() as db:
+                    db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            except sqlite3.Error as e:
+                self._failed("touch", key, e)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting least recently used entries over the cap.
+
+        Values without a registered decoder or to_dict() are not stored.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        if self._decoder(key) is None or not callable(getattr(value, "to_dict", None)):
+            return
+        blob = zlib.compress(
+            json.dumps(value.to_dict(), separators=(",", ":")).encode("utf-8")
+        )
+        if len(blob) > self.max_bytes:
+            return
+        try:
+            with self._transaction() as db:
+                previous = db.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                db.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, blob, len(blob), time.time())
+                )
+                total = self._add_bytes(db, len(blob) - (previous[0] if previous else 0))
+                if total > self.max_bytes:
+                    self._evict(db, total)
+        except (OSError, sqlite3.Error) as e:
+            self._failed("write", key, e)
+            return
+        self._count("writes")
+
+    def recent(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over decodable entries, most recently used first.
+
+        Used to warm the in-memory cache of a freshly started worker.
+
+        Yields:
+            (key, value) pairs
+        """
+        try:
+            rows = self._connection().execute(
+                "SELECT key, value FROM entries ORDER BY accessed_at DESC"
+            )
+            for key, blob in rows:
+                decoder = self._decoder(key)
+                if decoder is None:
+                    continue
+                try:
+                    yield key, decoder(self._decode(blob))
+                except (ValueError, KeyError, TypeError, zlib.error) as e:
+                    self._failed("read", key, e)
+        except (OSError, sqlite3.Error) as e:
+            self._failed("scan", self.path, e)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Entry count, size, cap and hit/write/eviction/error counters
+        """
+        try:
+            db = self._connection()
+            entries = db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            total = db.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+        except (OSError, sqlite3.Error):
+            entries = total = None
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "path": self.path,
+                "entries": entries,
+                "bytes": total,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "errors": self.errors,
+            }
+
+    def _evict(self, db: sqlite3.Connection, total: int) -> None:
+        # Evict down to 90% of the cap so the next writes do not evict again
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        while total > target:
+            rows = db.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at LIMIT 256"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                if total <= target:
+                    break
+                db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                total -= size
+                evicted += 1
+        db.execute("UPDATE meta SET value = ? WHERE name = 'total_bytes'", (total,))
+        self._count("evictions", evicted)
+
+    @staticmethod
+    def _add_bytes(db: sqlite3.Connection, delta: int) -> int:
+        db.execute("UPDATE meta SET value = value + ? WHERE name = 'total_bytes'", (delta,))
+        return db.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+
+    @staticmethod
+    def _decode(blob: bytes) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(blob))
+
+    def _decoder(self, key: str) -> Optional[Callable[[Dict[str, Any]], Any]]:
+        return self._decoders.get(key.split(":", 1)[0])
+
+    def _connection(self) -> sqlite3.Connection:
+        """One connection per thread; sqlite3 connections are not shared."""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            with self._lock:
+                if not self._initialized:
+                    os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=self.busy_timeout_ms / 1000, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.db = db
+            if not self._initialized:
+                with _Transaction(db):
+                    for statement in _SCHEMA:
+                        db.execute(statement)
+                self._initialized = True
+        return db
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._connection())
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def _failed(self, operation: str, key: str, error: Exception) -> None:
+        self._count("errors")
+        logger.warning("Analysis store %s failed for %s: %s", operation, key, error)
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, so concurrent writers queue on the busy timeout."""
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db = db
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.db.execute("COMMIT")
+        else:
+            self.db.execute("ROLLBACK")
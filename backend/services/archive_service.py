@@ -0,0 +1,238 @@
+"""
+Archive service for uploading a whole project in one request.
+
+This module provides the ArchiveService class that extracts the Python
+files of an uploaded zip or tar(.gz) archive into the user's upload
+directory, keeping their relative paths.
+"""
+
+import os
+import posixpath
+import stat
+import tarfile
+import zipfile
+import zlib
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException, UploadFile, status
+
+from .base_service import BaseService
+from .analysis_service import AnalysisService
+from .check_validation import FileValidator
+from .file_writer import FileWriter
+from .path_finder import PathFinder
+from .uploaded_dir import get_user_upload_dir
+from ..core.config import settings
+
+# (member name, is regular file, opener returning a readable stream)
+ArchiveMember = Tuple[str, bool, Callable[[], IO[bytes]]]
+
+
+class ArchiveService(BaseService):
+    """
+    Service class for archive uploads.
+
+    Members are streamed to disk in chunks and the limits are checked on
+    the bytes actually decompressed, not on the sizes the archive claims,
+    so zip bombs are rejected before they fill the disk. Files are written
+    to uniquely named ".part" files and only moved into place once the
+    whole archive has been extracted, so a rejected archive leaves the
+    workspace unchanged and concurrent uploads never share a ".part" file.
+    """
+
+    def __init__(
+        self,
+        max_members: int = settings.file.archive_max_members,
+        max_total_size: int = settings.file.archive_max_total_size,
+        max_file_size: int = settings.file.max_file_size,
+        chunk_size: int = settings.file.upload_chunk_size
+    ):
+        """
+        Initialize the archive service.
+
+        Args:
+            max_members: Maximum number of archive entries
+            max_total_size: Maximum total bytes extracted
+            max_file_size: Maximum bytes extracted per file
+            chunk_size: Bytes copied per iteration
+        """
+        # Archive service doesn't need a repository as it works with the filesystem
+        self.max_members = max_members
+        self.max_total_size = max_total_size
+        self.max_file_size = max_file_size
+        self.chunk_size = chunk_size
+
+    def extract_archive(self, archive: UploadFile, username: str) -> Dict[str, Any]:
+        """
+        Extract the Python files of an uploaded archive for a user.
+
+        Args:
+            archive: Uploaded zip, tar or tar.gz file
+            username: Username of the file owner
+
+        Returns:
+            Extracted file paths, their count and the number of skipped members
+
+        Raises:
+            HTTPException: If the archive is invalid (400) or exceeds a limit (413)
+        """
+        if not FileValidator.isArchive(archive.filename or ""):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"File '{archive.filename}' is not a zip or tar archive"
+            )
+
+        uploaded_dir = get_user_upload_dir(username)
+        # relative path -> (".part" file, target)
+        written: Dict[str, Tuple[str, str]] = {}
+        created_dirs: List[str] = []
+        skipped = 0
+        total = 0
+        try:
+            for count, (name, is_file, opener) in enumerate(self._members(archive.file), 1):
+                if count > self.max_members:
+                    raise self._too_large(f"Archive has more than {self.max_members} members")
+                relative = self.safe_member_path(name)
+                if not is_file or relative is None or not FileValidator.isPython(relative):
+                    skipped += 1
+                    continue
+
+                target = os.path.join(uploaded_dir, *relative.split("/"))
+                self._make_parent_dirs(target, uploaded_dir, created_dirs)
+                if relative in written:
+                    # A repeated member replaces the earlier one, as on extraction
+                    FileWriter.remove_part_file(written.pop(relative)[0])
+                fd, part = FileWriter.create_part_file(target)
+                os.close(fd)
+                written[relative] = (part, target)
+                with opener() as source:
+                    total += self._copy_member(source, part, relative, self.max_total_size - total)
+
+            for part, target in written.values():
+                os.replace(part, target)
+        except (zipfile.BadZipFile, tarfile.TarError, EOFError, zlib.error) as e:
+            self._discard(written, created_dirs)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid archive: {str(e)}"
+            ) from e
+        except BaseException:
+            self._discard(written, created_dirs)
+            raise
+        finally:
+            archive.file.close()
+
+        analysis_service = AnalysisService()
+        files = sorted(written)
+        for relative in files:
+            analysis_service.invalidate_file(relative, username)
+
+        return {
+            "message": f"Successfully extracted {len(files)} file(s)",
+            "count": len(files),
+            "files": files,
+            "skipped": skipped,
+            "size": total
+        }
+
+    @staticmethod
+    def safe_member_path(name: str) -> Optional[str]:
+        """
+        Normalize an archive member name to a safe relative path.
+
+        Args:
+            name: Member name as stored in the archive
+
+        Returns:
+            Relative "/"-separated path, or None for entries that are not files
+            of the project (directories, macOS metadata)
+
+        Raises:
+            HTTPException: If the name is absolute or escapes the upload directory
+        """
+        name = name.replace("\\", "/")
+        if name.endswith("/") or posixpath.normpath(name) == ".":
+            return None
+        normalized = PathFinder.normalize(name)
+        parts = normalized.split("/")
+        if parts[0] == "__MACOSX" or "__pycache__" in parts:
+            return None
+        return normalized
+
+    def _members(self, fileobj: IO[bytes]) -> Iterator[ArchiveMember]:
+        """Iterate over the members of a zip or tar archive."""
+        if zipfile.is_zipfile(fileobj):
+            fileobj.seek(0)
+            yield from self._zip_members(fileobj)
+            return
+
+        fileobj.seek(0)
+        # Stream mode reads the archive sequentially, member by member
+        with tarfile.open(fileobj=fileobj, mode="r|*") as tar:
+            for member in tar:
+                yield member.name, member.isfile(), lambda member=member: tar.extractfile(member)
+
+    @staticmethod
+    def _zip_members(fileobj: IO[bytes]) -> Iterator[ArchiveMember]:
+        with zipfile.ZipFile(fileobj) as archive:
+            for info in archive.infolist():
+                is_symlink = stat.S_ISLNK(info.external_attr >> 16)
+                is_file = not info.is_dir() and not is_symlink
+                yield info.filename, is_file, lambda info=info: archive.open(info)
+
+    def _copy_member(self, source: IO[bytes], part_path: str, name: str, remaining: int) -> int:
+        """
+        Copy one member to disk in chunks, enforcing the size limits.
+
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        with open(part_path, "wb") as buffer:
+            while True:
+                chunk = source.read(self.chunk_size)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if self.max_file_size and written > self.max_file_size:
+                    raise self._too_large(
+                        f"Archive member '{name}' exceeds the maximum size of "
+                        f"{self.max_file_size} bytes"
+                    )
+                if self.max_total_size and written > remaining:
+                    raise self._too_large(
+                        f"Archive content exceeds the maximum total size of "
+                        f"{self.max_total_size} bytes"
+                    )
+                buffer.write(chunk)
+        return written
+
+    @staticmethod
+    def _discard(written: Dict[str, Tuple[str, str]], created_dirs: List[str]) -> None:
+        """Remove partial files and the directories created for them."""
+        for part, _ in written.values():
+            FileWriter.remove_part_file(part)
+        for path in reversed(created_dirs):
+            try:
+                os.rmdir(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _make_parent_dirs(target: str, root: str, created_dirs: List[str]) -> None:
+        """Create the parent directories of target, recording the new ones."""
+        missing = []
+        parent = os.path.dirname(target)
+        while parent != root and not os.path.isdir(parent):
+            missing.append(parent)
+            parent = os.path.dirname(parent)
+        for path in reversed(missing):
+            os.mkdir(path)
+            created_dirs.append(path)
+
+    @staticmethod
+    def _too_large(detail: str) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=detail
+        )
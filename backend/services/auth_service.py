@@ -15,6 +15,7 @@ from ..models.user import User
 from ..models.userInAlchemy import UserInAlchemy
 from ..models.token import Token, TokenData
 from ..security.oauth2 import create_access_token, decode_access_token
+from ..security.user_cache import CachedUser, user_cache
 
 
 class AuthService(BaseService[UserService]):
@@ -34,7 +35,7 @@ class AuthService(BaseService[UserService]):
         """
         super().__init__(user_service)
     
-    def login_user(self, username: str, password: str) -> Token:
+    async def login_user(self, username: str, password: str) -> Token:
         """
         Authenticate user and generate access token.
         
@@ -46,10 +47,11 @@ class AuthService(BaseService[UserService]):
             Token object with access token and type
             
         Raises:
-            HTTPException: If authentication fails
+            HTTPException: If authentication fails, or 503 if password
+                verification is saturated
         """
         # Authenticate user
-        user = self.repository.authenticate_user(username, password)
+        user = await self.repository.authenticate_user(username, password)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,15 +74,18 @@ class AuthService(BaseService[UserService]):
             token_type="bearer"
         )
     
-    def get_current_user(self, token: str) -> UserInAlchemy:
+    async def get_current_user(self, token: str) -> CachedUser:
         """
         Get current user from access token.
         
+        The user is served from the authentication cache, so repeated
+        requests with a valid token do not query the database.
+        
         Args:
             token: JWT access token
             
         Returns:
-            Current user instance
+            Current user snapshot
             
         Raises:
             HTTPException: If token is invalid or user not found
@@ -102,14 +107,17 @@ class AuthService(BaseService[UserService]):
         except JWTError:
             raise credentials_exception
         
-        # Get user from database
-        user = self.repository.get_user_by_username(username=token_data.username)
+        # Get user from the cache, falling back to the database
+        user = await user_cache.get_or_load_async(
+            token_data.username,
+            lambda: self.repository.get_user_by_username(username=token_data.username)
+        )
         if user is None:
             raise credentials_exception
             
         return user
     
-    def get_current_active_user(self, token: str) -> UserInAlchemy:
+    async def get_current_active_user(self, token: str) -> CachedUser:
         """
         Get current active user from access token.
         
@@ -117,12 +125,12 @@ class AuthService(BaseService[UserService]):
             token: JWT access token
             
         Returns:
-            Current active user instance
+            Current active user snapshot
             
         Raises:
             HTTPException: If user is inactive or token invalid
         """
-        current_user = self.get_current_user(token)
+        current_user = await self.get_current_user(token)
         
         if current_user.disabled:
             raise HTTPException(
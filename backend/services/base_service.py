@@ -5,11 +5,31 @@ This module provides abstract base classes for implementing services
 that contain business logic and coordinate between repositories.
 """
 
+import inspect
 from abc import ABC
-from typing import Generic, TypeVar
+from typing import Awaitable, Generic, TypeVar, Union
 
 # Generic types for service operations
 RepositoryType = TypeVar('RepositoryType')
+T = TypeVar('T')
+
+
+async def maybe_await(value: Union[T, Awaitable[T]]) -> T:
+    """
+    Await the result of a repository call if it is awaitable.
+    
+    Lets a service run unchanged on a synchronous repository (scripts,
+    tests) and on its async counterpart (endpoints).
+    
+    Args:
+        value: Plain result or awaitable returned by a repository method
+        
+    Returns:
+        The result
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
 
 
 class BaseService(ABC, Generic[RepositoryType]):
@@ -0,0 +1,271 @@
+"""
+Static call graph of an uploaded project.
+
+Call sites recorded by the analyzer are resolved to project functions and
+methods where the target is known statically: local and nested functions,
+names imported from other uploaded modules, ``self.method()`` and
+``super().method()`` through the class's MRO, and ``Class()`` to its
+``__init__`` (or to the class itself when it has none). Anything else
+becomes an external node named after the called expression.
+
+The graph is stored in compressed sparse row form: nodes are integers,
+and the edges of node ``n`` are ``targets[offsets[n]:offsets[n + 1]]`` in
+typed arrays, with a second index for the reverse direction. Memory grows
+with the number of distinct (caller, callee) pairs rather than call sites.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from .code_analyzer import FileAnalysis
+from .inheritance_graph import InheritanceGraph
+from .module_paths import module_name
+
+FUNCTION_KIND = "function"
+METHOD_KIND = "method"
+MODULE_KIND = "module"
+CLASS_KIND = "class"
+EXTERNAL_KIND = "external"
+
+NODE_KINDS = (FUNCTION_KIND, METHOD_KIND, MODULE_KIND, CLASS_KIND, EXTERNAL_KIND)
+
+# Caller name of module-level code
+MODULE_SCOPE = "<module>"
+
+_LOCALS = ".<locals>."
+
+
+class CallGraph:
+    """
+    Immutable call graph with integer node ids.
+
+    Built from a snapshot of a workspace; safe to read from any thread.
+    """
+
+    def __init__(self, version: int):
+        """
+        Initialize an empty graph; use build() to create a populated one.
+
+        Args:
+            version: Workspace version the graph was built from
+        """
+        self.version = version
+        self.names: List[str] = []
+        self.kinds = array("B")
+        self.files: List[str] = []
+        self.file_ids = array("i")
+        self.lines = array("I")
+        self.out_offsets = array("I", [0])
+        self.out_targets = array("I")
+        self.out_counts = array("I")
+        self.in_offsets = array("I", [0])
+        self.in_sources = array("I")
+        self.in_counts = array("I")
+        self._ids: Dict[str, int] = {}
+
+    @classmethod
+    def build(
+        cls,
+        analyses: Dict[str, FileAnalysis],
+        classes: InheritanceGraph,
+        version: int = 0
+    ) -> "CallGraph":
+        """
+        Build the call graph of a project.
+
+        Args:
+            analyses: Analyses by relative file path
+            classes: Inheritance graph of the same files
+            version: Workspace version of the snapshot
+
+        Returns:
+            Populated graph
+        """
+        graph = cls(version)
+        files = sorted(analyses)
+        graph.files = files
+        for file_id, filename in enumerate(files):
+            module = module_name(filename)
+            graph._add_node(f"{module}:{MODULE_SCOPE}", MODULE_KIND, file_id, 0)
+            for func in analyses[filename].functions:
+                graph._add_node(
+                    f"{module}:{func.qualname}",
+                    METHOD_KIND if func.parent_class else FUNCTION_KIND,
+                    file_id,
+                    func.line,
+                )
+
+        # (source << 32 | target) -> call count; merges names resolving to one target
+        edges: Dict[int, int] = {}
+        for filename in files:
+            analysis = analyses[filename]
+            module = module_name(filename)
+            owners = {func.qualname: func.parent_class for func in analysis.functions}
+            for call in analysis.calls:
+                source = graph._ids.get(f"{module}:{call.caller or MODULE_SCOPE}")
+                if source is None:
+                    continue
+                resolved = _resolve_call(classes, graph._ids, module, owners, call.caller, call.callee)
+                target = graph._ids.get(resolved) if resolved is not None else None
+                if target is None:
+                    target = graph._add_target(classes, resolved or call.callee)
+                key = source << 32 | target
+                edges[key] = edges.get(key, 0) + call.count
+
+        graph._index(edges)
+        return graph
+
+    @property
+    def node_count(self) -> int:
+        """Number of nodes."""
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of distinct caller/callee pairs."""
+        return len(self.out_targets)
+
+    def find(self, symbol: str) -> List[int]:
+        """
+        Find nodes by id, qualname, dotted path or bare name.
+
+        Args:
+            symbol: "module:qualname", "module.qualname", "qualname" or name
+
+        Returns:
+            Matching node ids; exact ids win over other matches
+        """
+        exact = self._ids.get(symbol)
+        if exact is not None:
+            return [exact]
+        matches = []
+        for node, name in enumerate(self.names):
+            module, _, qualname = name.partition(":")
+            if symbol in (qualname, f"{module}.{qualname}", qualname.rsplit(".", 1)[-1]):
+                matches.append(node)
+        return matches
+
+    def node(self, node: int) -> Dict[str, object]:
+        """
+        Describe a node.
+
+        Args:
+            node: Node id
+
+        Returns:
+            Id, name, kind, file and line of the node
+        """
+        file_id = self.file_ids[node]
+        return {
+            "id": node,
+            "name": self.names[node],
+            "kind": NODE_KINDS[self.kinds[node]],
+            "file": self.files[file_id] if file_id >= 0 else None,
+            "line": self.lines[node] or None,
+        }
+
+    def callees(self, node: int) -> List[Tuple[int, int]]:
+        """
+        List the nodes a node calls.
+
+        Args:
+            node: Node id
+
+        Returns:
+            (callee id, number of call sites) pairs
+        """
+        start, end = self.out_offsets[node], self.out_offsets[node + 1]
+        return list(zip(self.out_targets[start:end], self.out_counts[start:end]))
+
+    def callers(self, node: int) -> List[Tuple[int, int]]:
+        """
+        List the nodes calling a node.
+
+        Args:
+            node: Node id
+
+        Returns:
+            (caller id, number of call sites) pairs
+        """
+        start, end = self.in_offsets[node], self.in_offsets[node + 1]
+        return list(zip(self.in_sources[start:end], self.in_counts[start:end]))
+
+    def _add_node(self, name: str, kind: str, file_id: int, line: int) -> int:
+        node = self._ids.get(name)
+        if node is not None:
+            return node
+        node = len(self.names)
+        self._ids[name] = node
+        self.names.append(name)
+        self.kinds.append(NODE_KINDS.index(kind))
+        self.file_ids.append(file_id)
+        self.lines.append(line)
+        return node
+
+    def _add_target(self, classes: InheritanceGraph, name: str) -> int:
+        """Add a called class without __init__, or an external callee."""
+        node = classes.get(name)
+        if node is None:
+            return self._add_node(name, EXTERNAL_KIND, -1, 0)
+        return self._add_node(name, CLASS_KIND, bisect_left(self.files, node.file), node.line)
+
+    def _index(self, edges: Dict[int, int]) -> None:
+        """Lay out merged edges as forward and reverse CSR arrays."""
+        count = len(self.names)
+        keys = sorted(edges)
+        self.out_targets = array("I", (key & 0xFFFFFFFF for key in keys))
+        self.out_counts = array("I", (edges[key] for key in keys))
+        self.out_offsets = self._offsets((key >> 32 for key in keys), count)
+
+        reverse = sorted((key & 0xFFFFFFFF) << 32 | key >> 32 for key in keys)
+        self.in_sources = array("I", (key & 0xFFFFFFFF for key in reverse))
+        self.in_counts = array(
+            "I", (edges[(key & 0xFFFFFFFF) << 32 | key >> 32] for key in reverse)
+        )
+        self.in_offsets = self._offsets((key >> 32 for key in reverse), count)
+
+    @staticmethod
+    def _offsets(sorted_nodes, count: int) -> array:
+        offsets = array("I", bytes(4 * (count + 1)))
+        for node in sorted_nodes:
+            offsets[node + 1] += 1
+        for node in range(count):
+            offsets[node + 1] += offsets[node]
+        return offsets
+
+
+def _resolve_call(
+    classes: InheritanceGraph,
+    ids: Dict[str, int],
+    module: str,
+    owners: Dict[str, Optional[str]],
+    caller: str,
+    callee: str
+) -> Optional[str]:
+    """Resolve a called name to a function id, a class id or None."""
+    parts = callee.split(".")
+    owner = owners.get(caller)
+    if len(parts) == 2 and owner is not None:
+        class_id = f"{module}:{owner}"
+        if parts[0] in ("self", "cls"):
+            return classes.find_method(class_id, parts[1])
+        if parts[0] == "super()":
+            return classes.find_method(class_id, parts[1], after=class_id)
+
+    if len(parts) == 1:
+        # Functions nested in the caller or in the functions enclosing it
+        scope = caller
+        while scope:
+            nested = f"{module}:{scope}{_LOCALS}{callee}"
+            if nested in ids:
+                return nested
+            scope = scope.rsplit(_LOCALS, 1)[0] if _LOCALS in scope else ""
+
+    target = classes.resolve(module, callee)
+    if target is None:
+        return None
+    kind, value = target
+    if kind == "class":
+        return classes.find_method(value, "__init__") or value
+    return value if kind == "function" else None
@@ -0,0 +1,206 @@
+"""
+Call graph service for caller/callee queries on a user's project.
+
+This module provides the CallGraphService class that answers "who calls
+this" and "what does this call" from the user's project workspace, and
+exports the whole call graph page by page.
+"""
+
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from .base_service import BaseService
+from .file_io import FileIO, file_io
+from .project_workspace import ProjectWorkspace, WorkspaceRegistry, project_workspaces
+
+
+class CallGraphService(BaseService[WorkspaceRegistry]):
+    """Service class for static call graph queries."""
+
+    def __init__(
+        self,
+        workspaces: WorkspaceRegistry = project_workspaces,
+        io: FileIO = file_io
+    ):
+        """
+        Initialize the call graph service.
+
+        Args:
+            workspaces: Per-user project workspaces used as the data source
+            io: Thread pool that builds and slices call graphs off the event loop
+        """
+        super().__init__(workspaces)
+        self.io = io
+
+    async def get_callers(self, username: str, symbol: str, limit: int = 100) -> Dict[str, Any]:
+        """
+        List the functions calling a function or method.
+
+        Args:
+            username: Owner of the project
+            symbol: "module:qualname" node id, or a qualname, dotted path
+                or name that identifies a single node
+            limit: Maximum number of callers to return
+
+        Returns:
+            The node, its callers with their number of call sites, and
+            whether the list was truncated
+
+        Raises:
+            HTTPException: 404 if no node matches, 409 if a name matches
+                several nodes
+        """
+        return await self.io.run(
+            self._neighbours, await self.repository.get_synced(username), symbol, limit, False
+        )
+
+    async def get_callees(self, username: str, symbol: str, limit: int = 100) -> Dict[str, Any]:
+        """
+        List the functions a function or method calls.
+
+        Args:
+            username: Owner of the project
+            symbol: "module:qualname" node id, or a qualname, dotted path
+                or name that identifies a single node
+            limit: Maximum number of callees to return
+
+        Returns:
+            The node, its callees with their number of call sites, and
+            whether the list was truncated
+
+        Raises:
+            HTTPException: 404 if no node matches, 409 if a name matches
+                several nodes
+        """
+        return await self.io.run(
+            self._neighbours, await self.repository.get_synced(username), symbol, limit, True
+        )
+
+    async def export_graph(
+        self,
+        username: str,
+        limit: int = 1000,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of the call graph.
+
+        Nodes are returned in id order with their outgoing edges as
+        [callee id, call sites] pairs; edges may point to nodes of later
+        pages. Pass the returned next_cursor to get the following page.
+
+        Args:
+            username: Owner of the project
+            limit: Maximum number of nodes to return
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            Graph version and size, the nodes of the page and the next
+            cursor (None on the last page)
+
+        Raises:
+            HTTPException: 400 if the cursor is invalid, 409 if the project
+                changed since the first page
+        """
+        start = self._decode_cursor(cursor) if cursor else None
+        workspace = await self.repository.get_synced(username)
+        return await self.io.run(self._page, workspace, limit, start)
+
+    @staticmethod
+    def _neighbours(
+        workspace: ProjectWorkspace,
+        symbol: str,
+        limit: int,
+        outgoing: bool
+    ) -> Dict[str, Any]:
+        """Describe a node and its callees or callers (blocking)."""
+        graph = workspace.call_graph()
+        matches = graph.find(symbol)
+        if not matches:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Symbol not found"
+            )
+        if len(matches) > 1:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail={
+                    "message": "Symbol name is ambiguous",
+                    "matches": [graph.names[node] for node in matches],
+                }
+            )
+
+        node = matches[0]
+        edges = graph.callees(node) if outgoing else graph.callers(node)
+        # Most frequent first, then by id for a stable order
+        edges.sort(key=lambda edge: (-edge[1], edge[0]))
+        related: List[Dict[str, Any]] = []
+        for other, count in edges[:limit]:
+            details = graph.node(other)
+            details["calls"] = count
+            related.append(details)
+        return {
+            "symbol": graph.node(node),
+            "callees" if outgoing else "callers": related,
+            "truncated": len(edges) > limit,
+        }
+
+    @staticmethod
+    def _page(
+        workspace: ProjectWorkspace,
+        limit: int,
+        start: Optional[Tuple[int, int]]
+    ) -> Dict[str, Any]:
+        """Slice the workspace's call graph (blocking)."""
+        graph = workspace.call_graph()
+        offset = 0
+        if start is not None:
+            version, offset = start
+            if version != graph.version:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Project changed since the first page; restart the export"
+                )
+
+        end = min(offset + limit, graph.node_count)
+        nodes: List[Dict[str, Any]] = []
+        for node in range(offset, end):
+            details = graph.node(node)
+            details["calls"] = [[callee, count] for callee, count in graph.callees(node)]
+            nodes.append(details)
+        return {
+            "version": graph.version,
+            "node_count": graph.node_count,
+            "edge_count": graph.edge_count,
+            "nodes": nodes,
+            "next_cursor": (
+                CallGraphService._encode_cursor(graph.version, end)
+                if end < graph.node_count else None
+            ),
+        }
+
+    @staticmethod
+    def _encode_cursor(version: int, offset: int) -> str:
+        """Encode the graph version and next node id as an opaque page cursor."""
+        return base64.urlsafe_b64encode(f"{version}:{offset}".encode("ascii")).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[int, int]:
+        """Decode a page cursor into graph version and next node id."""
+        try:
+            version, offset = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("ascii").split(":")
+            start = (int(version), int(offset))
+        except (binascii.Error, UnicodeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        if start[1] < 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        return start
@@ -3,4 +3,8 @@ class FileValidator:
     def isPython(file_name: str) -> bool:
         if file_name.endswith(".py"):
             return True
-        return False
\ No newline at end of file
+        return False
+
+    @staticmethod
+    def isArchive(file_name: str) -> bool:
+        return file_name.lower().endswith((".zip", ".tar", ".tar.gz", ".tgz"))
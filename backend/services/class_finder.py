@@ -1,44 +1,16 @@
-import ast
+from typing import Union
+
+from .code_analyzer import CodeAnalyzer, FileAnalysis
+
 
 class ClassFinder:
     @staticmethod
-    def find_classes(python_code: str) -> list:
-        classes = []
-        lines = python_code.split("\n")
-
-        for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("class "):
-                # Remove inline comment if any
-                stripped = stripped.split("#")[0]
-                parts = stripped.split()
-                if len(parts) > 1:
-                    class_name = parts[1].split(":")[0].split("(")[0]
-                    classes.append(class_name)
-        return classes
+    def find_classes(python_code: Union[str, FileAnalysis]) -> list:
+        analysis = CodeAnalyzer.ensure_analysis(python_code)
+        return [cls.name for cls in analysis.classes]
     
     @staticmethod
-    def find_classes_with_parents(python_code: str):
-        code = '''
-            class Animal:
-                pass
-
-            class Dog(Animal):
-                pass
-
-            class Cat(Animal):
-                pass
-
-            class Bat(Mammal, Flyer):
-                pass
-
-            class Fish:
-                pass
-
-            class Shark(Fish):
-                pass
-            '''
-        
+    def find_classes_with_parents(python_code: Union[str, FileAnalysis]) -> dict:
         '''
         returns 
         classes :
@@ -46,23 +18,16 @@ class ClassFinder:
             Animal: [Dog, Cat]
             Fish: [Shark]
         }
+        for
+            class Animal: ...
+            class Dog(Animal): ...
+            class Cat(Animal): ...
+            class Fish: ...
+            class Shark(Fish): ...
         '''
-
+        analysis = CodeAnalyzer.ensure_analysis(python_code)
         parent_classes = {}
-        
-        lines = python_code.split("\n")
-        for line in lines:
-            line = line.strip().split("#")[0]
-            if line.startswith("class "):
-                # Extract class name and its parents
-                class_name = line.split("class ")[1].split(":")[0].strip()
-                if "(" in class_name:
-                    class_name, parents = class_name.split("(")
-                    class_name = class_name.strip()
-                    parents = [p.strip() for p in parents.strip(")").split(",")]
-                    for parent in parents:
-                        if parent not in parent_classes:
-                            parent_classes[parent] = []
-                        parent_classes[parent].append(class_name)
-
+        for cls in analysis.classes:
+            for parent in cls.bases:
+                parent_classes.setdefault(parent, []).append(cls.name)
         return parent_classes
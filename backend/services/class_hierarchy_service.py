@@ -0,0 +1,133 @@
+"""
+Class hierarchy service for project-wide inheritance queries.
+
+This module provides the ClassHierarchyService class that serves the
+"File -> Class -> Functions" view: every class of the user's project with
+its bases resolved across modules, and per class its C3 method resolution
+order and transitive subclasses.
+"""
+
+from typing import Any, Dict, List
+
+from fastapi import HTTPException, status
+
+from .base_service import BaseService
+from .file_io import FileIO, file_io
+from .inheritance_graph import ClassNode, InheritanceError, is_class_id
+from .project_workspace import ProjectWorkspace, WorkspaceRegistry, project_workspaces
+
+
+class ClassHierarchyService(BaseService[WorkspaceRegistry]):
+    """Service class for cross-module inheritance queries."""
+
+    def __init__(
+        self,
+        workspaces: WorkspaceRegistry = project_workspaces,
+        io: FileIO = file_io
+    ):
+        """
+        Initialize the class hierarchy service.
+
+        Args:
+            workspaces: Per-user project workspaces used as the data source
+            io: Thread pool that walks the inheritance graph off the event loop
+        """
+        super().__init__(workspaces)
+        self.io = io
+
+    async def get_hierarchy(self, username: str) -> Dict[str, Any]:
+        """
+        Get every class of the user's project with its resolved bases.
+
+        Args:
+            username: Owner of the project
+
+        Returns:
+            Classes grouped by file, and the external bases they use
+        """
+        workspace = await self.repository.get_synced(username)
+        return await self.io.run(self._hierarchy, workspace)
+
+    async def get_class(
+        self,
+        username: str,
+        class_id: str,
+        transitive: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Get one class with its method resolution order and subclasses.
+
+        Args:
+            username: Owner of the project
+            class_id: "module:qualname" id, or a class name or dotted path
+                that identifies a single class
+            transitive: Include indirect subclasses
+
+        Returns:
+            Class details; "mro" is None and "mro_error" is set when the
+            hierarchy is inconsistent
+
+        Raises:
+            HTTPException: 404 if no class matches, 409 if a name matches
+                several classes
+        """
+        workspace = await self.repository.get_synced(username)
+        return await self.io.run(self._class_details, workspace, class_id, transitive)
+
+    @staticmethod
+    def _hierarchy(workspace: ProjectWorkspace) -> Dict[str, Any]:
+        """List the workspace's classes (blocking)."""
+        with workspace.lock:
+            files: Dict[str, List[Dict[str, Any]]] = {}
+            external = set()
+            for node in workspace.classes.classes():
+                files.setdefault(node.file, []).append(ClassHierarchyService._node_dict(node))
+                external.update(base for base in node.bases if not is_class_id(base))
+        return {"files": files, "external_bases": sorted(external)}
+
+    @staticmethod
+    def _class_details(
+        workspace: ProjectWorkspace,
+        class_id: str,
+        transitive: bool
+    ) -> Dict[str, Any]:
+        """Describe one class (blocking)."""
+        with workspace.lock:
+            graph = workspace.classes
+            node = graph.get(class_id)
+            if node is None:
+                matches = graph.find(class_id)
+                if not matches:
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND,
+                        detail="Class not found"
+                    )
+                if len(matches) > 1:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail={"message": "Class name is ambiguous", "matches": matches}
+                    )
+                node = graph.get(matches[0])
+
+            details = ClassHierarchyService._node_dict(node)
+            try:
+                details["mro"] = list(graph.mro(node.id))
+                details["mro_error"] = None
+            except InheritanceError as e:
+                details["mro"] = None
+                details["mro_error"] = str(e)
+            details["subclasses"] = graph.subclasses(node.id, transitive=transitive)
+            return details
+
+    @staticmethod
+    def _node_dict(node: ClassNode) -> Dict[str, Any]:
+        return {
+            "id": node.id,
+            "name": node.name,
+            "qualname": node.qualname,
+            "module": node.module,
+            "file": node.file,
+            "line": node.line,
+            "bases": list(node.bases),
+            "methods": list(node.methods),
+        }
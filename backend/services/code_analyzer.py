@@ -0,0 +1,625 @@
+"""
+Single-pass analysis engine for Python source files.
+
+This module parses a file once (``ast`` for structure and docstrings,
+``tokenize`` for comments) and produces an immutable ``FileAnalysis`` result. The finder
+services (ClassFinder, FunctionFinder, ClassFunctionFinder, CommentFinder)
+are thin views over this result, so a file is parsed once no matter how
+many views are requested.
+"""
+
+import ast
+import inspect
+import io
+import tokenize
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+
+# Bump whenever the shape or semantics of FileAnalysis change so that
+# cached results produced by an older engine are not reused.
+ANALYZER_NAME = "file_analysis"
+ANALYZER_VERSION = "5"
+
+GLOBAL_FUNCTIONS_KEY = "Global_Functions"
+
+COMMENT_KIND = "comment"
+DOCSTRING_KIND = "docstring"
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Rough per-record cost of a small frozen dataclass and its tuple slot.
+_RECORD_OVERHEAD = 120
+
+
+@dataclass(frozen=True)
+class FunctionInfo:
+    """A function or method definition."""
+    name: str
+    qualname: str
+    line: int
+    end_line: Optional[int]
+    is_async: bool = False
+    decorators: Tuple[str, ...] = ()
+    parent_class: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ClassInfo:
+    """A class definition with its textual bases and direct methods."""
+    name: str
+    qualname: str
+    line: int
+    end_line: Optional[int]
+    bases: Tuple[str, ...] = ()
+    decorators: Tuple[str, ...] = ()
+    methods: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ImportInfo:
+    """
+    One name bound by an ``import`` or ``from ... import`` statement.
+
+    ``module`` is the imported module as written, without leading dots;
+    ``level`` counts those dots for relative imports. ``name`` is the
+    imported attribute of a ``from`` import (``"*"`` for star imports)
+    and None for plain imports. ``top_level`` is False for imports inside
+    functions and classes.
+    """
+    module: str
+    name: Optional[str]
+    asname: Optional[str]
+    line: int
+    level: int = 0
+    top_level: bool = True
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the record to plain JSON-compatible data.
+
+        Returns:
+            Dictionary representation of the record
+        """
+        return {
+            "module": self.module,
+            "name": self.name,
+            "asname": self.asname,
+            "line": self.line,
+            "level": self.level,
+            "top_level": self.top_level,
+        }
+
+
+@dataclass(frozen=True)
+class CallInfo:
+    """
+    Calls from one function to one callee name.
+
+    ``caller`` is the qualname of the calling function, or ``""`` for
+    module-level code. ``callee`` is the called expression as a dotted
+    name (``"helper"``, ``"self.save"``, ``"models.User"``,
+    ``"super().run"``); calls on other expressions are not recorded.
+    Repeated calls are merged: ``line`` is the first one and ``count``
+    the number of call sites.
+    """
+    caller: str
+    callee: str
+    line: int
+    count: int = 1
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the record to plain JSON-compatible data.
+
+        Returns:
+            Dictionary representation of the record
+        """
+        return {
+            "caller": self.caller,
+            "callee": self.callee,
+            "line": self.line,
+            "count": self.count,
+        }
+
+
+@dataclass(frozen=True)
+class CommentInfo:
+    """
+    A ``#`` comment or a docstring.
+
+    ``column`` is 0-based. ``inline`` is True for a comment that follows
+    code on the same line; docstrings are never inline.
+    """
+    line: int
+    text: str
+    column: int = 0
+    inline: bool = False
+    kind: str = COMMENT_KIND
+
+    @property
+    def is_docstring(self) -> bool:
+        """Whether this record is a docstring rather than a comment."""
+        return self.kind == DOCSTRING_KIND
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the record to plain JSON-compatible data.
+
+        Returns:
+            Dictionary representation of the record
+        """
+        return {
+            "line": self.line,
+            "column": self.column,
+            "text": self.text,
+            "inline": self.inline,
+            "kind": self.kind,
+        }
+
+
+@dataclass(frozen=True)
+class SyntaxErrorInfo:
+    """Location and message of the error that stopped parsing."""
+    message: str
+    line: Optional[int]
+    column: Optional[int]
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the error to plain JSON-compatible data.
+
+        Returns:
+            Dictionary representation of the error
+        """
+        return {"message": self.message, "line": self.line, "column": self.column}
+
+
+@dataclass(frozen=True)
+class FileAnalysis:
+    """
+    Immutable result of analysing one Python source file.
+
+    Classes and functions are listed in source order. ``functions`` holds
+    every function definition, including methods and nested functions.
+    ``comments`` holds ``#`` comments and docstrings ordered by position.
+    ``imports`` holds one record per imported name, in source order.
+    ``calls`` holds one record per (caller, callee name) pair.
+    When the file does not parse, ``syntax_error`` is set and the
+    structural fields are empty; comments are still reported up to the
+    point where tokenizing failed.
+    """
+    classes: Tuple[ClassInfo, ...] = ()
+    functions: Tuple[FunctionInfo, ...] = ()
+    comments: Tuple[CommentInfo, ...] = ()
+    imports: Tuple[ImportInfo, ...] = ()
+    calls: Tuple[CallInfo, ...] = ()
+    syntax_error: Optional[SyntaxErrorInfo] = None
+    line_count: int = 0
+    analyzer_version: str = field(default=ANALYZER_VERSION)
+
+    @property
+    def has_syntax_error(self) -> bool:
+        """Whether the source failed to parse."""
+        return self.syntax_error is not None
+
+    @property
+    def hash_comments(self) -> Tuple[CommentInfo, ...]:
+        """Only the ``#`` comments, without docstrings."""
+        return tuple(comment for comment in self.comments if not comment.is_docstring)
+
+    @property
+    def global_functions(self) -> Tuple[FunctionInfo, ...]:
+        """Functions defined at module level."""
+        return tuple(func for func in self.functions if func.qualname == func.name)
+
+    def approximate_size(self) -> int:
+        """
+        Estimate the memory held by this analysis in bytes.
+
+        Used by caches to account entries against a memory budget.
+
+        Returns:
+            Approximate size in bytes
+        """
+        size = _RECORD_OVERHEAD
+        for cls in self.classes:
+            size += _RECORD_OVERHEAD + len(cls.name) + len(cls.qualname)
+            size += sum(len(text) for text in cls.bases + cls.decorators + cls.methods)
+        for func in self.functions:
+            size += _RECORD_OVERHEAD + len(func.name) + len(func.qualname)
+            size += sum(len(text) for text in func.decorators)
+        for comment in self.comments:
+            size += _RECORD_OVERHEAD + len(comment.text)
+        for record in self.imports:
+            size += _RECORD_OVERHEAD + len(record.module) + len(record.name or "")
+        for call in self.calls:
+            size += _RECORD_OVERHEAD + len(call.caller) + len(call.callee)
+        return size
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the analysis to plain JSON-compatible data.
+
+        Returns:
+            Dictionary representation of the analysis
+        """
+        return {
+            "analyzer_version": self.analyzer_version,
+            "line_count": self.line_count,
+            "syntax_error": (
+                None if self.syntax_error is None else self.syntax_error.to_dict()
+            ),
+            "classes": [
+                {
+                    "name": cls.name,
+                    "qualname": cls.qualname,
+                    "line": cls.line,
+                    "end_line": cls.end_line,
+                    "bases": list(cls.bases),
+                    "decorators": list(cls.decorators),
+                    "methods": list(cls.methods),
+                }
+                for cls in self.classes
+            ],
+            "functions": [
+                {
+                    "name": func.name,
+                    "qualname": func.qualname,
+                    "line": func.line,
+                    "end_line": func.end_line,
+                    "is_async": func.is_async,
+                    "decorators": list(func.decorators),
+                    "parent_class": func.parent_class,
+                }
+                for func in self.functions
+            ],
+            "comments": [comment.to_dict() for comment in self.comments],
+            "imports": [record.to_dict() for record in self.imports],
+            "calls": [call.to_dict() for call in self.calls],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "FileAnalysis":
+        """
+        Rebuild an analysis from the output of to_dict.
+
+        Args:
+            data: Dictionary representation of an analysis
+
+        Returns:
+            Equal FileAnalysis instance
+        """
+        syntax_error = data.get("syntax_error")
+        return cls(
+            classes=tuple(
+                ClassInfo(
+                    name=cls_data["name"],
+                    qualname=cls_data["qualname"],
+                    line=cls_data["line"],
+                    end_line=cls_data["end_line"],
+                    bases=tuple(cls_data["bases"]),
+                    decorators=tuple(cls_data["decorators"]),
+                    methods=tuple(cls_data["methods"]),
+                )
+                for cls_data in data.get("classes", ())
+            ),
+            functions=tuple(
+                FunctionInfo(
+                    name=func["name"],
+                    qualname=func["qualname"],
+                    line=func["line"],
+                    end_line=func["end_line"],
+                    is_async=func["is_async"],
+                    decorators=tuple(func["decorators"]),
+                    parent_class=func["parent_class"],
+                )
+                for func in data.get("functions", ())
+            ),
+            comments=tuple(CommentInfo(**comment) for comment in data.get("comments", ())),
+            imports=tuple(ImportInfo(**record) for record in data.get("imports", ())),
+            calls=tuple(CallInfo(**call) for call in data.get("calls", ())),
+            syntax_error=None if syntax_error is None else SyntaxErrorInfo(**syntax_error),
+            line_count=data.get("line_count", 0),
+            analyzer_version=data.get("analyzer_version", ANALYZER_VERSION),
+        )
+
+
+class _StructureCollector:
+    """
+    Collect classes and functions by walking statement bodies only.
+
+    Expressions are never descended into, which keeps the walk cheap and
+    independent of expression nesting depth.
+    """
+
+    def __init__(self):
+        self.classes: List[ClassInfo] = []
+        self.functions: List[FunctionInfo] = []
+        self.docstrings: List[CommentInfo] = []
+        self.imports: List[ImportInfo] = []
+
+    def collect(self, tree: ast.Module) -> None:
+        self._record_docstring(tree)
+        self._visit_body(tree.body, prefix="", owner_class=None)
+
+    def _record_docstring(self, node) -> None:
+        if not node.body:
+            return
+        first = node.body[0]
+        if (
+            isinstance(first, ast.Expr)
+            and isinstance(first.value, ast.Constant)
+            and isinstance(first.value.value, str)
+        ):
+            self.docstrings.append(CommentInfo(
+                line=first.lineno,
+                column=first.col_offset,
+                text=inspect.cleandoc(first.value.value),
+                kind=DOCSTRING_KIND,
+            ))
+
+    def _visit_body(self, body, prefix: str, owner_class: Optional[str]) -> None:
+        for node in body:
+            if isinstance(node, ast.ClassDef):
+                self._visit_class(node, prefix)
+            elif isinstance(node, _FUNCTION_NODES):
+                self._visit_function(node, prefix, owner_class)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                self._record_import(node, top_level=not prefix)
+            else:
+                # Definitions under if/try/with/for/while/match blocks still
+                # belong to the enclosing scope.
+                for nested_body in _nested_bodies(node):
+                    self._visit_body(nested_body, prefix, owner_class)
+
+    def _visit_class(self, node: ast.ClassDef, prefix: str) -> None:
+        qualname = f"{prefix}{node.name}"
+        index = len(self.classes)
+        # Reserve the slot so classes stay in source order even though the
+        # method list is only known after visiting the body.
+        self.classes.append(None)
+        first_function = len(self.functions)
+        self._record_docstring(node)
+        self._visit_body(node.body, prefix=f"{qualname}.", owner_class=qualname)
+        methods = tuple(
+            func.name for func in self.functions[first_function:]
+            if func.parent_class == qualname
+        )
+        self.classes[index] = ClassInfo(
+            name=node.name,
+            qualname=qualname,
+            line=node.lineno,
+            end_line=getattr(node, "end_lineno", None),
+            bases=tuple(_unparse(base) for base in node.bases),
+            decorators=tuple(_unparse(dec) for dec in node.decorator_list),
+            methods=methods,
+        )
+
+    def _visit_function(self, node, prefix: str, owner_class: Optional[str]) -> None:
+        qualname = f"{prefix}{node.name}"
+        self.functions.append(FunctionInfo(
+            name=node.name,
+            qualname=qualname,
+            line=node.lineno,
+            end_line=getattr(node, "end_lineno", None),
+            is_async=isinstance(node, ast.AsyncFunctionDef),
+            decorators=tuple(_unparse(dec) for dec in node.decorator_list),
+            parent_class=owner_class,
+        ))
+        self._record_docstring(node)
+        self._visit_body(node.body, prefix=f"{qualname}.<locals>.", owner_class=None)
+
+
+    def _record_import(self, node, top_level: bool) -> None:
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                self.imports.append(ImportInfo(
+                    module=alias.name,
+                    name=None,
+                    asname=alias.asname,
+                    line=node.lineno,
+                    top_level=top_level,
+                ))
+            return
+        for alias in node.names:
+            self.imports.append(ImportInfo(
+                module=node.module or "",
+                name=alias.name,
+                asname=alias.asname,
+                line=node.lineno,
+                level=node.level or 0,
+                top_level=top_level,
+            ))
+
+
+def _collect_calls(tree: ast.Module) -> List[CallInfo]:
+    """
+    Collect the calls made by each function with an iterative walk.
+
+    Scopes follow the qualnames of _StructureCollector: code in a class
+    body belongs to the enclosing function (or module), decorators and
+    default values to the scope defining the function.
+    """
+    found: Dict[Tuple[str, str], List[int]] = {}
+    stack: List[Tuple[ast.AST, str, str]] = [(tree, "", "")]
+    while stack:
+        node, caller, prefix = stack.pop()
+        if isinstance(node, _FUNCTION_NODES):
+            qualname = f"{prefix}{node.name}"
+            stack.extend((child, caller, prefix) for child in node.decorator_list)
+            stack.append((node.args, caller, prefix))
+            stack.extend(
+                (statement, qualname, f"{qualname}.<locals>.") for statement in node.body
+            )
+            continue
+        if isinstance(node, ast.ClassDef):
+            qualname = f"{prefix}{node.name}"
+            stack.extend(
+                (child, caller, prefix)
+                for child in node.decorator_list + node.bases + node.keywords
+            )
+            stack.extend((statement, caller, f"{qualname}.") for statement in node.body)
+            continue
+        if isinstance(node, ast.Call):
+            callee = _callee_name(node.func)
+            if callee is not None:
+                entry = found.get((caller, callee))
+                if entry is None:
+                    found[(caller, callee)] = [node.lineno, 1]
+                else:
+                    entry[1] += 1
+        stack.extend((child, caller, prefix) for child in ast.iter_child_nodes(node))
+    calls = [
+        CallInfo(caller=caller, callee=callee, line=line, count=count)
+        for (caller, callee), (line, count) in found.items()
+    ]
+    calls.sort(key=lambda call: (call.line, call.caller, call.callee))
+    return calls
+
+
+def _callee_name(node: ast.AST) -> Optional[str]:
+    """Render a called expression as a dotted name, or None if it is not one."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if isinstance(node, ast.Name):
+        parts.append(node.id)
+    elif (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "super"
+        and parts
+    ):
+        parts.append("super()")
+    else:
+        return None
+    return ".".join(reversed(parts))
+
+
+def _nested_bodies(node: ast.AST):
+    """Yield the statement lists nested inside a compound statement."""
+    for attr in ("body", "orelse", "finalbody"):
+        body = getattr(node, attr, None)
+        if isinstance(body, list):
+            yield body
+    for handler in getattr(node, "handlers", ()):
+        yield handler.body
+    for case in getattr(node, "cases", ()):
+        yield case.body
+
+
+def _unparse(node: ast.AST) -> str:
+    """Render an expression node back to source text."""
+    return ast.unparse(node)
+
+
+def _collect_comments(source: str) -> List[CommentInfo]:
+    """
+    Collect ``#`` comments with a single tokenize pass.
+
+    Runs in time linear in the size of the source. A comment is inline
+    when a code token ended on the same line before it. Tokenizing stops
+    at the first tokenizer error; comments found before that point are
+    still returned.
+    """
+    comments: List[CommentInfo] = []
+    if "#" not in source:
+        return comments
+    last_code_row = 0
+    readline = io.StringIO(source).readline
+    try:
+        for token in tokenize.generate_tokens(readline):
+            if token.type == tokenize.COMMENT:
+                row, column = token.start
+                comments.append(CommentInfo(
+                    line=row,
+                    column=column,
+                    text=token.string,
+                    inline=row == last_code_row,
+                ))
+            elif token.type not in _NON_CODE_TOKENS:
+                last_code_row = token.end[0]
+    except (tokenize.TokenError, SyntaxError):
+        pass
+    return comments
+
+
+# Tokens that do not make a following comment inline
+_NON_CODE_TOKENS = frozenset({
+    tokenize.NL, tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT,
+    tokenize.ENDMARKER, tokenize.ENCODING,
+})
+
+
+class CodeAnalyzer:
+    """Build FileAnalysis results from Python source."""
+
+    @staticmethod
+    def analyze(python_code: str) -> FileAnalysis:
+        """
+        Parse the source once and collect its structure and comments.
+
+        Args:
+            python_code: Python source text
+
+        Returns:
+            Immutable FileAnalysis for the source
+
+        Raises:
+            RecursionError: If the source is nested too deeply to parse
+            MemoryError: If parsing ran out of memory
+        """
+        comments = _collect_comments(python_code)
+        line_count = python_code.count("\n") + (
+            1 if python_code and not python_code.endswith("\n") else 0
+        )
+
+        # RecursionError and MemoryError are budget failures, not properties of
+        # the source: they propagate so the executor reports them uncached
+        try:
+            tree = ast.parse(python_code)
+        except (SyntaxError, ValueError) as e:
+            return FileAnalysis(
+                comments=tuple(comments),
+                syntax_error=SyntaxErrorInfo(
+                    message=getattr(e, "msg", None) or str(e) or type(e).__name__,
+                    line=getattr(e, "lineno", None),
+                    column=getattr(e, "offset", None),
+                ),
+                line_count=line_count,
+            )
+
+        collector = _StructureCollector()
+        collector.collect(tree)
+        if collector.docstrings:
+            comments = sorted(
+                comments + collector.docstrings,
+                key=lambda comment: (comment.line, comment.column)
+            )
+        return FileAnalysis(
+            classes=tuple(collector.classes),
+            functions=tuple(collector.functions),
+            comments=tuple(comments),
+            imports=tuple(collector.imports),
+            calls=tuple(_collect_calls(tree)),
+            line_count=line_count,
+        )
+
+    @staticmethod
+    def ensure_analysis(source: Union[str, FileAnalysis]) -> FileAnalysis:
+        """
+        Return the given analysis, or analyse the given source text.
+
+        This lets the finder views accept either raw source or an
+        already computed FileAnalysis.
+
+        Args:
+            source: Python source text or an existing FileAnalysis
+
+        Returns:
+            FileAnalysis for the source
+        """
+        if isinstance(source, FileAnalysis):
+            return source
+        return CodeAnalyzer.analyze(source)
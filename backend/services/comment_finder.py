@@ -1,27 +1,24 @@
+from typing import List, Union
+
+from .code_analyzer import CodeAnalyzer, FileAnalysis
+
+
 class CommentFinder:
     @staticmethod
-    def find_comments(python_code: str) -> str:
-        comments = ""
-        i = 0
-        
-        while i < len(python_code):
-            if python_code[i] == "#":
-                comment = ""
-                while i < len(python_code) and python_code[i] != "\n":
-                    comment += python_code[i]
-                    i += 1
-                comments += comment + "\n"
-            else:
-                i += 1
-        
-        if comments == "":
+    def find_comments(python_code: Union[str, FileAnalysis]) -> str:
+        # Compatibility shape: "#" comments only, one per line
+        analysis = CodeAnalyzer.ensure_analysis(python_code)
+        comments = analysis.hash_comments
+        if not comments:
             return "No comments found"
-        return comments
+        return "".join(f"{comment.text}\n" for comment in comments)
 
-
-code = """
-# This is a header comment
-x = 5  # This is an inline comment
-print(x)  # Output the value
-"""
-print(CommentFinder.find_comments(code))
+    @staticmethod
+    def extract_comments(
+        python_code: Union[str, FileAnalysis],
+        include_docstrings: bool = True
+    ) -> List[dict]:
+        # Structured records: line, column, text, inline, kind
+        analysis = CodeAnalyzer.ensure_analysis(python_code)
+        comments = analysis.comments if include_docstrings else analysis.hash_comments
+        return [comment.to_dict() for comment in comments]
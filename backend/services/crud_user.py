@@ -9,11 +9,12 @@ from ..models.user import User
 from ..database.database import get_db
 
 
-def userCreator(user: User, password: str, email: str, db: Session = Depends(get_db)):
+def userCreator(user: User, password: str, email: str, db: Session = Depends(get_db), hashed_password: str = None):
     if db.query(UserInAlchemy).filter(UserInAlchemy.username == user.username).first():
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="User already exists")
     
-    hashed_password = get_password_hash(password)
+    # Callers in async handlers pass a hash computed on the password executor
+    hashed_password = hashed_password or get_password_hash(password)
     db_user = UserInDB(**user.model_dump(), hashed_password=hashed_password)
     user_with_hashed_pwd = UserInAlchemy(**db_user.model_dump())
     
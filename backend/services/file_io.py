@@ -0,0 +1,108 @@
+"""
+Thread pool for blocking file-system work.
+
+Async route handlers must not call open(), os.listdir() or os.remove()
+directly: a slow disk would stall every request served by the event loop.
+FileIO runs those calls on a small, bounded thread pool instead, so disk
+latency only delays the requests that actually touch the disk.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, TypeVar
+
+from ..core.config import settings
+
+T = TypeVar("T")
+
+
+class FileIO:
+    """
+    Lazily created, process-wide thread pool for blocking file operations.
+
+    The pool size bounds how many file-system calls are in flight at once,
+    which also bounds the parallelism of multi-file uploads.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize the file I/O pool wrapper.
+
+        Args:
+            max_workers: Number of I/O threads
+        """
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The underlying pool, started on first access."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="file-io"
+                )
+            return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking callable on the I/O pool and await its result.
+
+        Args:
+            fn: Blocking callable
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def read_text(self, path: str, encoding: str = "utf-8") -> str:
+        """Read a text file."""
+        return await self.run(_read_text, path, encoding)
+
+    async def listdir(self, path: str) -> List[str]:
+        """List a directory."""
+        return await self.run(os.listdir, path)
+
+    async def makedirs(self, path: str) -> None:
+        """Create a directory and its parents if missing."""
+        await self.run(os.makedirs, path, exist_ok=True)
+
+    async def exists(self, path: str) -> bool:
+        """Whether a path exists."""
+        return await self.run(os.path.exists, path)
+
+    async def remove(self, path: str) -> None:
+        """Delete a file."""
+        await self.run(os.remove, path)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the I/O threads if they were started.
+
+        Args:
+            wait: Wait for pending operations to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+def _read_text(path: str, encoding: str) -> str:
+    with open(path, "r", encoding=encoding) as file:
+        return file.read()
+
+
+# Global pool shared by the file and analysis handlers in this process
+file_io = FileIO(max_workers=settings.file.io_workers)
@@ -5,12 +5,18 @@ This module provides the FileService class that contains all business logic
 related to file operations, including upload, read, delete, and validation.
 """
 
+import asyncio
+import base64
+import binascii
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from fastapi import HTTPException, UploadFile, status
 
 from .base_service import BaseService
+from .analysis_service import AnalysisService
 from ..services.check_validation import FileValidator
+from ..services.file_io import FileIO, file_io
+from ..services.file_writer import FileWriter
 from ..services.path_finder import PathFinder
 from ..services.uploaded_dir import get_user_upload_dir
 
@@ -21,59 +27,95 @@ class FileService(BaseService):
     
     This class encapsulates all business logic related to file operations,
     including validation, upload, read, and delete operations.
+    Blocking file-system calls run on the FileIO thread pool so they never
+    stall the event loop.
     """
     
-    def __init__(self):
-        """Initialize the file service."""
+    def __init__(self, io: FileIO = file_io, analysis: Optional[AnalysisService] = None):
+        """
+        Initialize the file service.
+        
+        Args:
+            io: Thread pool that runs blocking file-system calls
+            analysis: Analysis service whose cache tracks the user's files
+        """
         # File service doesn't need a repository as it works with the filesystem
-        pass
+        self.io = io
+        self.analysis = analysis or AnalysisService()
     
-    def get_user_files(self, username: str) -> Dict[str, List[str]]:
+    async def get_user_files(
+        self,
+        username: str,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        Get all files for a specific user.
+        Get one page of a user's files, walking nested directories.
+        
+        Files are returned as relative "/"-separated paths in a stable
+        order; pass the returned next_cursor to get the following page.
         
         Args:
             username: The username to get files for
+            limit: Maximum number of paths to return (at least 1)
+            cursor: Cursor returned with the previous page
             
         Returns:
-            Dictionary containing list of filenames
+            Dictionary containing the relative paths and the next cursor
+            (None on the last page)
             
         Raises:
-            HTTPException: If directory doesn't exist or access error
+            HTTPException: If the cursor is invalid or access error
         """
+        after = self._decode_cursor(cursor) if cursor else None
+        limit = max(1, limit)
         try:
             uploaded_dir = get_user_upload_dir(username)
-            if not os.path.exists(uploaded_dir):
-                os.makedirs(uploaded_dir, exist_ok=True)
-                return {"files": []}
+            if not await self.io.exists(uploaded_dir):
+                await self.io.makedirs(uploaded_dir)
+                return {"files": [], "next_cursor": None}
             
-            files = os.listdir(uploaded_dir)
-            return {"files": files}
+            files = await self.io.run(self._walk_page, uploaded_dir, after, limit + 1)
+            next_cursor = None
+            if len(files) > limit:
+                files = files[:limit]
+                next_cursor = self._encode_cursor(files[-1])
+            return {"files": files, "next_cursor": next_cursor}
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error accessing user files: {str(e)}"
             )
     
-    def upload_files(self, files: List[UploadFile], username: str) -> Dict[str, str]:
+    async def upload_files(
+        self,
+        files: List[UploadFile],
+        username: str,
+        prewarm: bool = False
+    ) -> Dict[str, Any]:
         """
         Upload multiple files for a user.
         
+        Filenames may be relative paths such as "pkg/utils.py"; they are
+        stored under the same path in the user's directory. All filenames
+        are validated before anything is written; the files are then
+        written in parallel on the I/O pool and moved into place only once
+        all of them were written, so a failed upload stores none of them.
+        
         Args:
             files: List of files to upload
             username: Username of the file owner
+            prewarm: Analyse the uploaded files in the background so the
+                first analysis view is a cache hit
             
         Returns:
-            Success message
+            Success message, count, the stored relative paths and, with
+            prewarm, the files queued for background analysis
             
         Raises:
             HTTPException: If file validation fails or upload error
         """
         try:
-            uploaded_dir = get_user_upload_dir(username)
-            os.makedirs(uploaded_dir, exist_ok=True)
-            
-            uploaded_count = 0
             for file in files:
                 # Validate file type
                 if not FileValidator.isPython(file.filename):
@@ -81,16 +123,44 @@ class FileService(BaseService):
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail=f"File '{file.filename}' is not a Python file"
                     )
-                
-                # Get file path and write file
-                file_path = PathFinder.find_path(file.filename, uploaded_dir)
-                self._write_file(file_path, file)
-                uploaded_count += 1
+            relatives = [PathFinder.normalize(file.filename) for file in files]
+            if len(set(relatives)) != len(relatives):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="The same file path was uploaded more than once"
+                )
             
-            return {
-                "message": f"Successfully uploaded {uploaded_count} file(s)",
-                "count": uploaded_count
+            uploaded_dir = get_user_upload_dir(username)
+            await self.io.makedirs(uploaded_dir)
+            
+            targets = [PathFinder.find_path(relative, uploaded_dir) for relative in relatives]
+            results = await asyncio.gather(
+                *(
+                    self.io.run(self._write_file, target, file)
+                    for target, file in zip(targets, files)
+                ),
+                return_exceptions=True
+            )
+            
+            parts = [result for result in results if not isinstance(result, BaseException)]
+            for result in results:
+                if isinstance(result, BaseException):
+                    await self.io.run(self._discard_parts, parts)
+                    raise result
+            await self.io.run(self._commit_parts, list(zip(parts, targets)))
+            
+            uploaded = relatives
+            for relative in uploaded:
+                self.analysis.invalidate_file(relative, username)
+            
+            response: Dict[str, Any] = {
+                "message": f"Successfully uploaded {len(uploaded)} file(s)",
+                "count": len(uploaded),
+                "files": uploaded
             }
+            if prewarm:
+                response["prewarming"] = self.analysis.prewarm_files(uploaded, username)
+            return response
             
         except HTTPException:
             raise
@@ -100,12 +170,12 @@ class FileService(BaseService):
                 detail=f"Error uploading files: {str(e)}"
             )
     
-    def get_file_content(self, filename: str, username: str) -> Dict[str, str]:
+    async def get_file_content(self, filename: str, username: str) -> Dict[str, str]:
         """
         Get the content of a specific file.
         
         Args:
-            filename: Name of the file to read
+            filename: Relative path of the file to read
             username: Username of the file owner
             
         Returns:
@@ -124,19 +194,18 @@ class FileService(BaseService):
                     detail="File is not a Python file"
                 )
             
+            filename = PathFinder.normalize(filename)
             file_path = PathFinder.find_path(filename, uploaded_dir)
             
-            # Check if file exists
-            if not os.path.exists(file_path):
+            # Read file content
+            try:
+                content = await self.io.read_text(file_path)
+            except FileNotFoundError:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="File not found"
                 )
             
-            # Read file content
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-            
             return {
                 "filename": filename,
                 "content": content,
@@ -151,12 +220,12 @@ class FileService(BaseService):
                 detail=f"Error reading file: {str(e)}"
             )
     
-    def delete_file(self, filename: str, username: str) -> Dict[str, str]:
+    async def delete_file(self, filename: str, username: str) -> Dict[str, str]:
         """
-        Delete a specific file.
+        Delete a specific file and any directories left empty by it.
         
         Args:
-            filename: Name of the file to delete
+            filename: Relative path of the file to delete
             username: Username of the file owner
             
         Returns:
@@ -167,17 +236,19 @@ class FileService(BaseService):
         """
         try:
             uploaded_dir = get_user_upload_dir(username)
+            filename = PathFinder.normalize(filename)
             file_path = PathFinder.find_path(filename, uploaded_dir)
             
-            # Check if file exists
-            if not os.path.exists(file_path):
+            # Delete file
+            try:
+                await self.io.remove(file_path)
+            except FileNotFoundError:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="File not found"
                 )
-            
-            # Delete file
-            os.remove(file_path)
+            await self.io.run(self._prune_empty_dirs, str(file_path), uploaded_dir)
+            self.analysis.invalidate_file(filename, username)
             
             return {
                 "message": f"File '{filename}' deleted successfully",
@@ -204,22 +275,106 @@ class FileService(BaseService):
         """
         return FileValidator.isPython(filename)
     
-    def _write_file(self, file_path: str, file: UploadFile) -> None:
+    def _write_file(self, file_path: str, file: UploadFile) -> str:
         """
-        Write uploaded file to disk.
+        Stream uploaded file to a temporary part file, enforcing the configured size limit.
         
         Args:
-            file_path: Path where to write the file
+            file_path: Path where the file will be stored
             file: Uploaded file object
             
+        Returns:
+            Path of the part file to move into place
+            
         Raises:
+            FileTooLargeError: If the file exceeds FileSettings.max_file_size
             Exception: If write operation fails
         """
         try:
-            with open(file_path, "wb") as buffer:
-                content = file.file.read()
-                buffer.write(content)
+            part_path, _ = FileWriter.write_part_file(file_path, file)
+        except HTTPException:
+            raise
         except Exception as e:
             raise Exception(f"Failed to write file: {str(e)}")
-        finally:
-            file.file.close()
\ No newline at end of file
+        return part_path
+
+    @staticmethod
+    def _commit_parts(parts: List[Tuple[str, str]]) -> None:
+        """Move written part files into place, discarding the rest on failure."""
+        for index, (part_path, target) in enumerate(parts):
+            try:
+                os.replace(part_path, target)
+            except OSError as e:
+                FileService._discard_parts([part for part, _ in parts[index:]])
+                raise Exception(f"Failed to write file: {str(e)}")
+
+    @staticmethod
+    def _discard_parts(parts: List[str]) -> None:
+        """Remove part files of an upload that is not stored."""
+        for part_path in parts:
+            FileWriter.remove_part_file(part_path)
+
+    
+    @staticmethod
+    def _walk_page(root: str, after: Optional[Tuple[str, ...]], count: int) -> List[str]:
+        """
+        Collect up to count file paths that sort after the given path.
+        
+        The tree is walked depth first with sorted entries, which orders
+        files by their path components. Directories that sort entirely
+        before the cursor are skipped without being listed, so fetching a
+        page costs roughly the page size plus the depth of the tree.
+        """
+        files: List[str] = []
+        
+        def walk(directory: str, prefix: Tuple[str, ...]) -> None:
+            with os.scandir(directory) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+            for entry in entries:
+                if len(files) >= count:
+                    return
+                parts = prefix + (entry.name,)
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name == "__pycache__":
+                        continue
+                    if after is not None and parts < after[:len(parts)]:
+                        continue
+                    walk(entry.path, parts)
+                elif entry.is_file(follow_symlinks=False):
+                    if entry.name.endswith(".part"):
+                        continue
+                    if after is not None and parts <= after:
+                        continue
+                    files.append("/".join(parts))
+        
+        walk(root, ())
+        return files
+    
+    @staticmethod
+    def _encode_cursor(path: str) -> str:
+        """Encode the last returned path as an opaque page cursor."""
+        return base64.urlsafe_b64encode(path.encode("utf-8")).decode("ascii")
+    
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[str, ...]:
+        """Decode a page cursor into path components."""
+        try:
+            path = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        except (binascii.Error, UnicodeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+        return tuple(path.split("/"))
+    
+    @staticmethod
+    def _prune_empty_dirs(file_path: str, uploaded_dir: str) -> None:
+        """Remove the now empty parent directories of a deleted file."""
+        root = os.path.abspath(uploaded_dir)
+        parent = os.path.dirname(os.path.abspath(file_path))
+        while parent != root and parent.startswith(root + os.sep):
+            try:
+                os.rmdir(parent)
+            except OSError:
+                break
+            parent = os.path.dirname(parent)
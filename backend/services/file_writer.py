@@ -1,8 +1,158 @@
-from fastapi import UploadFile
+import os
+import tempfile
+from typing import Tuple
+
+from fastapi import HTTPException, UploadFile, status
+
+from ..core.config import settings
+
+# mkstemp creates files with mode 0600; stored files get the usual default.
+# Read once at import, since os.umask can only be read by changing it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+
+class FileTooLargeError(HTTPException):
+    """Raised when an upload exceeds the configured size limit."""
+
+    def __init__(self, filename: str, max_size: int):
+        super().__init__(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File '{filename}' exceeds the maximum size of {max_size} bytes"
+        )
+
 
 class FileWriter:
     @staticmethod
-    def write_file(file_path: str, file_obj: UploadFile) -> dict:
-        with open(file_path, "wb") as file:
-            file.write(file_obj.file.read())
-            return {"message": "File uploaded successfully"}
\ No newline at end of file
+    def create_part_file(file_path: str) -> Tuple[int, str]:
+        """
+        Create a uniquely named temporary ".part" file next to a target.
+
+        The file lives in the target's directory, so os.replace() moves it
+        into place atomically; its name is unique, so concurrent writers of
+        the same target never share it. It gets the permissions a newly
+        created file would have under the process umask.
+
+        Args:
+            file_path: Destination path; its directory must exist
+
+        Returns:
+            Open file descriptor and path of the temporary file
+        """
+        fd, part_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path) or ".",
+            prefix=f".{os.path.basename(file_path)}.",
+            suffix=".part",
+        )
+        try:
+            os.chmod(part_path, _FILE_MODE)
+        except BaseException:
+            os.close(fd)
+            os.remove(part_path)
+            raise
+        return fd, part_path
+
+    @staticmethod
+    def remove_part_file(part_path: str) -> None:
+        """
+        Delete a temporary ".part" file if it still exists.
+
+        Args:
+            part_path: Path returned by create_part_file
+        """
+        try:
+            os.remove(part_path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def write_file(
+        file_path: str,
+        file_obj: UploadFile,
+        max_size: int = settings.file.max_file_size,
+        chunk_size: int = settings.file.upload_chunk_size
+    ) -> dict:
+        """
+        Stream an upload to disk in fixed-size chunks.
+
+        The data is written to a uniquely named temporary ".part" file next
+        to the target and moved into place only once complete, so an aborted
+        upload never replaces an existing file and concurrent uploads of the
+        same path never write into each other's data; the last one wins.
+        At most chunk_size bytes are held in memory at a time.
+
+        Args:
+            file_path: Destination path
+            file_obj: Uploaded file
+            max_size: Maximum file size in bytes (0 disables the limit)
+            chunk_size: Bytes read per iteration
+
+        Returns:
+            Success message with the number of bytes written
+
+        Raises:
+            FileTooLargeError: If the upload exceeds max_size
+        """
+        part_path, written = FileWriter.write_part_file(file_path, file_obj, max_size, chunk_size)
+        try:
+            os.replace(part_path, file_path)
+        except BaseException:
+            FileWriter.remove_part_file(part_path)
+            raise
+        return {"message": "File uploaded successfully", "size": written}
+
+    @staticmethod
+    def write_part_file(
+        file_path: str,
+        file_obj: UploadFile,
+        max_size: int = settings.file.max_file_size,
+        chunk_size: int = settings.file.upload_chunk_size
+    ) -> Tuple[str, int]:
+        """
+        Stream an upload into a temporary ".part" file next to its target.
+
+        The caller moves the part file into place with os.replace(), or
+        removes it with remove_part_file() to discard the upload.
+
+        Args:
+            file_path: Destination path
+            file_obj: Uploaded file
+            max_size: Maximum file size in bytes (0 disables the limit)
+            chunk_size: Bytes read per iteration
+
+        Returns:
+            Path of the part file and the number of bytes written
+
+        Raises:
+            FileTooLargeError: If the upload exceeds max_size
+        """
+        file_path = os.fspath(file_path)
+        if max_size and (file_obj.size or 0) > max_size:
+            file_obj.file.close()
+            raise FileTooLargeError(file_obj.filename, max_size)
+
+        directory = os.path.dirname(file_path) or "."
+        written = 0
+        os.makedirs(directory, exist_ok=True)
+        try:
+            fd, part_path = FileWriter.create_part_file(file_path)
+        except BaseException:
+            file_obj.file.close()
+            raise
+        try:
+            with os.fdopen(fd, "wb") as buffer:
+                while True:
+                    chunk = file_obj.file.read(chunk_size)
+                    if not chunk:
+                        break
+                    written += len(chunk)
+                    if max_size and written > max_size:
+                        raise FileTooLargeError(file_obj.filename, max_size)
+                    buffer.write(chunk)
+        except BaseException:
+            FileWriter.remove_part_file(part_path)
+            raise
+        finally:
+            file_obj.file.close()
+        return part_path, written
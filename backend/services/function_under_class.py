@@ -1,26 +1,16 @@
+from typing import Union
+
+from .code_analyzer import CodeAnalyzer, FileAnalysis, GLOBAL_FUNCTIONS_KEY
+
+
 class ClassFunctionFinder:
     @staticmethod
-    def find_functions_by_class(python_code: str) -> dict:
-        functions = {"Global_Functions": []}
-        current_class = "Global_Functions"
+    def find_functions_by_class(python_code: Union[str, FileAnalysis]) -> dict:
+        analysis = CodeAnalyzer.ensure_analysis(python_code)
+        functions = {GLOBAL_FUNCTIONS_KEY: [func.name for func in analysis.global_functions]}
         
-        lines = python_code.split("\n")
-        
-        for line in lines:
-            lines = line.lstrip()
-            indentation_level = len(line) - len(lines)
-            
-            if lines.startswith("class "):
-                class_name = lines.split()[1].split("(")[0].split(":")[0]
-                current_class = class_name
-                functions[current_class] = []
-            
-            elif lines.startswith("def "):
-                function_name = lines.split()[1].split("(")[0]
-                
-                if indentation_level == 0:  # Function is at the global level
-                    functions["Global_Functions"].append(function_name)
-                else:
-                    functions[current_class].append(function_name)
+        # Nested classes are keyed by their qualified name (e.g. "Outer.Inner")
+        for cls in analysis.classes:
+            functions[cls.qualname] = list(cls.methods)
         
         return functions
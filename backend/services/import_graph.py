@@ -0,0 +1,325 @@
+"""
+Project-wide module import graph.
+
+Every ``import`` and ``from ... import`` of an uploaded module, including
+relative ones, is resolved to the deepest project module it names:
+``from pkg import sub`` points at ``pkg.sub`` when that is a module and at
+``pkg`` otherwise. Imports of modules outside the project are kept per
+module as their top-level package name.
+
+Edges are re-resolved only for changed modules and for modules whose
+imports named a module that appeared or disappeared. The report (fan-in,
+fan-out and import cycles found with Tarjan's strongly connected
+components algorithm) is cached under a fingerprint of the resolved
+edges, so edits that do not touch imports, and edits that are undone,
+reuse an earlier report.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .code_analyzer import FileAnalysis, ImportInfo
+from .module_paths import imported_module, is_package, module_name
+
+# Candidate targets of one import (deepest first), whether it runs at
+# import time and whether it is absolute
+_Import = Tuple[Tuple[str, ...], bool, bool]
+
+
+@dataclass(frozen=True)
+class ModuleNode:
+    """Resolved imports of one project module."""
+    module: str
+    file: str
+    imports: Tuple[str, ...]
+    imported_by: Tuple[str, ...]
+    external: Tuple[str, ...]
+
+    @property
+    def fan_out(self) -> int:
+        """Number of project modules this module imports."""
+        return len(self.imports)
+
+    @property
+    def fan_in(self) -> int:
+        """Number of project modules importing this module."""
+        return len(self.imported_by)
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the node to plain JSON-compatible data.
+
+        Returns:
+            Dictionary representation of the node
+        """
+        return {
+            "module": self.module,
+            "file": self.file,
+            "fan_in": self.fan_in,
+            "fan_out": self.fan_out,
+            "imports": list(self.imports),
+            "imported_by": list(self.imported_by),
+            "external": list(self.external),
+        }
+
+
+@dataclass(frozen=True)
+class ImportReport:
+    """Modules of a project with their import cycles."""
+    modules: Tuple[ModuleNode, ...]
+    cycles: Tuple[Tuple[str, ...], ...]
+    edge_count: int
+
+
+class ImportGraph:
+    """
+    Resolved imports between the modules of a project.
+
+    Not thread-safe; the owning workspace serializes updates and queries.
+    """
+
+    def __init__(self, max_reports: int = 4):
+        """
+        Initialize an empty graph.
+
+        Args:
+            max_reports: Reports kept for recently seen fingerprints
+        """
+        self.max_reports = max(1, max_reports)
+        self._file_modules: Dict[str, str] = {}
+        self._files: Dict[str, str] = {}
+        self._imports: Dict[str, List[_Import]] = {}
+        self._external: Dict[str, Tuple[str, ...]] = {}
+        # Resolved edges: module -> imported module -> any import at import time
+        self._edges: Dict[str, Dict[str, bool]] = {}
+        # Candidate module name -> modules with an import naming it
+        self._wanted: Dict[str, Set[str]] = {}
+        self._hashes: Dict[str, int] = {}
+        self._fingerprint = 0
+        self._reports: "OrderedDict[int, ImportReport]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    @property
+    def fingerprint(self) -> int:
+        """Order-independent hash of the resolved graph."""
+        return self._fingerprint
+
+    def update(
+        self,
+        changed: Dict[str, FileAnalysis],
+        removed: Iterable[str] = ()
+    ) -> None:
+        """
+        Replace the imports of changed files and drop removed files.
+
+        Args:
+            changed: Current analyses of added or modified files
+            removed: Relative paths of deleted files
+        """
+        touched = {self._file_modules.get(filename) for filename in removed}
+        touched.update(module_name(filename) for filename in changed)
+        touched.discard(None)
+        existed = {module for module in touched if module in self._files}
+
+        for filename in list(removed) + list(changed):
+            module = self._file_modules.pop(filename, None)
+            if module is not None and self._files.get(module) == filename:
+                self._drop_module(module)
+        for filename, analysis in changed.items():
+            module = module_name(filename)
+            if module in self._files:
+                # Two files map to one module (e.g. pkg.py and pkg/__init__.py)
+                self._file_modules.pop(self._files[module], None)
+                self._drop_module(module)
+            self._add_module(filename, module, analysis)
+
+        dirty = set(module_name(filename) for filename in changed)
+        # Modules that appeared or disappeared change what other imports resolve to
+        for module in touched:
+            if (module in self._files) != (module in existed):
+                dirty.update(self._wanted.get(module, ()))
+        for module in dirty:
+            if module in self._files:
+                self._resolve(module)
+
+    def imports(self, module: str) -> List[str]:
+        """
+        List the project modules a module imports.
+
+        Args:
+            module: Dotted module name
+
+        Returns:
+            Sorted imported module names
+        """
+        return sorted(self._edges.get(module, ()))
+
+    def report(self) -> ImportReport:
+        """
+        Get fan-in, fan-out and import cycles of the current graph.
+
+        Cycles are the strongly connected components of the imports that
+        run at import time; imports inside functions are how cycles are
+        usually broken, so they count for fan-in/fan-out only.
+
+        Returns:
+            Report for the current graph, shared while it does not change
+        """
+        report = self._reports.get(self._fingerprint)
+        if report is not None:
+            self._reports.move_to_end(self._fingerprint)
+            return report
+
+        imported_by: Dict[str, List[str]] = {module: [] for module in self._files}
+        for module, targets in self._edges.items():
+            for target in targets:
+                imported_by[target].append(module)
+        modules = tuple(
+            ModuleNode(
+                module=module,
+                file=self._files[module],
+                imports=tuple(sorted(self._edges.get(module, ()))),
+                imported_by=tuple(sorted(imported_by[module])),
+                external=self._external.get(module, ()),
+            )
+            for module in sorted(self._files)
+        )
+        report = ImportReport(
+            modules=modules,
+            cycles=self._cycles([node.module for node in modules]),
+            edge_count=sum(len(targets) for targets in self._edges.values()),
+        )
+        self._reports[self._fingerprint] = report
+        while len(self._reports) > self.max_reports:
+            self._reports.popitem(last=False)
+        return report
+
+    def _add_module(self, filename: str, module: str, analysis: FileAnalysis) -> None:
+        package = is_package(filename)
+        imports: List[_Import] = []
+        for record in analysis.imports:
+            candidates = self._candidates(record, module, package)
+            if not candidates:
+                continue
+            imports.append((candidates, record.top_level, not record.level))
+            for candidate in candidates:
+                self._wanted.setdefault(candidate, set()).add(module)
+        self._files[module] = filename
+        self._file_modules[filename] = module
+        self._imports[module] = imports
+
+    def _drop_module(self, module: str) -> None:
+        self._files.pop(module, None)
+        self._external.pop(module, None)
+        for candidates, _, _ in self._imports.pop(module, ()):
+            for candidate in candidates:
+                importers = self._wanted.get(candidate)
+                if importers is not None:
+                    importers.discard(module)
+                    if not importers:
+                        del self._wanted[candidate]
+        self._set_edges(module, None)
+
+    def _resolve(self, module: str) -> None:
+        """Point each import of a module at the deepest project module it names."""
+        edges: Dict[str, bool] = {}
+        external: Set[str] = set()
+        for candidates, top_level, absolute in self._imports[module]:
+            for candidate in candidates:
+                if candidate in self._files:
+                    if candidate != module:
+                        edges[candidate] = edges.get(candidate, False) or top_level
+                    break
+            else:
+                if absolute:
+                    external.add(candidates[-1])
+        self._external[module] = tuple(sorted(external))
+        self._set_edges(module, edges)
+
+    def _set_edges(self, module: str, edges: Optional[Dict[str, bool]]) -> None:
+        """Store a module's edges and update the fingerprint."""
+        self._fingerprint ^= self._hashes.pop(module, 0)
+        if edges is None:
+            self._edges.pop(module, None)
+            return
+        self._edges[module] = edges
+        digest = hash((
+            module, self._files[module], tuple(sorted(edges.items())), self._external[module]
+        ))
+        self._hashes[module] = digest
+        self._fingerprint ^= digest
+
+    def _cycles(self, modules: List[str]) -> Tuple[Tuple[str, ...], ...]:
+        """Find import cycles with an iterative Tarjan SCC in O(modules + edges)."""
+        ids = {module: index for index, module in enumerate(modules)}
+        successors = [
+            [ids[target] for target, top_level in self._edges.get(module, {}).items() if top_level]
+            for module in modules
+        ]
+        count = len(modules)
+        index = [-1] * count
+        low = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[Tuple[str, ...]] = []
+        counter = 0
+
+        for root in range(count):
+            if index[root] >= 0:
+                continue
+            # (node, position of the next successor to visit)
+            work = [(root, 0)]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            while work:
+                node, position = work[-1]
+                targets = successors[node]
+                if position < len(targets):
+                    work[-1] = (node, position + 1)
+                    target = targets[position]
+                    if index[target] < 0:
+                        index[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = True
+                        work.append((target, 0))
+                    elif on_stack[target] and index[target] < low[node]:
+                        low[node] = index[target]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(modules[member])
+                        if member == node:
+                            break
+                    if len(component) > 1:
+                        components.append(tuple(sorted(component)))
+
+        components.sort(key=lambda component: (-len(component), component))
+        return tuple(components)
+
+    @staticmethod
+    def _candidates(record: ImportInfo, module: str, package: bool) -> Tuple[str, ...]:
+        """Module names an import may refer to, deepest first."""
+        target = imported_module(record, module, package)
+        if target is None:
+            return ()
+        parts = target.split(".")
+        names = [".".join(parts[:length]) for length in range(len(parts), 0, -1)]
+        if record.name is not None and record.name != "*":
+            # "from pkg import sub" imports the submodule when there is one
+            names.insert(0, f"{target}.{record.name}")
+        return tuple(names)
@@ -0,0 +1,65 @@
+"""
+Import graph service for module dependency reports.
+
+This module provides the ImportGraphService class that reports, for the
+user's project workspace, which modules import which, the fan-in and
+fan-out of every module and the import cycles between them.
+"""
+
+from typing import Any, Dict
+
+from .base_service import BaseService
+from .file_io import FileIO, file_io
+from .import_graph import ImportReport
+from .project_workspace import ProjectWorkspace, WorkspaceRegistry, project_workspaces
+
+
+class ImportGraphService(BaseService[WorkspaceRegistry]):
+    """Service class for module import graph queries."""
+
+    def __init__(
+        self,
+        workspaces: WorkspaceRegistry = project_workspaces,
+        io: FileIO = file_io
+    ):
+        """
+        Initialize the import graph service.
+
+        Args:
+            workspaces: Per-user project workspaces used as the data source
+            io: Thread pool that builds import reports off the event loop
+        """
+        super().__init__(workspaces)
+        self.io = io
+
+    async def get_import_graph(self, username: str) -> Dict[str, Any]:
+        """
+        Get the module import graph of the user's project.
+
+        Args:
+            username: Owner of the project
+
+        Returns:
+            Summary, modules with their imports, fan-in and fan-out, and
+            import cycles (largest first)
+        """
+        report = await self.io.run(self._report, await self.repository.get_synced(username))
+        cyclic = sum(len(cycle) for cycle in report.cycles)
+        return {
+            "summary": {
+                "modules": len(report.modules),
+                "imports": report.edge_count,
+                "cycles": len(report.cycles),
+                "modules_in_cycles": cyclic,
+                "max_fan_in": max((node.fan_in for node in report.modules), default=0),
+                "max_fan_out": max((node.fan_out for node in report.modules), default=0),
+            },
+            "modules": [node.to_dict() for node in report.modules],
+            "cycles": [list(cycle) for cycle in report.cycles],
+        }
+
+    @staticmethod
+    def _report(workspace: ProjectWorkspace) -> ImportReport:
+        """Get the workspace's import report (blocking)."""
+        with workspace.lock:
+            return workspace.imports.report()
@@ -0,0 +1,535 @@
+"""
+Project-wide class inheritance graph.
+
+Base classes are written as names that depend on each module's imports,
+so ``Base`` in two modules may be two different classes. The graph
+resolves every base through the importing module's bindings (local
+classes, ``import``/``from ... import`` aliases, re-exports, star imports
+and submodules) to a class id of the form ``"pkg.module:Outer.Inner"``.
+Bases defined outside the project stay as their textual name.
+
+Resolution is cached per module and redone only for modules that changed
+or whose lookups went through a changed module. C3 method resolution
+orders are computed iteratively and cached per class until one of its
+ancestors changes.
+"""
+
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .code_analyzer import FileAnalysis
+from .module_paths import imported_module, is_package, module_name
+
+OBJECT = "object"
+
+# A name lookup result: ("class", class id) or ("module", module name)
+_Target = Tuple[str, str]
+
+
+class InheritanceError(ValueError):
+    """Raised when no consistent method resolution order exists."""
+
+
+@dataclass(frozen=True)
+class ClassNode:
+    """A class defined in one of the project's modules."""
+    id: str
+    name: str
+    qualname: str
+    module: str
+    file: str
+    line: int
+    bases: Tuple[str, ...]
+    methods: Tuple[str, ...]
+
+
+@dataclass
+class _Module:
+    file: str
+    classes: Dict[str, ClassNode]
+    written_bases: Dict[str, Tuple[str, ...]]
+    functions: Set[str]
+    bindings: Dict[str, Tuple[str, Optional[str]]]
+    star_imports: List[str]
+
+
+def is_class_id(node: str) -> bool:
+    """
+    Check whether a graph node is a project class rather than an external base.
+
+    Args:
+        node: Class id or external base name
+
+    Returns:
+        True for project class ids
+    """
+    return ":" in node
+
+
+class InheritanceGraph:
+    """
+    Resolved inheritance between the classes of a project.
+
+    Not thread-safe; the owning workspace serializes updates and queries.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self._modules: Dict[str, _Module] = {}
+        self._file_modules: Dict[str, str] = {}
+        self._packages: Dict[str, int] = {}
+        self._classes: Dict[str, ClassNode] = {}
+        # Resolved bases per class and the reverse edges
+        self._bases: Dict[str, Tuple[str, ...]] = {}
+        self._subclasses: Dict[str, Set[str]] = {}
+        # Modules a module's resolution looked into, and the reverse
+        self._lookups: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._dirty: Set[str] = set()
+        self._mro: Dict[str, Tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def update(
+        self,
+        changed: Dict[str, FileAnalysis],
+        removed: Iterable[str] = ()
+    ) -> None:
+        """
+        Replace the classes and imports of changed files and drop removed files.
+
+        Args:
+            changed: Current analyses of added or modified files
+            removed: Relative paths of deleted files
+        """
+        for filename in list(removed) + list(changed):
+            module = self._file_modules.pop(filename, None)
+            if module is not None:
+                self._drop_module(module)
+        for filename, analysis in changed.items():
+            self._add_module(filename, analysis)
+
+    def classes(self) -> List[ClassNode]:
+        """
+        List every project class with its resolved bases.
+
+        Returns:
+            Classes ordered by module and position
+        """
+        self._refresh()
+        return [
+            node
+            for module in sorted(self._modules)
+            for node in self._modules[module].classes.values()
+        ]
+
+    def get(self, class_id: str) -> Optional[ClassNode]:
+        """
+        Get a project class.
+
+        Args:
+            class_id: Class id ("module:qualname")
+
+        Returns:
+            The class with its resolved bases, or None if unknown
+        """
+        self._refresh()
+        return self._classes.get(class_id)
+
+    def find(self, name: str) -> List[str]:
+        """
+        Find the ids of project classes by name or dotted path.
+
+        Args:
+            name: Class name ("Base"), qualname ("Outer.Inner") or dotted
+                path ("pkg.models.Base")
+
+        Returns:
+            Matching class ids, sorted
+        """
+        self._refresh()
+        return sorted(
+            class_id for class_id, node in self._classes.items()
+            if name in (node.name, node.qualname, f"{node.module}.{node.qualname}")
+        )
+
+    def subclasses(self, node: str, transitive: bool = True) -> List[str]:
+        """
+        List the project classes deriving from a class.
+
+        Args:
+            node: Class id or external base name (e.g. "Exception")
+            transitive: Include indirect subclasses
+
+        Returns:
+            Subclass ids in breadth-first order
+        """
+        self._refresh()
+        seen: Set[str] = set()
+        ordered: List[str] = []
+        queue = deque([node])
+        while queue:
+            for child in sorted(self._subclasses.get(queue.popleft(), ())):
+                if child not in seen:
+                    seen.add(child)
+                    ordered.append(child)
+                    if transitive:
+                        queue.append(child)
+        return ordered
+
+    def mro(self, class_id: str) -> Tuple[str, ...]:
+        """
+        Compute the C3 method resolution order of a class.
+
+        External bases are treated as classes deriving directly from object.
+
+        Args:
+            class_id: Class id
+
+        Returns:
+            The class followed by its ancestors, ending with "object"
+
+        Raises:
+            InheritanceError: If the hierarchy is cyclic or inconsistent
+        """
+        self._refresh()
+        # Depth-first over bases without recursion, so deep hierarchies are fine
+        path = [class_id]
+        on_path = {class_id}
+        while path and class_id not in self._mro:
+            current = path[-1]
+            bases = self._bases_of(current)
+            for base in bases:
+                if base not in self._mro:
+                    if base in on_path:
+                        raise InheritanceError(f"Cyclic inheritance involving {base}")
+                    path.append(base)
+                    on_path.add(base)
+                    break
+            else:
+                path.pop()
+                on_path.discard(current)
+                if len(bases) == 1:
+                    # C3 of single inheritance is the base's order behind the class
+                    self._mro[current] = (current,) + self._mro[bases[0]]
+                else:
+                    self._mro[current] = self._merge(
+                        current, [list(self._mro[base]) for base in bases] + [list(bases)]
+                    )
+        return self._mro[class_id]
+
+    def resolve(self, module: str, dotted: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolve a dotted name as seen from a module's top level.
+
+        Args:
+            module: Module the name is used in
+            dotted: Name such as "helper", "models.User" or "User.save"
+
+        Returns:
+            ("class", class id), ("function", function id) or ("module",
+            module name); None if the name is not defined in the project
+        """
+        self._refresh()
+        return self._resolve_path(module, dotted.split("."), set())
+
+    def find_method(
+        self,
+        class_id: str,
+        name: str,
+        after: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Find the method a name resolves to on a class, following its MRO.
+
+        Args:
+            class_id: Class the attribute is looked up on
+            name: Method name
+            after: Start the lookup after this class, as super() does
+
+        Returns:
+            Function id ("module:Class.method") of the first project class
+            in the MRO defining the method, or None
+        """
+        try:
+            order = self.mro(class_id)
+        except InheritanceError:
+            order = (class_id,)
+        if after is not None:
+            order = order[order.index(after) + 1:] if after in order else ()
+        for node in order:
+            cls = self._classes.get(node)
+            if cls is not None and name in cls.methods:
+                return f"{node}.{name}"
+        return None
+
+    def _bases_of(self, node: str) -> Tuple[str, ...]:
+        if node == OBJECT:
+            return ()
+        return self._bases.get(node) or (OBJECT,)
+
+    @staticmethod
+    def _merge(node: str, sequences: List[List[str]]) -> Tuple[str, ...]:
+        """C3 linearization of a class from its bases' orders and its base list."""
+        sequences = [sequence for sequence in sequences if sequence]
+        heads = [0] * len(sequences)
+        # How often each class appears after the head of a sequence
+        in_tails: Dict[str, int] = {}
+        for sequence in sequences:
+            for item in sequence[1:]:
+                in_tails[item] = in_tails.get(item, 0) + 1
+
+        result = [node]
+        while True:
+            candidate = None
+            for sequence, head in zip(sequences, heads):
+                if head < len(sequence) and not in_tails.get(sequence[head]):
+                    candidate = sequence[head]
+                    break
+            if candidate is None:
+                if any(head < len(sequence) for sequence, head in zip(sequences, heads)):
+                    raise InheritanceError(
+                        f"Cannot create a consistent method resolution order for {node}"
+                    )
+                return tuple(result)
+            result.append(candidate)
+            for index, sequence in enumerate(sequences):
+                head = heads[index]
+                if head < len(sequence) and sequence[head] == candidate:
+                    heads[index] = head + 1
+                    if head + 1 < len(sequence):
+                        in_tails[sequence[head + 1]] -= 1
+
+    def _add_module(self, filename: str, analysis: FileAnalysis) -> None:
+        module = module_name(filename)
+        if module in self._modules:
+            # Two files map to one module (e.g. pkg.py and pkg/__init__.py)
+            self._drop_module(module)
+            for other, name in list(self._file_modules.items()):
+                if name == module:
+                    del self._file_modules[other]
+        package = is_package(filename)
+        bindings: Dict[str, Tuple[str, Optional[str]]] = {}
+        star_imports: List[str] = []
+        for record in analysis.imports:
+            if not record.top_level:
+                continue
+            target = imported_module(record, module, package)
+            if target is None:
+                continue
+            if record.name is None:
+                if record.asname:
+                    bindings[record.asname] = (target, None)
+                else:
+                    # "import a.b" binds "a"
+                    top = target.split(".", 1)[0]
+                    bindings[top] = (top, None)
+            elif record.name == "*":
+                star_imports.append(target)
+            else:
+                bindings[record.asname or record.name] = (target, record.name)
+
+        classes = {}
+        for cls in analysis.classes:
+            class_id = f"{module}:{cls.qualname}"
+            classes[cls.qualname] = ClassNode(
+                id=class_id,
+                name=cls.name,
+                qualname=cls.qualname,
+                module=module,
+                file=filename,
+                line=cls.line,
+                bases=cls.bases,
+                methods=cls.methods,
+            )
+        self._modules[module] = _Module(
+            filename,
+            classes,
+            {cls.qualname: cls.bases for cls in analysis.classes},
+            {func.name for func in analysis.global_functions},
+            bindings,
+            star_imports,
+        )
+        self._file_modules[filename] = module
+        for prefix in self._prefixes(module):
+            self._packages[prefix] = self._packages.get(prefix, 0) + 1
+        self._invalidate(module)
+
+    def _drop_module(self, module: str) -> None:
+        entry = self._modules.pop(module, None)
+        if entry is None:
+            return
+        for prefix in self._prefixes(module):
+            self._packages[prefix] -= 1
+            if not self._packages[prefix]:
+                del self._packages[prefix]
+        self._invalidate(module)
+        self._unlink_module(module, entry)
+
+    def _invalidate(self, module: str) -> None:
+        """Mark a module and every module whose lookups went through it for re-resolution."""
+        self._dirty.add(module)
+        # A new or removed submodule changes what its parent packages resolve to
+        for prefix in self._prefixes(module):
+            self._dirty.update(self._dependents.get(prefix, ()))
+
+    def _refresh(self) -> None:
+        """Re-resolve the bases of dirty modules and drop affected cached orders."""
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        entries = {module: self._modules.get(module) for module in dirty}
+        stale_roots: Set[str] = set()
+        for module, entry in entries.items():
+            self._forget_lookups(module)
+            if entry is not None:
+                for node in entry.classes.values():
+                    self._unlink_class(node.id)
+
+        for module, entry in entries.items():
+            if entry is None:
+                continue
+            lookups: Set[str] = set()
+            for qualname, node in entry.classes.items():
+                # Resolve from the written bases, kept on the module's analysis
+                bases = tuple(
+                    self._resolve_base(module, text, lookups)
+                    for text in entry.written_bases[qualname]
+                )
+                node = replace(node, bases=bases)
+                entry.classes[qualname] = node
+                self._classes[node.id] = node
+                self._bases[node.id] = bases
+                for base in bases:
+                    self._subclasses.setdefault(base, set()).add(node.id)
+                stale_roots.add(node.id)
+            lookups.discard(module)
+            self._lookups[module] = lookups
+            for other in lookups:
+                self._dependents.setdefault(other, set()).add(module)
+
+        # Orders of changed classes and everything below them are stale
+        stale = set(stale_roots)
+        queue = deque(stale_roots)
+        while queue:
+            for child in self._subclasses.get(queue.popleft(), ()):
+                if child not in stale:
+                    stale.add(child)
+                    queue.append(child)
+        for node in stale:
+            self._mro.pop(node, None)
+
+    def _unlink_module(self, module: str, entry: _Module) -> None:
+        self._forget_lookups(module)
+        for node in entry.classes.values():
+            self._unlink_class(node.id)
+
+    def _unlink_class(self, class_id: str) -> None:
+        self._classes.pop(class_id, None)
+        self._mro.pop(class_id, None)
+        for base in self._bases.pop(class_id, ()):
+            children = self._subclasses.get(base)
+            if children is not None:
+                children.discard(class_id)
+                if not children:
+                    del self._subclasses[base]
+
+    def _forget_lookups(self, module: str) -> None:
+        for other in self._lookups.pop(module, ()):
+            dependents = self._dependents.get(other)
+            if dependents is not None:
+                dependents.discard(module)
+                if not dependents:
+                    del self._dependents[other]
+
+    def _resolve_base(self, module: str, text: str, lookups: Set[str]) -> str:
+        """Resolve a base class expression to a class id, or keep its text."""
+        # Generic[T] and Base() are looked up by the name they start with
+        dotted = text.split("[", 1)[0].split("(", 1)[0].strip()
+        target = self._resolve_path(module, dotted.split("."), lookups, methods=False)
+        if target is not None and target[0] == "class":
+            return target[1]
+        return dotted or text
+
+    def _resolve_path(
+        self,
+        module: str,
+        parts: List[str],
+        lookups: Set[str],
+        methods: bool = True
+    ) -> Optional[_Target]:
+        target = self._lookup(module, parts[0], lookups, set())
+        for part in parts[1:]:
+            if target is None:
+                return None
+            kind, value = target
+            if kind == "module":
+                target = self._lookup(value, part, lookups, set())
+            elif kind == "class":
+                nested = f"{value}.{part}"
+                if self._class_exists(nested):
+                    target = ("class", nested)
+                elif not methods:
+                    # Bases are resolved while orders are being invalidated
+                    return None
+                else:
+                    method = self.find_method(value, part)
+                    target = None if method is None else ("function", method)
+            else:
+                return None
+        return target
+
+    def _lookup(
+        self,
+        module: str,
+        name: str,
+        lookups: Set[str],
+        seen: Set[Tuple[str, str]]
+    ) -> Optional[_Target]:
+        """Resolve a name in a module's namespace, following imports."""
+        if (module, name) in seen:
+            return None
+        seen.add((module, name))
+        lookups.add(module)
+        entry = self._modules.get(module)
+        if entry is not None:
+            node = entry.classes.get(name)
+            if node is not None:
+                return ("class", node.id)
+            if name in entry.functions:
+                return ("function", f"{module}:{name}")
+            binding = entry.bindings.get(name)
+            if binding is not None:
+                target_module, attribute = binding
+                if attribute is None:
+                    return ("module", target_module) if self._module_exists(target_module) else None
+                target = self._lookup(target_module, attribute, lookups, seen)
+                if target is None and self._module_exists(f"{target_module}.{attribute}"):
+                    target = ("module", f"{target_module}.{attribute}")
+                return target
+            for star in entry.star_imports:
+                if not name.startswith("_"):
+                    target = self._lookup(star, name, lookups, seen)
+                    if target is not None:
+                        return target
+        submodule = f"{module}.{name}"
+        if self._module_exists(submodule):
+            lookups.add(submodule)
+            return ("module", submodule)
+        return None
+
+    def _module_exists(self, module: str) -> bool:
+        # Directories without __init__.py are namespace packages
+        return module in self._packages
+
+    def _class_exists(self, class_id: str) -> bool:
+        module, _, qualname = class_id.partition(":")
+        entry = self._modules.get(module)
+        return entry is not None and qualname in entry.classes
+
+    @staticmethod
+    def _prefixes(module: str) -> List[str]:
+        parts = module.split(".")
+        return [".".join(parts[:index]) for index in range(1, len(parts) + 1)]
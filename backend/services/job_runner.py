@@ -0,0 +1,208 @@
+"""
+In-process worker pool for background analysis jobs.
+
+Jobs are persisted through JobRepository; this module only executes them.
+Each job runs on a worker thread with its own database session, so long
+analyses never hold an HTTP connection or the event loop.
+"""
+
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from ..core.config import settings
+from ..database.database import SessionLocal
+from ..models.analysis_job import AnalysisJob, JobStatus
+from ..repositories.job_repository import JobRepository
+from .project_analysis_service import ProjectAnalysisService
+from .syntax_check_service import SyntaxCheckService
+
+# A handler receives the job and a progress callback (completed, total)
+# and returns a JSON-compatible result.
+ProgressCallback = Callable[[int, int], None]
+JobHandler = Callable[[AnalysisJob, ProgressCallback], Any]
+
+
+class JobRunner:
+    """
+    Executes persisted jobs on a bounded thread pool.
+
+    Each process gets a unique worker id. Jobs are claimed with a
+    conditional update, so several Uvicorn workers sharing one database
+    never run the same job twice.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable = SessionLocal,
+        max_workers: int = settings.jobs.max_workers,
+        stale_after_seconds: int = settings.jobs.stale_after_seconds,
+        progress_interval_seconds: float = settings.jobs.progress_interval_seconds
+    ):
+        """
+        Initialize the job runner.
+
+        Args:
+            session_factory: Callable returning a new database session
+            max_workers: Jobs executed concurrently
+            stale_after_seconds: Age after which a running job owned by an
+                unreachable worker is re-queued on recovery
+            progress_interval_seconds: Minimum interval between persisted
+                progress updates
+        """
+        self.session_factory = session_factory
+        self.max_workers = max(1, max_workers)
+        self.stale_after_seconds = stale_after_seconds
+        self.progress_interval_seconds = progress_interval_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._handlers: Dict[str, JobHandler] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """
+        Register the handler for a job kind.
+
+        Args:
+            kind: Job type name
+            handler: Callable executing jobs of that kind
+        """
+        self._handlers[kind] = handler
+
+    @property
+    def kinds(self):
+        """Registered job kinds."""
+        return sorted(self._handlers)
+
+    def enqueue(self, job_id: str) -> None:
+        """
+        Schedule a persisted pending job for execution.
+
+        Args:
+            job_id: Job identifier
+        """
+        self._get_executor().submit(self._run, job_id)
+
+    def recover(self) -> int:
+        """
+        Re-queue unfinished jobs left behind by a previous worker.
+
+        Pending jobs are scheduled again. Running jobs are re-queued when
+        their worker process is known to be gone or has not reported
+        progress within stale_after_seconds.
+
+        Returns:
+            Number of jobs scheduled
+        """
+        scheduled = 0
+        with self.session_factory() as db:
+            repository = JobRepository(db)
+            for job in repository.list_unfinished():
+                if job.status == JobStatus.RUNNING:
+                    if not self._is_abandoned(job):
+                        continue
+                    if not repository.requeue(job.id, job.worker_id):
+                        continue
+                self.enqueue(job.id)
+                scheduled += 1
+        return scheduled
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting jobs and optionally drain the queue.
+
+        Without wait, queued jobs are cancelled; they stay pending in the
+        database and are picked up again by recover().
+
+        Args:
+            wait: Wait for queued and running jobs to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="analysis-job"
+                )
+            return self._executor
+
+    def _run(self, job_id: str) -> None:
+        with self.session_factory() as db:
+            repository = JobRepository(db)
+            if not repository.claim(job_id, self.worker_id):
+                return
+            job = repository.get(job_id)
+            handler = self._handlers.get(job.kind)
+            if handler is None:
+                repository.mark_failed(job_id, self.worker_id, f"Unknown job kind '{job.kind}'")
+                return
+
+            last_update = 0.0
+
+            def progress(completed: int, total: int) -> None:
+                nonlocal last_update
+                now = time.monotonic()
+                if completed < total and now - last_update < self.progress_interval_seconds:
+                    return
+                last_update = now
+                repository.update_progress(job_id, self.worker_id, completed, total)
+
+            try:
+                result = handler(job, progress)
+            except Exception as e:
+                db.rollback()
+                repository.mark_failed(job_id, self.worker_id, f"{type(e).__name__}: {e}")
+            else:
+                repository.mark_succeeded(job_id, self.worker_id, result)
+
+    def _is_abandoned(self, job: AnalysisJob) -> bool:
+        """Whether a running job's worker is gone or silent for too long."""
+        host, pid, _ = (job.worker_id or "::").split(":", 2)
+        if job.worker_id == self.worker_id:
+            return False
+        if host == socket.gethostname() and pid.isdigit():
+            if int(pid) == os.getpid() or not _process_alive(int(pid)):
+                return True
+        updated_at = job.updated_at
+        if updated_at is None:
+            return True
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=timezone.utc)
+        age = datetime.now(timezone.utc) - updated_at
+        return age > timedelta(seconds=self.stale_after_seconds)
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _run_project_analysis(job: AnalysisJob, progress: ProgressCallback) -> Any:
+    return ProjectAnalysisService().analyze_project_sync(job.username, progress)
+
+
+def _run_syntax_check(job: AnalysisJob, progress: ProgressCallback) -> Any:
+    # The upload routes pass the batch's files; without them the whole project is checked
+    filenames = (job.params or {}).get("files")
+    return SyntaxCheckService().check_files_sync(job.username, filenames, progress)
+
+
+# Global runner for this process
+job_runner = JobRunner()
+job_runner.register("project_analysis", _run_project_analysis)
+job_runner.register("syntax_check", _run_syntax_check)
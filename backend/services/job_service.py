@@ -0,0 +1,127 @@
+"""
+Job service for handling background analysis jobs.
+
+This module provides the JobService class that contains the business logic
+for submitting jobs, checking their status and retrieving their results.
+"""
+
+from typing import Any, Dict, List, Optional
+from fastapi import HTTPException, status
+
+from .base_service import BaseService
+from .job_runner import JobRunner, job_runner
+from ..models.analysis_job import AnalysisJob, JobStatus
+from ..repositories.job_repository import JobRepository
+
+
+class JobService(BaseService[JobRepository]):
+    """
+    Service class for background job operations.
+
+    Jobs are persisted before they are handed to the runner, so a job that
+    was accepted is never lost if the worker restarts.
+    """
+
+    def __init__(self, job_repository: JobRepository, runner: JobRunner = job_runner):
+        """
+        Initialize the job service.
+
+        Args:
+            job_repository: Repository for job data access
+            runner: Worker pool that executes the jobs
+        """
+        super().__init__(job_repository)
+        self.runner = runner
+
+    def submit_job(
+        self,
+        username: str,
+        kind: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> AnalysisJob:
+        """
+        Persist a new job and schedule it for execution.
+
+        Args:
+            username: Owner of the job
+            kind: Job type
+            params: Optional job parameters
+
+        Returns:
+            Created job instance
+
+        Raises:
+            HTTPException: If the job kind is unknown
+        """
+        if kind not in self.runner.kinds:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown job kind '{kind}'. Available: {', '.join(self.runner.kinds)}"
+            )
+
+        job = self.repository.create_job(username, kind, params)
+        self.runner.enqueue(job.id)
+        return job
+
+    def get_job(self, job_id: str, username: str) -> AnalysisJob:
+        """
+        Get one of the user's jobs.
+
+        Args:
+            job_id: Job identifier
+            username: Owner of the job
+
+        Returns:
+            Job instance
+
+        Raises:
+            HTTPException: If the job is not found
+        """
+        job = self.repository.get_for_user(job_id, username)
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+        return job
+
+    def list_jobs(self, username: str, limit: int = 20) -> List[AnalysisJob]:
+        """
+        List the user's most recent jobs.
+
+        Args:
+            username: Owner of the jobs
+            limit: Maximum number of jobs to return
+
+        Returns:
+            Jobs, newest first
+        """
+        return self.repository.list_for_user(username, limit)
+
+    @staticmethod
+    def to_dict(job: AnalysisJob, include_result: bool = True) -> Dict[str, Any]:
+        """
+        Serialize a job for API responses.
+
+        Args:
+            job: Job instance
+            include_result: Include the result of a succeeded job
+
+        Returns:
+            Job status, progress and optionally its result
+        """
+        data = {
+            "job_id": job.id,
+            "kind": job.kind,
+            "status": job.status,
+            "progress": job.progress,
+            "completed": job.completed,
+            "total": job.total,
+            "error": job.error,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "finished_at": job.finished_at,
+        }
+        if include_result and job.status == JobStatus.SUCCEEDED:
+            data["result"] = job.result
+        return data
@@ -0,0 +1,70 @@
+"""
+Mapping between uploaded file paths and Python module names.
+
+Uploaded projects are laid out like a source root: ``pkg/sub/mod.py`` is
+module ``pkg.sub.mod`` and ``pkg/__init__.py`` is package ``pkg``. These
+helpers turn file paths into module names and resolve the module named
+by an import statement, including relative imports.
+"""
+
+from typing import Optional
+
+from .code_analyzer import ImportInfo
+
+_INIT = "__init__"
+
+
+def module_name(filename: str) -> str:
+    """
+    Get the module name of an uploaded file.
+
+    Args:
+        filename: "/"-separated path relative to the upload directory
+
+    Returns:
+        Dotted module name; packages are named after their directory
+    """
+    parts = filename[:-3].split("/") if filename.endswith(".py") else filename.split("/")
+    if len(parts) > 1 and parts[-1] == _INIT:
+        parts.pop()
+    return ".".join(parts)
+
+
+def is_package(filename: str) -> bool:
+    """
+    Check whether a file is a package's __init__ module.
+
+    Args:
+        filename: "/"-separated path relative to the upload directory
+
+    Returns:
+        True for ``__init__.py`` files
+    """
+    return filename.rsplit("/", 1)[-1] == f"{_INIT}.py"
+
+
+def imported_module(record: ImportInfo, module: str, package: bool) -> Optional[str]:
+    """
+    Resolve the absolute name of the module an import statement refers to.
+
+    Args:
+        record: The import
+        module: Name of the importing module
+        package: Whether the importing module is a package __init__
+
+    Returns:
+        Absolute module name, or None if a relative import goes above the
+        top-level package
+    """
+    if not record.level:
+        return record.module
+    parts = module.split(".") if module else []
+    if not package:
+        parts = parts[:-1]
+    # One dot is the current package, each further dot its parent
+    if record.level - 1 > len(parts):
+        return None
+    base = parts[:len(parts) - (record.level - 1)]
+    if record.module:
+        base.append(record.module)
+    return ".".join(base) if base else None
@@ -1,6 +1,49 @@
+import posixpath
 from pathlib import Path
 
+from fastapi import HTTPException, status
+
+
 class PathFinder:
+    @staticmethod
+    def normalize(file_name) -> str:
+        """
+        Normalize a user supplied relative path such as "pkg/utils.py".
+
+        Backslashes are treated as separators and "." / ".." segments are
+        resolved, so every spelling of a file maps to one canonical path.
+
+        Raises:
+            HTTPException: If the path is empty, absolute or escapes the
+                user's upload directory
+        """
+        name = str(file_name).replace("\\", "/")
+        if not name or "\x00" in name:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid file path"
+            )
+        if name.startswith("/") or (len(name) > 1 and name[1] == ":"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Path '{file_name}' must be relative"
+            )
+        normalized = posixpath.normpath(name)
+        if normalized == "." or normalized.split("/")[0] == "..":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Path '{file_name}' escapes the upload directory"
+            )
+        return normalized
+
     @staticmethod
     def find_path(file_name, uploaded_dir) -> Path:
-        return Path(uploaded_dir) / file_name
\ No newline at end of file
+        root = Path(uploaded_dir)
+        path = root.joinpath(*PathFinder.normalize(file_name).split("/"))
+        # Reject paths that leave the root through a symlink
+        if not path.resolve().is_relative_to(root.resolve()):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Path '{file_name}' escapes the upload directory"
+            )
+        return path
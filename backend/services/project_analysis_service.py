@@ -0,0 +1,316 @@
+"""
+Project analysis service for analysing all of a user's files at once.
+
+This module provides the ProjectAnalysisService class that collects every
+Python file in the user's upload directory, serves unchanged files from the
+analysis cache and fans the remaining files out to the analysis process
+pool, then merges the per-file results into one project report.
+"""
+
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .base_service import BaseService
+from .analysis_batches import map_batches, run_batches
+from .analysis_cache import AnalysisCache, analysis_cache, content_hash
+from .analysis_executor import AnalysisExecutor, analysis_executor
+from .analysis_scheduler import AnalysisScheduler, analysis_scheduler
+from .check_validation import FileValidator
+from .class_finder import ClassFinder
+from .code_analyzer import CodeAnalyzer, FileAnalysis
+from .file_io import FileIO, file_io
+from .function_finder import FunctionFinder
+from .function_under_class import ClassFunctionFinder
+from .uploaded_dir import get_user_upload_dir
+from ..core.config import settings
+
+
+def analyze_sources(batch: List[Tuple[str, str]]) -> List[Tuple[str, FileAnalysis]]:
+    """
+    Analyse a batch of sources; runs inside a worker process.
+
+    Args:
+        batch: (filename, source) pairs
+
+    Returns:
+        (filename, FileAnalysis) pairs in the same order
+    """
+    return [(filename, CodeAnalyzer.analyze(source)) for filename, source in batch]
+
+
+class ProjectAnalysisService(BaseService[AnalysisCache]):
+    """
+    Service class for project-wide analysis.
+
+    Files whose content is already cached are not sent to the workers;
+    results computed by the workers are added to the shared cache.
+    """
+
+    def __init__(
+        self,
+        cache: AnalysisCache = analysis_cache,
+        executor: AnalysisExecutor = analysis_executor,
+        chunk_size: int = settings.analysis.project_chunk_size,
+        io: FileIO = file_io,
+        scheduler: AnalysisScheduler = analysis_scheduler
+    ):
+        """
+        Initialize the project analysis service.
+
+        Args:
+            cache: Analysis result cache used as the data source
+            executor: Process pool that runs the analyses
+            chunk_size: Number of files sent to a worker per task
+            io: Thread pool that reads the files in analyze_project
+            scheduler: Admission control for analyze_project
+        """
+        super().__init__(cache)
+        self.executor = executor
+        self.chunk_size = max(1, chunk_size)
+        self.io = io
+        self.scheduler = scheduler
+
+    @staticmethod
+    def list_python_files(username: str) -> List[str]:
+        """
+        List the user's Python files, relative to their upload directory.
+
+        Args:
+            username: Username of the file owner
+
+        Returns:
+            Sorted relative paths using "/" as separator
+        """
+        uploaded_dir = get_user_upload_dir(username)
+        files = []
+        for root, dirs, names in os.walk(uploaded_dir):
+            dirs[:] = [name for name in dirs if name != "__pycache__"]
+            for name in names:
+                if FileValidator.isPython(name):
+                    relative = os.path.relpath(os.path.join(root, name), uploaded_dir)
+                    files.append(relative.replace(os.sep, "/"))
+        return sorted(files)
+
+    async def analyze_project(self, username: str) -> Dict[str, Any]:
+        """
+        Analyse every Python file of a user and merge the results.
+
+        Args:
+            username: Username of the project owner
+
+        Returns:
+            Project report with per-file results and totals
+        """
+        analyses, errors, cached = await self.gather_analyses(username)
+        return self._build_report(analyses, errors, cached=cached)
+
+    async def gather_analyses(
+        self,
+        username: str,
+        filenames: Optional[List[str]] = None
+    ) -> Tuple[Dict[str, FileAnalysis], List[Dict[str, str]], int]:
+        """
+        Get the analyses of a user's files, parsing uncached ones through the scheduler.
+
+        Async counterpart of collect_analyses: files are read on the I/O
+        threads, but no thread is held while the workers parse.
+
+        Args:
+            username: Username of the project owner
+            filenames: Relative paths to analyse (default: all Python files)
+
+        Returns:
+            Analyses by filename, per-file errors (unreadable files and
+            files over the analysis budget) and the number of files served
+            from the cache
+
+        Raises:
+            HTTPException: 503 if the analysis workers are saturated
+        """
+        analyses, pending, errors = await self.io.run(self._load_project, username, filenames)
+        cached = len(analyses)
+        keys = {filename: key for filename, _, key in pending}
+
+        async def store(batch_results: List[Tuple[str, FileAnalysis]]) -> None:
+            # Caching writes through to the persistent store, so keep it off the loop
+            await self.io.run(self._store_results, username, keys, batch_results, analyses)
+
+        errors += await map_batches(
+            self.scheduler,
+            analyze_sources,
+            [self._batch_sources(batch) for batch in self._batches(pending)],
+            store,
+        )
+        return analyses, errors, cached
+
+    def analyze_project_sync(
+        self,
+        username: str,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Blocking variant of analyze_project for background jobs.
+
+        Args:
+            username: Username of the project owner
+            progress: Optional callback receiving (files done, total files)
+
+        Returns:
+            Project report with per-file results and totals
+        """
+        analyses, errors, cached = self.collect_analyses(username, progress=progress)
+        return self._build_report(analyses, errors, cached=cached)
+
+    def collect_analyses(
+        self,
+        username: str,
+        filenames: Optional[List[str]] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[Dict[str, FileAnalysis], List[Dict[str, str]], int]:
+        """
+        Get the analyses of a user's files, parsing uncached ones in the pool.
+
+        Blocking; used by background jobs.
+
+        Args:
+            username: Username of the project owner
+            filenames: Relative paths to analyse (default: all Python files)
+            progress: Optional callback receiving (files done, total files)
+
+        Returns:
+            Analyses by filename, per-file errors (unreadable files and
+            files over the analysis budget) and the number of files served
+            from the cache
+        """
+        analyses, pending, errors = self._load_project(username, filenames)
+        cached = len(analyses)
+        total = cached + len(pending)
+        done = cached
+        if progress is not None:
+            progress(done, total)
+
+        keys = {filename: key for filename, _, key in pending}
+
+        def finished(count: int) -> None:
+            nonlocal done
+            done += count
+            if progress is not None:
+                progress(done, total)
+
+        errors += run_batches(
+            self.executor,
+            analyze_sources,
+            [self._batch_sources(batch) for batch in self._batches(pending)],
+            lambda batch_results: self._store_results(username, keys, batch_results, analyses),
+            finished,
+        )
+        return analyses, errors, cached
+
+    def _batches(self, pending: List[Tuple[str, str, str]]) -> List[List[Tuple[str, str, str]]]:
+        """Split pending files into worker-sized chunks."""
+        return [
+            pending[start:start + self.chunk_size]
+            for start in range(0, len(pending), self.chunk_size)
+        ]
+
+    @staticmethod
+    def _batch_sources(batch: List[Tuple[str, str, str]]) -> List[Tuple[str, str]]:
+        """Strip cache keys from a batch before sending it to a worker."""
+        return [(filename, source) for filename, source, _ in batch]
+
+    def _store_results(
+        self,
+        username: str,
+        keys: Dict[str, str],
+        batch_results: List[Tuple[str, FileAnalysis]],
+        analyses: Dict[str, FileAnalysis]
+    ) -> None:
+        """Cache worker results and add them to the collected analyses."""
+        for filename, analysis in batch_results:
+            key = keys[filename]
+            self.repository.put(
+                key, analysis, path_key=AnalysisCache.path_key(username, filename)
+            )
+            analyses[filename] = analysis
+
+    def _load_project(
+        self,
+        username: str,
+        filenames: Optional[List[str]] = None
+    ) -> Tuple[Dict[str, FileAnalysis], List[Tuple[str, str, str]], List[Dict[str, str]]]:
+        """
+        Read the user's files and split them into cache hits and pending work.
+
+        Args:
+            username: Username of the project owner
+            filenames: Relative paths to read (default: all Python files)
+
+        Returns:
+            Cached analyses by filename, pending (filename, source, key)
+            triples and per-file read errors
+        """
+        uploaded_dir = get_user_upload_dir(username)
+        analyses: Dict[str, FileAnalysis] = {}
+        pending: List[Tuple[str, str, str]] = []
+        errors: List[Dict[str, str]] = []
+
+        if filenames is None:
+            filenames = self.list_python_files(username)
+        for filename in filenames:
+            try:
+                with open(os.path.join(uploaded_dir, filename), "r", encoding="utf-8") as file:
+                    source = file.read()
+            except (OSError, UnicodeDecodeError) as e:
+                errors.append({"file": filename, "error": str(e)})
+                continue
+
+            key = AnalysisCache.make_key(content_hash(source))
+            analysis = self.repository.load(key)
+            if analysis is None:
+                pending.append((filename, source, key))
+            else:
+                self.repository.bind_path(AnalysisCache.path_key(username, filename), key)
+                analyses[filename] = analysis
+
+        return analyses, pending, errors
+
+    @staticmethod
+    def _build_report(
+        analyses: Dict[str, FileAnalysis],
+        errors: List[Dict[str, str]],
+        cached: int
+    ) -> Dict[str, Any]:
+        """Merge per-file analyses into a project report."""
+        files = {}
+        summary = {
+            "file_count": len(analyses),
+            "class_count": 0,
+            "function_count": 0,
+            "comment_count": 0,
+            "line_count": 0,
+            "syntax_error_count": 0,
+            "cached_file_count": cached,
+            "unreadable_file_count": sum(1 for error in errors if "budget" not in error),
+            "over_budget_file_count": sum(1 for error in errors if "budget" in error),
+        }
+
+        for filename in sorted(analyses):
+            analysis = analyses[filename]
+            comment_count = len(analysis.hash_comments)
+            files[filename] = {
+                "classes": ClassFinder.find_classes_with_parents(analysis),
+                "functions": FunctionFinder.find_functions(analysis),
+                "functions_under_classes": ClassFunctionFinder.find_functions_by_class(analysis),
+                "comment_count": comment_count,
+                "line_count": analysis.line_count,
+                "syntax_error": (
+                    analysis.syntax_error.to_dict() if analysis.has_syntax_error else None
+                ),
+            }
+            summary["class_count"] += len(analysis.classes)
+            summary["function_count"] += len(analysis.functions)
+            summary["comment_count"] += comment_count
+            summary["line_count"] += analysis.line_count
+            summary["syntax_error_count"] += int(analysis.has_syntax_error)
+
+        return {"summary": summary, "files": files, "errors": errors}
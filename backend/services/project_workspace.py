@@ -0,0 +1,331 @@
+"""
+Per-user, in-memory view of an uploaded project.
+
+A ProjectWorkspace holds the current FileAnalysis of every Python file of
+one user together with project-wide indexes derived from them (symbol
+index, inheritance graph, import graph, call graph). It is synchronised
+with the upload directory by comparing file stamps (mtime and size), so
+only added, modified and deleted files are re-analysed and re-indexed.
+Uploads and deletions made through this process mark the workspace stale
+right away; changes made by other workers are picked up by the periodic
+rescan.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from .check_validation import FileValidator
+from .call_graph import CallGraph
+from .code_analyzer import FileAnalysis
+from .import_graph import ImportGraph
+from .inheritance_graph import InheritanceGraph
+from .project_analysis_service import ProjectAnalysisService
+from .single_flight import SingleFlight
+from .symbol_index import SymbolIndex
+from .uploaded_dir import get_user_upload_dir
+from ..core.config import settings
+
+_Stamp = Tuple[int, int]
+
+
+class ProjectWorkspace:
+    """
+    Analyses and project-wide indexes of one user's project.
+
+    sync() runs on the event loop: the directory scan and the index updates
+    take the workspace lock on an I/O thread, while changed files are parsed
+    through the analysis scheduler without holding the lock or a thread.
+    Reads go through the workspace lock, so the indexes can be read from any
+    thread.
+    """
+
+    def __init__(
+        self,
+        username: str,
+        projects: ProjectAnalysisService,
+        refresh_interval_seconds: float = 2.0
+    ):
+        """
+        Initialize an empty workspace; the first sync() loads the project.
+
+        Args:
+            username: Owner of the project
+            projects: Service used to read and analyse changed files
+            refresh_interval_seconds: How long a sync stays fresh before
+                the upload directory is scanned again
+        """
+        self.username = username
+        self.projects = projects
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.analyses: Dict[str, FileAnalysis] = {}
+        self.symbols = SymbolIndex()
+        self.classes = InheritanceGraph()
+        self.imports = ImportGraph()
+        self.version = 0
+        self.lock = threading.RLock()
+        self._stamps: Dict[str, _Stamp] = {}
+        self._synced_at: Optional[float] = None
+        self._stale = True
+        self._call_graph: Optional[CallGraph] = None
+        self._call_graph_lock = threading.Lock()
+        self._flights = SingleFlight()
+
+    async def sync(self) -> bool:
+        """
+        Bring the workspace up to date with the upload directory.
+
+        Returns immediately while the last sync is fresh; concurrent callers
+        share one sync.
+
+        Returns:
+            Whether any file changed since the previous sync
+
+        Raises:
+            HTTPException: 503 if the analysis workers are saturated
+        """
+        changed = await self._flights.do("sync", self._sync)
+        if self._stale:
+            # Marked stale while the shared sync was already scanning
+            changed = await self._flights.do("sync", self._sync) or changed
+        return changed
+
+    async def _sync(self) -> bool:
+        """Scan, parse the changed files and apply them to the indexes."""
+        io = self.projects.io
+        plan = await io.run(self._plan)
+        if plan is None:
+            return False
+        now, stamps, changed, removed = plan
+
+        analyses: Dict[str, FileAnalysis] = {}
+        if changed:
+            try:
+                analyses, _, _ = await self.projects.gather_analyses(self.username, changed)
+            except BaseException:
+                # Nothing was applied (e.g. the workers were saturated), so rescan next time
+                self._stale = True
+                raise
+            # Unreadable and over-budget files are treated as removed until they change again
+            removed.extend(filename for filename in changed if filename not in analyses)
+        return await io.run(self._apply, now, stamps, analyses, removed)
+
+    def _plan(self) -> Optional[Tuple[float, Dict[str, _Stamp], List[str], List[str]]]:
+        """
+        Stamp the upload directory and diff it against the last sync (blocking).
+
+        Returns:
+            None while the last sync is fresh, otherwise the scan time,
+            the new stamps and the changed and removed files
+        """
+        with self.lock:
+            now = time.monotonic()
+            if (
+                not self._stale
+                and self._synced_at is not None
+                and now - self._synced_at < self.refresh_interval_seconds
+            ):
+                return None
+            # Cleared before scanning, so changes made during this sync mark it again
+            self._stale = False
+
+            # Stamps are taken before reading, so a file written meanwhile is seen again next time
+            stamps = self._scan()
+            changed = [
+                filename for filename, stamp in stamps.items()
+                if self._stamps.get(filename) != stamp
+            ]
+            removed = [filename for filename in self._stamps if filename not in stamps]
+            return now, stamps, changed, removed
+
+    def _apply(
+        self,
+        now: float,
+        stamps: Dict[str, _Stamp],
+        analyses: Dict[str, FileAnalysis],
+        removed: List[str]
+    ) -> bool:
+        """
+        Record a finished sync and update the indexes (blocking).
+
+        Args:
+            now: Time the directory was scanned
+            stamps: Stamps of every file at that time, failed files included
+            analyses: New analyses of the changed files
+            removed: Files deleted or without an analysis
+
+        Returns:
+            Whether any file changed since the previous sync
+        """
+        with self.lock:
+            self._stamps = stamps
+            self._synced_at = now
+            if not analyses and not removed:
+                return False
+            for filename in removed:
+                self.analyses.pop(filename, None)
+            self.analyses.update(analyses)
+            self.symbols.update(analyses, removed)
+            self.classes.update(analyses, removed)
+            self.imports.update(analyses, removed)
+            self.version += 1
+            return True
+
+    def call_graph(self) -> CallGraph:
+        """
+        Get the call graph of the current version of the project.
+
+        The graph is rebuilt lazily after files change and is immutable
+        afterwards, so callers may keep reading it without the lock. The
+        rebuild works on a copy of the analyses taken at one version and
+        only takes the workspace lock to copy and to publish, so other
+        queries are not blocked while a large project's graph is built.
+
+        Returns:
+            Call graph built from the workspace's analyses
+        """
+        with self.lock:
+            graph = self._call_graph
+            if graph is not None and graph.version == self.version:
+                return graph
+        # One rebuild at a time; callers arriving meanwhile reuse its result
+        with self._call_graph_lock:
+            with self.lock:
+                graph = self._call_graph
+                if graph is not None and graph.version == self.version:
+                    return graph
+                version = self.version
+                analyses = dict(self.analyses)
+            # The shared inheritance graph is updated in place by sync(), so
+            # the build resolves against its own graph of the same files
+            classes = InheritanceGraph()
+            classes.update(analyses)
+            graph = CallGraph.build(analyses, classes, version)
+            with self.lock:
+                if self._call_graph is None or self._call_graph.version < version:
+                    self._call_graph = graph
+            return graph
+
+    def mark_stale(self) -> None:
+        """
+        Force the next sync() to rescan, e.g. after an upload or deletion.
+
+        Does not wait for a running sync, so it is safe on the event loop.
+        """
+        self._stale = True
+
+    def _scan(self) -> Dict[str, _Stamp]:
+        """Stamp every Python file below the user's upload directory."""
+        root = get_user_upload_dir(self.username)
+        stamps: Dict[str, _Stamp] = {}
+        pending = [(root, "")]
+        while pending:
+            directory, prefix = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name != "__pycache__":
+                                pending.append((entry.path, f"{prefix}{entry.name}/"))
+                        elif entry.is_file(follow_symlinks=False) and FileValidator.isPython(entry.name):
+                            stat = entry.stat(follow_symlinks=False)
+                            stamps[prefix + entry.name] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                continue
+        return stamps
+
+
+class WorkspaceRegistry:
+    """Process-wide workspaces, keeping the most recently used users in memory."""
+
+    def __init__(self, max_workspaces: int, refresh_interval_seconds: float):
+        """
+        Initialize the registry.
+
+        Args:
+            max_workspaces: Users whose workspace is kept in memory
+            refresh_interval_seconds: Rescan interval of each workspace
+        """
+        self.max_workspaces = max(1, max_workspaces)
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._workspaces: "OrderedDict[str, ProjectWorkspace]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, username: str) -> ProjectWorkspace:
+        """
+        Get a user's workspace, creating an empty one if needed.
+
+        Args:
+            username: Owner of the project
+
+        Returns:
+            The workspace; await sync() before reading it
+        """
+        with self._lock:
+            workspace = self._workspaces.get(username)
+            if workspace is None:
+                workspace = ProjectWorkspace(
+                    username,
+                    ProjectAnalysisService(),
+                    refresh_interval_seconds=self.refresh_interval_seconds,
+                )
+                self._workspaces[username] = workspace
+                while len(self._workspaces) > self.max_workspaces:
+                    self._workspaces.popitem(last=False)
+            else:
+                self._workspaces.move_to_end(username)
+            return workspace
+
+    async def get_synced(self, username: str) -> ProjectWorkspace:
+        """
+        Get a user's workspace, synchronised with the upload directory.
+
+        Args:
+            username: Owner of the project
+
+        Returns:
+            The workspace, ready to be read under its lock
+
+        Raises:
+            HTTPException: 503 if the analysis workers are saturated
+        """
+        workspace = self.get(username)
+        await workspace.sync()
+        return workspace
+
+    def mark_stale(self, username: str) -> None:
+        """
+        Make a user's workspace rescan on its next use, if it is loaded.
+
+        Args:
+            username: Owner of the project
+        """
+        with self._lock:
+            workspace = self._workspaces.get(username)
+        if workspace is not None:
+            workspace.mark_stale()
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Loaded workspaces with their file and symbol counts
+        """
+        with self._lock:
+            workspaces: List[ProjectWorkspace] = list(self._workspaces.values())
+        return {
+            "workspaces": len(workspaces),
+            "max_workspaces": self.max_workspaces,
+            "files": sum(len(workspace.analyses) for workspace in workspaces),
+            "symbols": sum(len(workspace.symbols) for workspace in workspaces),
+        }
+
+
+# Global workspaces of the users active in this process
+project_workspaces = WorkspaceRegistry(
+    max_workspaces=settings.analysis.workspace_max_users,
+    refresh_interval_seconds=settings.analysis.workspace_refresh_seconds,
+)
@@ -0,0 +1,76 @@
+"""
+Request coalescing for identical concurrent work.
+
+Opening a file in the frontend fires the class, function, method and
+comment requests at once, often from several tabs. SingleFlight lets the
+first request for a key do the work while every concurrent request for
+the same key awaits that one computation instead of repeating it.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent async calls by key.
+
+    The work runs in its own task, so a caller that is cancelled (e.g. a
+    closed browser tab) does not cancel the result the others wait for.
+    The key is forgotten as soon as the work finishes; caching results is
+    left to the caller.
+    """
+
+    def __init__(self):
+        """Initialize an empty set of in-flight calls."""
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.executions = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn once for all concurrent callers with the same key.
+
+        Args:
+            key: Identity of the work
+            fn: Coroutine function doing the work
+
+        Returns:
+            Result of the shared call (exceptions are shared as well)
+        """
+        loop = asyncio.get_running_loop()
+        task = self._calls.get(key)
+        if task is not None and task.get_loop() is loop and not task.done():
+            self.shared += 1
+        else:
+            task = loop.create_task(fn())
+            self._calls[key] = task
+            self.executions += 1
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            In-flight keys, executed calls and calls served by another one
+        """
+        return {
+            "in_flight": len(self._calls),
+            "executions": self.executions,
+            "shared": self.shared,
+        }
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller went away
+            task.exception()
+
+
+# Global coalescer for the analysis routes in this process
+analysis_flights = SingleFlight()
@@ -0,0 +1,166 @@
+"""
+Sorted index of the symbols defined across a user's project.
+
+Symbols (classes, functions and methods) are kept in one list sorted by
+their case-folded name, so a prefix query is a binary search followed by
+a scan of the matches. Files are added and removed incrementally; large
+batches are merged with a single sort instead of one insertion each.
+"""
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .code_analyzer import FileAnalysis
+
+CLASS_KIND = "class"
+FUNCTION_KIND = "function"
+METHOD_KIND = "method"
+
+SYMBOL_KINDS = (CLASS_KIND, FUNCTION_KIND, METHOD_KIND)
+
+# (folded name, file, line, qualname, kind, name); tuples sort by name first
+_Entry = Tuple[str, str, int, str, str, str]
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """A class, function or method definition in one of the user's files."""
+    name: str
+    kind: str
+    qualname: str
+    file: str
+    line: int
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the symbol to plain JSON-compatible data.
+
+        Returns:
+            Dictionary representation of the symbol
+        """
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "qualname": self.qualname,
+            "file": self.file,
+            "line": self.line,
+        }
+
+
+def symbols_of(filename: str, analysis: FileAnalysis) -> List[Symbol]:
+    """
+    List the symbols defined in an analysed file.
+
+    Args:
+        filename: Relative path of the file
+        analysis: Its analysis
+
+    Returns:
+        Classes, then functions and methods, in source order
+    """
+    symbols = [
+        Symbol(cls.name, CLASS_KIND, cls.qualname, filename, cls.line)
+        for cls in analysis.classes
+    ]
+    symbols.extend(
+        Symbol(
+            func.name,
+            METHOD_KIND if func.parent_class else FUNCTION_KIND,
+            func.qualname,
+            filename,
+            func.line,
+        )
+        for func in analysis.functions
+    )
+    return symbols
+
+
+class SymbolIndex:
+    """
+    Case-insensitive prefix index over symbols, updatable per file.
+
+    Not thread-safe; the owning workspace serializes updates and queries.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._entries: List[_Entry] = []
+        self._by_file: Dict[str, List[_Entry]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def update(
+        self,
+        changed: Dict[str, FileAnalysis],
+        removed: Iterable[str] = ()
+    ) -> None:
+        """
+        Replace the symbols of changed files and drop those of removed files.
+
+        Args:
+            changed: Current analyses of added or modified files
+            removed: Relative paths of deleted files
+        """
+        stale = [
+            entry
+            for filename in list(removed) + list(changed)
+            for entry in self._by_file.pop(filename, ())
+        ]
+        fresh: List[_Entry] = []
+        for filename, analysis in changed.items():
+            entries = [self._entry(symbol) for symbol in symbols_of(filename, analysis)]
+            self._by_file[filename] = entries
+            fresh.extend(entries)
+
+        # Each single edit moves the tail of the list; past a point one sort is cheaper
+        if len(stale) + len(fresh) > len(self._entries) // 8:
+            self._entries = sorted(
+                entry for entries in self._by_file.values() for entry in entries
+            )
+            return
+        for entry in stale:
+            index = bisect_left(self._entries, entry)
+            if index < len(self._entries) and self._entries[index] == entry:
+                del self._entries[index]
+        for entry in fresh:
+            insort(self._entries, entry)
+
+    def search(
+        self,
+        prefix: str,
+        kind: Optional[str] = None,
+        limit: int = 50
+    ) -> Tuple[List[Symbol], bool]:
+        """
+        Find symbols whose name starts with a prefix, ignoring case.
+
+        Args:
+            prefix: Name prefix; an empty prefix matches every symbol
+            kind: Only return symbols of this kind
+            limit: Maximum number of symbols to return
+
+        Returns:
+            Matches ordered by name, file and line, and whether more
+            matches were left out
+        """
+        folded = prefix.casefold()
+        matches: List[Symbol] = []
+        for index in range(bisect_left(self._entries, (folded,)), len(self._entries)):
+            entry = self._entries[index]
+            if not entry[0].startswith(folded):
+                break
+            if kind is not None and entry[4] != kind:
+                continue
+            if len(matches) == limit:
+                return matches, True
+            matches.append(Symbol(entry[5], entry[4], entry[3], entry[1], entry[2]))
+        return matches, False
+
+    @staticmethod
+    def _entry(symbol: Symbol) -> _Entry:
+        return (
+            symbol.name.casefold(), symbol.file, symbol.line,
+            symbol.qualname, symbol.kind, symbol.name,
+        )
@@ -0,0 +1,83 @@
+"""
+Symbol service for searching definitions across a user's project.
+
+This module provides the SymbolService class that answers "where is this
+defined" queries from the user's project workspace, which keeps a sorted
+symbol index up to date as files are uploaded and deleted.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from .base_service import BaseService
+from .file_io import FileIO, file_io
+from .project_workspace import ProjectWorkspace, WorkspaceRegistry, project_workspaces
+from .symbol_index import SYMBOL_KINDS, Symbol
+
+
+class SymbolService(BaseService[WorkspaceRegistry]):
+    """Service class for cross-file symbol search."""
+
+    def __init__(
+        self,
+        workspaces: WorkspaceRegistry = project_workspaces,
+        io: FileIO = file_io
+    ):
+        """
+        Initialize the symbol service.
+
+        Args:
+            workspaces: Per-user project workspaces used as the data source
+            io: Thread pool that searches the symbol index off the event loop
+        """
+        super().__init__(workspaces)
+        self.io = io
+
+    async def search(
+        self,
+        username: str,
+        query: str,
+        kind: Optional[str] = None,
+        limit: int = 50
+    ) -> Dict[str, Any]:
+        """
+        Find classes, functions and methods whose name starts with a prefix.
+
+        Args:
+            username: Owner of the project
+            query: Case-insensitive name prefix
+            kind: Only return "class", "function" or "method" symbols
+            limit: Maximum number of symbols to return
+
+        Returns:
+            Matching symbols with file and line, and whether the result
+            was truncated
+
+        Raises:
+            HTTPException: If kind is not a known symbol kind
+        """
+        if kind is not None and kind not in SYMBOL_KINDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"kind must be one of: {', '.join(SYMBOL_KINDS)}"
+            )
+        symbols, truncated = await self.io.run(
+            self._search, await self.repository.get_synced(username), query, kind, limit
+        )
+        return {
+            "query": query,
+            "symbols": [symbol.to_dict() for symbol in symbols],
+            "truncated": truncated,
+        }
+
+    @staticmethod
+    def _search(
+        workspace: ProjectWorkspace,
+        query: str,
+        kind: Optional[str],
+        limit: int
+    ) -> Tuple[List[Symbol], bool]:
+        """Query the workspace's symbol index (blocking)."""
+        with workspace.lock:
+            return workspace.symbols.search(query, kind=kind, limit=limit)
@@ -0,0 +1,243 @@
+"""
+Syntax check service for compiling a user's files in the analysis pool.
+
+This module provides the SyntaxCheckService class that compiles uploaded
+Python files in the analysis worker processes and reports structured
+errors. Results are cached by content hash like analyses are, so a file
+whose content was checked before is never compiled again.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from .base_service import BaseService
+from .analysis_batches import map_batches, run_batches
+from .analysis_cache import AnalysisCache, analysis_cache, content_hash
+from .analysis_executor import AnalysisExecutor, analysis_executor
+from .analysis_scheduler import AnalysisScheduler, analysis_scheduler
+from .file_io import FileIO, file_io
+from .path_finder import PathFinder
+from .project_analysis_service import ProjectAnalysisService
+from .syntax_checker import (
+    SYNTAX_CHECKER_NAME,
+    SYNTAX_CHECKER_VERSION,
+    SyntaxCheck,
+    check_sources,
+)
+from .uploaded_dir import get_user_upload_dir
+from ..core.config import settings
+
+# (filename, source, cache key) of a file that still has to be compiled
+_Pending = Tuple[str, str, str]
+
+
+class SyntaxCheckService(BaseService[AnalysisCache]):
+    """
+    Service class for multi-file syntax checks.
+
+    Checks share the analysis cache and its persistent tier under their
+    own analyzer name; they are not bound to user paths, since a file's
+    analysis and check are both reached through its content hash.
+    """
+
+    def __init__(
+        self,
+        cache: AnalysisCache = analysis_cache,
+        executor: AnalysisExecutor = analysis_executor,
+        chunk_size: int = settings.analysis.project_chunk_size,
+        io: FileIO = file_io,
+        scheduler: AnalysisScheduler = analysis_scheduler
+    ):
+        """
+        Initialize the syntax check service.
+
+        Args:
+            cache: Analysis result cache used as the data source
+            executor: Process pool that compiles the files in check_files_sync
+            chunk_size: Number of files sent to a worker per task
+            io: Thread pool that reads the files in check_files
+            scheduler: Admission control for check_files
+        """
+        super().__init__(cache)
+        self.executor = executor
+        self.chunk_size = max(1, chunk_size)
+        self.io = io
+        self.scheduler = scheduler
+
+    @staticmethod
+    def make_key(source: str) -> str:
+        """
+        Build the cache key of a source's syntax check.
+
+        Args:
+            source: Python source text
+
+        Returns:
+            Cache key
+        """
+        return AnalysisCache.make_key(
+            content_hash(source), SYNTAX_CHECKER_NAME, SYNTAX_CHECKER_VERSION
+        )
+
+    async def check_files(
+        self,
+        username: str,
+        filenames: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Compile a user's files and report their syntax errors.
+
+        Args:
+            username: Username of the file owner
+            filenames: Relative paths to check (default: all Python files)
+
+        Returns:
+            Report with a summary, one entry per error, unreadable files
+            and files over the analysis budget
+
+        Raises:
+            HTTPException: 503 if the analysis workers are saturated
+        """
+        checks, pending, unreadable = await self.io.run(self._load, username, filenames)
+        cached = len(checks)
+        keys = {filename: key for filename, _, key in pending}
+
+        async def store(batch_results: List[Tuple[str, SyntaxCheck]]) -> None:
+            # Caching writes through to the persistent store, so keep it off the loop
+            await self.io.run(self._store_results, keys, batch_results, checks)
+
+        over_budget = await map_batches(
+            self.scheduler, check_sources, self._batch_sources(pending), store
+        )
+        return self._build_report(checks, unreadable, over_budget, cached)
+
+    def check_files_sync(
+        self,
+        username: str,
+        filenames: Optional[List[str]] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Blocking variant of check_files for background jobs.
+
+        Args:
+            username: Username of the file owner
+            filenames: Relative paths to check (default: all Python files)
+            progress: Optional callback receiving (files done, total files)
+
+        Returns:
+            Report with a summary, one entry per error, unreadable files
+            and files over the analysis budget
+        """
+        checks, pending, unreadable = self._load(username, filenames)
+        cached = len(checks)
+        total = cached + len(pending)
+        done = cached
+        if progress is not None:
+            progress(done, total)
+
+        keys = {filename: key for filename, _, key in pending}
+
+        def finished(count: int) -> None:
+            nonlocal done
+            done += count
+            if progress is not None:
+                progress(done, total)
+
+        over_budget = run_batches(
+            self.executor,
+            check_sources,
+            self._batch_sources(pending),
+            lambda batch_results: self._store_results(keys, batch_results, checks),
+            finished,
+        )
+        return self._build_report(checks, unreadable, over_budget, cached)
+
+    def _batch_sources(self, pending: List[_Pending]) -> List[List[Tuple[str, str]]]:
+        """Split pending files into worker-sized (filename, source) chunks."""
+        return [
+            [(filename, source) for filename, source, _ in pending[start:start + self.chunk_size]]
+            for start in range(0, len(pending), self.chunk_size)
+        ]
+
+    def _store_results(
+        self,
+        keys: Dict[str, str],
+        batch_results: List[Tuple[str, SyntaxCheck]],
+        checks: Dict[str, SyntaxCheck]
+    ) -> None:
+        """Cache worker results and add them to the collected checks."""
+        for filename, check in batch_results:
+            self.repository.put(keys[filename], check)
+            checks[filename] = check
+
+    def _load(
+        self,
+        username: str,
+        filenames: Optional[List[str]]
+    ) -> Tuple[Dict[str, SyntaxCheck], List[_Pending], List[Dict[str, str]]]:
+        """
+        Read the files and split them into cache hits and pending work.
+
+        Args:
+            username: Username of the file owner
+            filenames: Relative paths to read (default: all Python files)
+
+        Returns:
+            Cached checks by filename, pending (filename, source, key)
+            triples and per-file read errors
+        """
+        uploaded_dir = get_user_upload_dir(username)
+        checks: Dict[str, SyntaxCheck] = {}
+        pending: List[_Pending] = []
+        unreadable: List[Dict[str, str]] = []
+
+        if filenames is None:
+            filenames = ProjectAnalysisService.list_python_files(username)
+        for filename in filenames:
+            try:
+                path = PathFinder.find_path(filename, uploaded_dir)
+                with open(path, "r", encoding="utf-8") as file:
+                    source = file.read()
+            except HTTPException as e:
+                unreadable.append({"file": filename, "error": str(e.detail)})
+                continue
+            except (OSError, UnicodeDecodeError) as e:
+                unreadable.append({"file": filename, "error": str(e)})
+                continue
+
+            key = self.make_key(source)
+            check = self.repository.load(key)
+            if check is None:
+                pending.append((filename, source, key))
+            else:
+                checks[filename] = check
+
+        return checks, pending, unreadable
+
+    @staticmethod
+    def _build_report(
+        checks: Dict[str, SyntaxCheck],
+        unreadable: List[Dict[str, str]],
+        over_budget: List[Dict[str, str]],
+        cached: int
+    ) -> Dict[str, Any]:
+        """Merge per-file checks into a report listing every error."""
+        errors = []
+        for filename in sorted(checks):
+            check = checks[filename]
+            if not check.ok:
+                errors.append({"file": filename, **check.error.to_dict()})
+        return {
+            "summary": {
+                "file_count": len(checks),
+                "error_count": len(errors),
+                "cached_file_count": cached,
+                "unreadable_file_count": len(unreadable),
+                "over_budget_file_count": len(over_budget),
+            },
+            "errors": errors,
+            "unreadable": unreadable,
+            "over_budget": over_budget,
+        }
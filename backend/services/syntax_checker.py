@@ -0,0 +1,157 @@
+"""
+Byte-compilation syntax check for uploaded Python files.
+
+Parsing alone (what CodeAnalyzer does) misses errors that Python only
+reports while compiling, such as ``return`` outside a function,
+``nonlocal`` without a binding or duplicate argument names. The checker
+runs the full ``compile()`` and reports the first error of a file with
+its exact location.
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Compile errors depend on the interpreter's grammar, so the Python
+# version is part of the cache identity. Bump the leading number whenever
+# the shape of SyntaxCheck changes.
+SYNTAX_CHECKER_NAME = "syntax"
+SYNTAX_CHECKER_VERSION = f"2-py{sys.version_info[0]}{sys.version_info[1]}"
+
+_RECORD_OVERHEAD = 120
+
+
+@dataclass(frozen=True)
+class SyntaxIssue:
+    """Location, type and message of the error that stopped compilation."""
+    error_type: str
+    message: str
+    line: Optional[int]
+    column: Optional[int]
+    end_line: Optional[int] = None
+    end_column: Optional[int] = None
+    text: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the error to plain JSON-compatible data.
+
+        Returns:
+            Dictionary representation of the error
+        """
+        return {
+            "error_type": self.error_type,
+            "message": self.message,
+            "line": self.line,
+            "column": self.column,
+            "end_line": self.end_line,
+            "end_column": self.end_column,
+            "text": self.text,
+        }
+
+
+@dataclass(frozen=True)
+class SyntaxCheck:
+    """Immutable result of compiling one source file; ``error`` is None if it compiles."""
+    error: Optional[SyntaxIssue] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the source compiled."""
+        return self.error is None
+
+    def approximate_size(self) -> int:
+        """
+        Estimate the memory held by this result in bytes.
+
+        Returns:
+            Approximate size in bytes
+        """
+        if self.error is None:
+            return _RECORD_OVERHEAD
+        return 2 * _RECORD_OVERHEAD + len(self.error.message) + len(self.error.text or "")
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Convert the result to plain JSON-compatible data.
+
+        Returns:
+            Dictionary representation of the result
+        """
+        return {"error": self.error.to_dict() if self.error is not None else None}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "SyntaxCheck":
+        """
+        Rebuild a result from the output of to_dict.
+
+        Args:
+            data: Dictionary representation of a result
+
+        Returns:
+            Equal SyntaxCheck instance
+        """
+        error = data.get("error")
+        return cls(error=SyntaxIssue(**error) if error else None)
+
+
+class SyntaxChecker:
+    """Compiles sources without executing them."""
+
+    @staticmethod
+    def check(source: str, filename: str = "<unknown>") -> SyntaxCheck:
+        """
+        Compile a source and capture the first error.
+
+        Args:
+            source: Python source text
+            filename: Name reported by the compiler
+
+        Returns:
+            SyntaxCheck for the source
+
+        Raises:
+            RecursionError: If the source is nested too deeply to compile
+            MemoryError: If compiling ran out of memory
+        """
+        try:
+            compile(source, filename, "exec", dont_inherit=True)
+        except SyntaxError as e:
+            text = e.text
+            if text is None and e.lineno:
+                # Errors found after parsing do not carry the offending line
+                lines = source.splitlines()
+                text = lines[e.lineno - 1] if e.lineno <= len(lines) else None
+            text = text.rstrip("\r\n") if text else None
+            return SyntaxCheck(SyntaxIssue(
+                error_type=type(e).__name__,
+                message=e.msg or str(e),
+                line=e.lineno,
+                column=e.offset,
+                end_line=getattr(e, "end_lineno", None),
+                end_column=getattr(e, "end_offset", None),
+                text=text,
+            ))
+        except (ValueError, OverflowError) as e:
+            # Null bytes (before Python 3.12) or literals out of range; running
+            # out of memory or stack is a budget failure and propagates uncached
+            return SyntaxCheck(SyntaxIssue(
+                error_type=type(e).__name__,
+                message=str(e) or type(e).__name__,
+                line=None,
+                column=None,
+            ))
+        return SyntaxCheck()
+
+
+def check_sources(batch: List[Tuple[str, str]]) -> List[Tuple[str, SyntaxCheck]]:
+    """
+    Check a batch of sources; runs inside a worker process.
+
+    Args:
+        batch: (filename, source) pairs
+
+    Returns:
+        (filename, SyntaxCheck) pairs in the same order
+    """
+    return [(filename, SyntaxChecker.check(source, filename)) for filename, source in batch]
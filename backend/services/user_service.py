@@ -3,19 +3,31 @@ User service for handling user-related business logic.
 
 This module provides the UserService class that contains all business logic
 related to user operations, including authentication and user management.
+The service works with UserRepository (sync Session) and AsyncUserRepository
+(AsyncSession); its methods are coroutines either way.
 """
 
-from typing import Optional
+import csv
+import io
+import json
+from typing import Any, Dict, List, Optional, Union
 from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 
-from .base_service import BaseService
-from ..repositories.user_repository import UserRepository
-from ..models.user import User, UserInDB
+from .base_service import BaseService, maybe_await
+from ..repositories.user_repository import AsyncUserRepository, UserRepository
+from ..core.config import settings
+from ..models.user import User, UserInDB, UserRegistration
 from ..models.userInAlchemy import UserInAlchemy
-from ..security.auth import get_password_hash, verify_password, authenticate_user
+from ..security.password_hasher import password_hasher
+from ..security.user_cache import user_cache
 
 
-class UserService(BaseService[UserRepository]):
+UserRepositoryType = Union[UserRepository, AsyncUserRepository]
+
+
+class UserService(BaseService[UserRepositoryType]):
     """
     Service class for user-related business operations.
     
@@ -23,16 +35,16 @@ class UserService(BaseService[UserRepository]):
     including registration, authentication, and user management.
     """
     
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepositoryType):
         """
         Initialize the user service.
         
         Args:
-            user_repository: Repository for user data access
+            user_repository: Sync or async repository for user data access
         """
         super().__init__(user_repository)
     
-    def register_user(self, user: User, password: str, email: str) -> UserInAlchemy:
+    async def register_user(self, user: User, password: str, email: str) -> UserInAlchemy:
         """
         Register a new user with validation and password hashing.
         
@@ -48,33 +60,193 @@ class UserService(BaseService[UserRepository]):
             HTTPException: If user already exists or validation fails
         """
         # Check if username already exists
-        if self.repository.username_exists(user.username):
+        if await maybe_await(self.repository.username_exists(user.username)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already exists"
             )
         
         # Check if email already exists
-        if self.repository.email_exists(email):
+        if await maybe_await(self.repository.email_exists(email)):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
         
-        # Hash password and create user
-        hashed_password = get_password_hash(password)
+        # Hash password on the password executor and create user
+        hashed_password = await password_hasher.hash_async(password)
         user_data = UserInDB(
             **user.model_dump(),
             email=email,
             hashed_password=hashed_password
         )
         
-        return self.repository.create_user(user_data)
+        return await maybe_await(self.repository.create_user(user_data))
+    
+    async def register_users(
+        self,
+        entries: List[Any],
+        max_rows: int = settings.security.bulk_register_max_rows
+    ) -> Dict[str, Any]:
+        """
+        Register many users at once, e.g. a class of students.
+        
+        Rows are validated individually; taken usernames and emails are
+        found with one query per batch, the passwords are hashed in
+        parallel and all new users are inserted in one transaction.
+        
+        Args:
+            entries: Rows with username, password, email and optional full_name
+            max_rows: Maximum number of rows accepted
+            
+        Returns:
+            Number of created and failed rows and a result per row
+            
+        Raises:
+            HTTPException: 413 if there are too many rows, 409 if a user was
+                registered concurrently, or 503 if another batch is running
+        """
+        if len(entries) > max_rows:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {max_rows} users can be registered per request"
+            )
+        
+        results: List[Dict[str, Any]] = [
+            {"row": index, "username": entry.get("username") if isinstance(entry, dict) else None}
+            for index, entry in enumerate(entries)
+        ]
+        registrations: Dict[int, UserRegistration] = {}
+        seen_usernames, seen_emails = set(), set()
+        for index, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                results[index].update(status="error", detail="Expected an object with user fields")
+                continue
+            try:
+                registration = UserRegistration(**entry)
+            except ValidationError as e:
+                detail = "; ".join(
+                    f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                    for error in e.errors()
+                )
+                results[index].update(status="error", detail=detail)
+                continue
+            if registration.username in seen_usernames:
+                results[index].update(status="error", detail="Duplicate username in request")
+                continue
+            if registration.email in seen_emails:
+                results[index].update(status="error", detail="Duplicate email in request")
+                continue
+            seen_usernames.add(registration.username)
+            seen_emails.add(registration.email)
+            registrations[index] = registration
+        
+        taken_usernames, taken_emails = await maybe_await(
+            self.repository.find_taken(list(seen_usernames), list(seen_emails))
+        )
+        for index, registration in list(registrations.items()):
+            if registration.username in taken_usernames:
+                results[index].update(status="error", detail="Username already exists")
+            elif registration.email in taken_emails:
+                results[index].update(status="error", detail="Email already registered")
+            else:
+                continue
+            del registrations[index]
+        
+        hashes = await password_hasher.hash_many_async(
+            [registration.password for registration in registrations.values()]
+        )
+        users = [
+            UserInDB(
+                username=registration.username,
+                email=registration.email,
+                full_name=registration.full_name,
+                disabled=False,
+                hashed_password=hashed_password
+            )
+            for registration, hashed_password in zip(registrations.values(), hashes)
+        ]
+        try:
+            await maybe_await(self.repository.bulk_create(users))
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Some users were registered by another request meanwhile, please retry"
+            )
+        
+        for index in registrations:
+            results[index]["status"] = "created"
+        return {
+            "created": len(registrations),
+            "failed": len(entries) - len(registrations),
+            "results": results
+        }
+    
+    @staticmethod
+    def parse_registrations(content: bytes, content_type: str) -> List[Any]:
+        """
+        Parse the body of a bulk registration request.
+        
+        Args:
+            content: JSON list of objects, or CSV with a header row
+                (username,password,email[,full_name])
+            content_type: "application/json" or "text/csv"
+            
+        Returns:
+            One entry per row
+            
+        Raises:
+            HTTPException: If the body cannot be parsed
+        """
+        try:
+            text = content.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Registration data must be UTF-8"
+            )
+        
+        if "csv" in content_type:
+            reader = csv.DictReader(io.StringIO(text))
+            missing = {"username", "password", "email"} - set(reader.fieldnames or [])
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"CSV header is missing: {', '.join(sorted(missing))}"
+                )
+            # Empty cells mean "not given", e.g. an optional full name
+            return [
+                {key: value for key, value in row.items() if key and value}
+                for row in reader
+            ]
+        
+        if "json" in content_type:
+            try:
+                entries = json.loads(text)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid JSON: {str(e)}"
+                )
+            if not isinstance(entries, list):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Expected a JSON list of users"
+                )
+            return entries
+        
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send the users as application/json or text/csv"
+        )
     
-    def authenticate_user(self, username: str, password: str) -> Optional[UserInAlchemy]:
+    async def authenticate_user(self, username: str, password: str) -> Optional[UserInAlchemy]:
         """
         Authenticate a user with username and password.
         
+        A hash created with an outdated bcrypt cost is replaced after a
+        successful verification.
+        
         Args:
             username: User's username
             password: Plain text password
@@ -82,16 +254,22 @@ class UserService(BaseService[UserRepository]):
         Returns:
             User instance if authentication successful, None otherwise
         """
-        user = self.repository.get_by_username(username)
+        user = await maybe_await(self.repository.get_by_username(username))
         if not user:
             return None
         
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = await password_hasher.verify_and_update_async(
+            password, user.hashed_password
+        )
+        if not verified:
             return None
+        if new_hash:
+            await maybe_await(self.repository.update_hashed_password(username, new_hash))
+            user_cache.invalidate(username)
         
         return user
     
-    def get_user_by_username(self, username: str) -> Optional[UserInAlchemy]:
+    async def get_user_by_username(self, username: str) -> Optional[UserInAlchemy]:
         """
         Get user by username.
         
@@ -101,9 +279,9 @@ class UserService(BaseService[UserRepository]):
         Returns:
             User instance or None if not found
         """
-        return self.repository.get_by_username(username)
+        return await maybe_await(self.repository.get_by_username(username))
     
-    def get_user_by_email(self, email: str) -> Optional[UserInAlchemy]:
+    async def get_user_by_email(self, email: str) -> Optional[UserInAlchemy]:
         """
         Get user by email.
         
@@ -113,9 +291,9 @@ class UserService(BaseService[UserRepository]):
         Returns:
             User instance or None if not found
         """
-        return self.repository.get_by_email(email)
+        return await maybe_await(self.repository.get_by_email(email))
     
-    def update_user(self, username: str, user_data: User) -> UserInAlchemy:
+    async def update_user(self, username: str, user_data: User) -> UserInAlchemy:
         """
         Update user information.
         
@@ -129,7 +307,9 @@ class UserService(BaseService[UserRepository]):
         Raises:
             HTTPException: If user not found
         """
-        user = self.repository.update_user_by_username(username, user_data)
+        user = await maybe_await(self.repository.update_user_by_username(username, user_data))
+        # Also covers disabling a user: the next request reloads the row
+        user_cache.invalidate(username)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -138,7 +318,7 @@ class UserService(BaseService[UserRepository]):
         
         return user
     
-    def delete_user(self, username: str) -> UserInAlchemy:
+    async def delete_user(self, username: str) -> UserInAlchemy:
         """
         Delete a user.
         
@@ -151,7 +331,8 @@ class UserService(BaseService[UserRepository]):
         Raises:
             HTTPException: If user not found
         """
-        user = self.repository.delete_by_username(username)
+        user = await maybe_await(self.repository.delete_by_username(username))
+        user_cache.invalidate(username)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -160,7 +341,48 @@ class UserService(BaseService[UserRepository]):
         
         return user
     
-    def get_current_user_info(self, username: str) -> User:
+    async def list_users(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        order_by: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        List users one keyset page at a time.
+        
+        Args:
+            limit: Maximum number of users to return
+            cursor: next_cursor of the previous page
+            order_by: "created_at", or None to order by username
+            
+        Returns:
+            Users without sensitive data and the cursor of the next page
+            
+        Raises:
+            HTTPException: If the cursor or ordering is invalid
+        """
+        try:
+            page = await maybe_await(self.repository.get_page(limit, cursor, order_by))
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        
+        return {
+            "users": [
+                User(
+                    username=user.username,
+                    email=user.email,
+                    full_name=user.full_name,
+                    disabled=user.disabled
+                )
+                for user in page.items
+            ],
+            "next_cursor": page.next_cursor
+        }
+    
+    async def get_current_user_info(self, username: str) -> User:
         """
         Get current user information (without sensitive data).
         
@@ -173,7 +395,7 @@ class UserService(BaseService[UserRepository]):
         Raises:
             HTTPException: If user not found
         """
-        user = self.repository.get_by_username(username)
+        user = await maybe_await(self.repository.get_by_username(username))
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from ...services import project_analysis_service
+from ...services.analysis_batches import map_batches, run_batches
+from ...services.analysis_cache import AnalysisCache
+from ...services.analysis_executor import AnalysisBudgetError
+from ...services.analysis_scheduler import AnalysisScheduler
+from ...services.project_analysis_service import ProjectAnalysisService, analyze_sources
+
+
+def measure(batch):
+    # Stands in for a worker task whose budget covers the whole batch
+    if any(filename.startswith("huge") for filename, _ in batch):
+        raise AnalysisBudgetError("time", 5)
+    return [(filename, len(source)) for filename, source in batch]
+
+
+def test_over_budget_batches_are_split_and_the_rest_kept():
+    batches = [[("a.py", "a"), ("huge.py", "hh")], [("b.py", "bbb")], [("huge2.py", "")]]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stored, done = [], []
+        errors = run_batches(executor, measure, batches, stored.extend, done.append)
+        assert sorted(stored) == [("a.py", 1), ("b.py", 3)]
+        assert sum(done) == 4
+
+        scheduler = AnalysisScheduler(executor, max_concurrency=2, max_queue=1)
+        mapped = []
+
+        async def store(results):
+            mapped.extend(results)
+
+        async_errors = asyncio.run(map_batches(scheduler, measure, batches, store))
+
+    assert sorted(mapped) == sorted(stored)
+    for found in (errors, async_errors):
+        assert sorted(error["file"] for error in found) == ["huge.py", "huge2.py"]
+        assert {error["budget"] for error in found} == {"time"}
+        assert found[0]["error"] == "Analysis took longer than the allowed time"
+
+
+def test_project_report_lists_over_budget_files_and_caches_the_rest(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    user_dir = tmp_path / "uploads" / "alice"
+    user_dir.mkdir(parents=True)
+    for name in ("a.py", "b.py", "huge.py"):
+        (user_dir / name).write_text(f"def f():\n    return {name!r}\n")
+
+    def analyze(batch):
+        measure(batch)
+        return analyze_sources(batch)
+
+    monkeypatch.setattr(project_analysis_service, "analyze_sources", analyze)
+    cache = AnalysisCache(max_bytes=1024 * 1024)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        scheduler = AnalysisScheduler(executor, max_concurrency=2, max_queue=1)
+        service = ProjectAnalysisService(cache, executor, chunk_size=3, scheduler=scheduler)
+        report = asyncio.run(service.analyze_project("alice"))
+        analyses, errors, cached = service.collect_analyses("alice")
+
+    assert sorted(report["files"]) == ["a.py", "b.py"]
+    assert [(error["file"], error["budget"]) for error in report["errors"]] == [("huge.py", "time")]
+    assert report["summary"]["over_budget_file_count"] == 1
+    assert report["summary"]["unreadable_file_count"] == 0
+    # The files that fit were cached; only the over-budget one is retried
+    assert (sorted(analyses), cached) == (["a.py", "b.py"], 2)
+    assert [error["file"] for error in errors] == ["huge.py"]
@@ -0,0 +1,41 @@
+from ...services.analysis_cache import AnalysisCache, content_hash
+from ...services.analysis_service import AnalysisService
+
+
+def test_lru_eviction_respects_memory_budget():
+    cache = AnalysisCache(max_bytes=150)  # room for two short strings
+    cache.put("a", "x" * 10)
+    cache.put("b", "y" * 10)
+    assert cache.get("a") is not None  # "a" is now most recently used
+    cache.put("c", "z" * 10)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] <= stats["max_bytes"]
+
+
+def test_key_includes_analyzer_version():
+    digest = content_hash("x = 1\n")
+    assert AnalysisCache.make_key(digest, version="1") != AnalysisCache.make_key(digest, version="2")
+
+
+def test_service_parses_identical_content_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    user_dir = tmp_path / "uploads" / "alice"
+    user_dir.mkdir(parents=True)
+    (user_dir / "a.py").write_text("class A:\n    pass\n")
+    (user_dir / "b.py").write_text("class A:\n    pass\n")
+
+    cache = AnalysisCache(max_bytes=1024 * 1024)
+    service = AnalysisService(cache)
+    first = service.analyze_file("a.py", "alice")
+    second = service.analyze_file("b.py", "alice")
+    assert first is second
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    # The entry survives until no file refers to it anymore
+    service.invalidate_file("a.py", "alice")
+    assert len(cache) == 1
+    service.invalidate_file("b.py", "alice")
+    assert len(cache) == 0
@@ -0,0 +1,116 @@
+import os
+import signal
+import time
+
+import pytest
+
+from ...services.analysis_executor import AnalysisBudgetError, AnalysisExecutor
+from ...services.code_analyzer import CodeAnalyzer
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="budgets use POSIX rlimits and signals")
+
+
+def allocate(megabytes):
+    return len(bytearray(megabytes * 1024 * 1024))
+
+
+def spin():
+    while True:
+        pass
+
+
+def nap(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def ignore_signals_and_nap(seconds):
+    signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGALRM, signal.SIGXCPU})
+    time.sleep(seconds)
+
+
+def die():
+    os._exit(1)
+
+
+def _budget_error(executor, fn, *args):
+    with pytest.raises(AnalysisBudgetError) as excinfo:
+        executor.submit(fn, *args).result(timeout=30)
+    assert excinfo.value.status_code == 422
+    assert excinfo.value.detail["error"] == "analysis_exceeded_budget"
+    return excinfo.value.budget
+
+
+@pytest.fixture
+def make_executor():
+    executors = []
+
+    def make(max_workers=1, **budgets):
+        executor = AnalysisExecutor(max_workers=max_workers, start_method="spawn", **budgets)
+        executors.append(executor)
+        return executor
+
+    yield make
+    for executor in executors:
+        executor.shutdown(wait=False)
+
+
+def test_memory_budget_keeps_the_worker(make_executor):
+    executor = make_executor(memory_limit_mb=512)
+
+    assert _budget_error(executor, allocate, 2048) == "memory"
+    assert executor.submit(allocate, 1).result(timeout=30) == 1024 * 1024
+    assert executor.stats()["restarts"] == 0
+
+
+def test_analyses_out_of_memory_fail_instead_of_reporting_a_syntax_error(make_executor):
+    executor = make_executor(memory_limit_mb=300)
+    literal = "x = [" + "1, " * (22 * 1024 * 1024 // 3) + "]\n"
+
+    assert _budget_error(executor, CodeAnalyzer.analyze, literal) == "memory"
+    analysis = executor.submit(CodeAnalyzer.analyze, "def f(:\n").result(timeout=30)
+    assert analysis.syntax_error is not None
+    assert executor.stats()["restarts"] == 0
+
+
+def test_wall_clock_and_cpu_budgets(make_executor):
+    executor = make_executor(timeout_seconds=0.5, kill_grace_seconds=10)
+    assert _budget_error(executor, nap, 5) == "time"
+    assert executor.submit(nap, 0).result(timeout=30) == 0
+
+    executor = make_executor(timeout_seconds=20, cpu_limit_seconds=1)
+    assert _budget_error(executor, spin) == "cpu"
+    assert _budget_error(executor, spin) == "cpu"
+    assert executor.stats()["budget_errors"] == {"cpu": 2}
+    assert executor.stats()["restarts"] == 0
+
+
+def test_stuck_and_crashed_workers_are_replaced(make_executor):
+    executor = make_executor(timeout_seconds=0.5, kill_grace_seconds=0.5)
+
+    assert _budget_error(executor, ignore_signals_and_nap, 30) == "time"
+    assert _budget_error(executor, die) == "process"
+    assert executor.submit(nap, 0).result(timeout=30) == 0
+    # The crashing task is run once more before it is reported
+    assert executor.stats()["restarts"] == 3
+
+
+def test_tasks_killed_with_another_task_are_run_again(make_executor):
+    executor = make_executor(max_workers=2, timeout_seconds=3, kill_grace_seconds=0.5)
+
+    stuck = executor.submit(ignore_signals_and_nap, 30)
+    time.sleep(2.5)
+    bystander = executor.submit(nap, 2)
+    assert bystander.result(timeout=60) == 2
+    with pytest.raises(AnalysisBudgetError) as excinfo:
+        stuck.result(timeout=60)
+    assert excinfo.value.budget == "time"
+
+    # The worker that died is found by rerunning the pool's tasks one at a time
+    bystanders = [executor.submit(nap, 1) for _ in range(3)]
+    crashed = executor.submit(die)
+    assert [bystander.result(timeout=60) for bystander in bystanders] == [1, 1, 1]
+    with pytest.raises(AnalysisBudgetError) as excinfo:
+        crashed.result(timeout=60)
+    assert excinfo.value.budget == "process"
+    assert executor.stats()["budget_errors"] == {"time": 1, "process": 1}
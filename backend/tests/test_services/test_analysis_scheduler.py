@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+
+from ...services.analysis_scheduler import AnalysisScheduler
+
+
+@pytest.fixture
+def workers():
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield executor
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def test_concurrency_is_capped_and_waiters_run_in_order(workers):
+    scheduler = AnalysisScheduler(workers, max_concurrency=2, max_queue=10)
+    lock = threading.Lock()
+    running, peak, order = [0], [0], []
+
+    def task(index):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            order.append(index)
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return index * 2
+
+    async def scenario():
+        return await asyncio.gather(*(scheduler.run(task, index) for index in range(6)))
+
+    assert asyncio.run(scenario()) == [0, 2, 4, 6, 8, 10]
+    assert peak[0] == 2
+    assert order[2:] == [2, 3, 4, 5]
+    stats = scheduler.stats()
+    assert stats["running"] == 0 and stats["queued"] == 0
+    assert stats["completed"] == 6
+    assert stats["queue_wait_seconds"]["max"] > 0
+
+
+def test_full_queue_is_rejected_with_retry_after(workers):
+    scheduler = AnalysisScheduler(workers, max_concurrency=1, max_queue=1, retry_after_seconds=7)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(scheduler.run(release.wait, 5))
+        queued = asyncio.ensure_future(scheduler.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        with pytest.raises(HTTPException) as excinfo:
+            await scheduler.run(release.wait, 5)
+        release.set()
+        await asyncio.gather(running, queued)
+        return excinfo.value
+
+    error = asyncio.run(scenario())
+    assert error.status_code == 503
+    assert error.headers["Retry-After"] == "7"
+    assert scheduler.stats()["rejected"] == 1
+
+
+def test_cancelled_waiter_does_not_leak_its_slot(workers):
+    scheduler = AnalysisScheduler(workers, max_concurrency=1, max_queue=5)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(scheduler.run(release.wait, 5))
+        waiting = asyncio.ensure_future(scheduler.run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await running
+        return await scheduler.run(sum, [1, 2])
+
+    assert asyncio.run(scenario()) == 3
+    assert scheduler.stats()["running"] == 0
+
+
+def test_map_is_admitted_as_one_request(workers):
+    scheduler = AnalysisScheduler(workers, max_concurrency=1, max_queue=0)
+
+    async def scenario():
+        return await scheduler.map(abs, [-1, -2, -3])
+
+    assert asyncio.run(scenario()) == [1, 2, 3]
+    assert scheduler.stats()["admitted"] == 1
+
+
+def test_map_holds_one_queue_entry_and_takes_turns(workers):
+    scheduler = AnalysisScheduler(workers, max_concurrency=4, max_queue=8)
+    finished = []
+
+    def task(index):
+        time.sleep(0.01)
+        finished.append(index)
+        return index
+
+    async def scenario():
+        project = asyncio.ensure_future(scheduler.map(task, range(40)))
+        await asyncio.sleep(0.005)
+        assert scheduler.stats()["queued"] <= 1
+        # Admitted despite the project, and served between its batches
+        single = await scheduler.run(task, "single")
+        assert not project.done()
+        return await project, single
+
+    results, single = asyncio.run(scenario())
+    assert results == list(range(40)) and single == "single"
+    assert finished.index("single") < 10
+    assert scheduler.stats()["rejected"] == 0
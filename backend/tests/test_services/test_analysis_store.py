@@ -0,0 +1,74 @@
+from ...services.analysis_cache import AnalysisCache, content_hash
+from ...services.analysis_store import DiskAnalysisStore
+from ...services.code_analyzer import CodeAnalyzer
+
+SOURCE = "class A:\n    def run(self):\n        pass  # go\n"
+
+
+def make_store(tmp_path, max_bytes=1024 * 1024):
+    return DiskAnalysisStore(str(tmp_path / "cache" / "analysis.db"), max_bytes=max_bytes)
+
+
+def test_analysis_survives_a_restart(tmp_path):
+    key = AnalysisCache.make_key(content_hash(SOURCE))
+    analysis = CodeAnalyzer.analyze(SOURCE)
+    AnalysisCache(max_bytes=1024 * 1024, store=make_store(tmp_path)).put(key, analysis)
+
+    # A new process starts with an empty memory tier over the same file
+    cache = AnalysisCache(max_bytes=1024 * 1024, store=make_store(tmp_path))
+    assert cache.get(key) is None
+    loaded = cache.load(key)
+    assert loaded.to_dict() == analysis.to_dict()
+    assert key in cache
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_warm_start_loads_most_recent_entries_within_budget(tmp_path):
+    store = make_store(tmp_path)
+    writer = AnalysisCache(max_bytes=1024 * 1024, store=store)
+    keys = []
+    for index in range(5):
+        source = f"def f{index}():\n    return {index}\n"
+        keys.append(AnalysisCache.make_key(content_hash(source)))
+        writer.put(keys[-1], CodeAnalyzer.analyze(source))
+    size = CodeAnalyzer.analyze("def f0():\n    return 0\n").approximate_size()
+
+    cache = AnalysisCache(max_bytes=size * 2 + size // 2, store=make_store(tmp_path))
+    assert cache.warm_start() == 2
+    assert len(cache) == 2
+
+
+def test_store_evicts_least_recently_used_over_cap(tmp_path):
+    store = make_store(tmp_path, max_bytes=10_000)
+    store.register("code", lambda data: data)
+
+    class Value:
+        def __init__(self, index):
+            self.index = index
+
+        def to_dict(self):
+            # Incompressible-ish payload of roughly 1KB per entry
+            return {"data": [str(self.index * 7919 + n) for n in range(150)]}
+
+    for index in range(40):
+        store.put(f"code:1:{index}", Value(index))
+    stats = store.stats()
+    assert stats["bytes"] <= stats["max_bytes"]
+    assert stats["evictions"] > 0
+    assert store.get("code:1:39") is not None
+    assert store.get("code:1:0") is None
+
+
+def test_unknown_analyzer_and_corrupt_entries_are_misses(tmp_path):
+    store = make_store(tmp_path)
+    assert store.get("unregistered:1:abc") is None
+
+    store.register("code", lambda data: data["missing"])
+
+    class Value:
+        def to_dict(self):
+            return {}
+
+    store.put("code:1:abc", Value())
+    assert store.get("code:1:abc") is None
+    assert store.stats()["errors"] == 1
@@ -0,0 +1,73 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from ...services.archive_service import ArchiveService
+
+
+def _zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+def _tar_gz(members):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.mark.parametrize("build, filename", [(_zip, "project.zip"), (_tar_gz, "project.tar.gz")])
+def test_extracts_python_members_with_relative_paths(tmp_path, monkeypatch, build, filename):
+    monkeypatch.chdir(tmp_path)
+    archive = build({
+        "pkg/__init__.py": b"",
+        "pkg/sub/mod.py": b"def f():\n    pass\n",
+        "README.md": b"# readme\n",
+    })
+
+    result = ArchiveService().extract_archive(UploadFile(archive, filename=filename), "alice")
+
+    user_dir = tmp_path / "uploads" / "alice"
+    assert result["files"] == ["pkg/__init__.py", "pkg/sub/mod.py"]
+    assert result["skipped"] == 1
+    assert (user_dir / "pkg" / "sub" / "mod.py").read_bytes() == b"def f():\n    pass\n"
+    assert not (user_dir / "README.md").exists()
+
+
+def test_zip_bomb_is_rejected_and_leaves_no_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    archive = _zip({"ok.py": b"x = 1\n", "pkg/bomb.py": b"0" * 100_000})
+    service = ArchiveService(max_file_size=10_000, chunk_size=1024)
+
+    with pytest.raises(HTTPException) as excinfo:
+        service.extract_archive(UploadFile(archive, filename="bomb.zip"), "alice")
+
+    assert excinfo.value.status_code == 413
+    user_dir = tmp_path / "uploads" / "alice"
+    assert list(user_dir.iterdir()) == []
+
+
+def test_member_count_and_traversal_limits(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    many = _zip({f"m{i}.py": b"" for i in range(5)})
+    with pytest.raises(HTTPException) as excinfo:
+        ArchiveService(max_members=3).extract_archive(UploadFile(many, filename="a.zip"), "alice")
+    assert excinfo.value.status_code == 413
+
+    evil = _tar_gz({"../../evil.py": b"x = 1\n"})
+    with pytest.raises(HTTPException) as excinfo:
+        ArchiveService().extract_archive(UploadFile(evil, filename="a.tgz"), "alice")
+    assert excinfo.value.status_code == 400
+    assert not (tmp_path / "evil.py").exists()
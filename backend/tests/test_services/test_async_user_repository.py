@@ -0,0 +1,52 @@
+import asyncio
+
+from ...core.config import DatabaseSettings
+from ...database.database import Base, async_database_url, create_async_database_engine
+from ...models.user import User, UserInDB
+from ...repositories.user_repository import AsyncUserRepository
+from ...security.user_cache import user_cache
+from ...services.user_service import UserService
+
+
+def test_async_url_swaps_in_the_async_driver():
+    assert async_database_url(DatabaseSettings(url="sqlite:///./users.db")) == "sqlite+aiosqlite:///./users.db"
+    assert async_database_url(
+        DatabaseSettings(url="postgresql://u:p@db/app")
+    ) == "postgresql+asyncpg://u:p@db/app"
+    assert async_database_url(
+        DatabaseSettings(url="sqlite:///./users.db", async_url="sqlite+aiosqlite:///other.db")
+    ) == "sqlite+aiosqlite:///other.db"
+
+
+def test_async_repository_and_user_service(tmp_path):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async def scenario():
+        engine = create_async_database_engine(
+            DatabaseSettings(url=f"sqlite:///{tmp_path / 'users.db'}")
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with sessions() as db:
+            repository = AsyncUserRepository(db)
+            await repository.create_user(UserInDB(username="alice", email="a@x.io", hashed_password="hash"))
+            assert await repository.username_exists("alice")
+            assert await repository.email_exists("a@x.io")
+            assert not await repository.username_exists("bob")
+            assert len(await repository.get_multi()) == 1
+
+            service = UserService(repository)
+            user_cache.clear()
+            updated = await service.update_user("alice", User(username="alice", full_name="Alice"))
+            assert updated.full_name == "Alice"
+            assert (await service.get_current_user_info("alice")).full_name == "Alice"
+            assert await repository.update_hashed_password("alice", "new-hash")
+            assert (await service.get_user_by_username("alice")).hashed_password == "new-hash"
+
+            await service.delete_user("alice")
+            assert await repository.get_by_username("alice") is None
+        await engine.dispose()
+
+    asyncio.run(scenario())
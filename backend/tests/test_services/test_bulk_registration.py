@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from ...database.database import Base
+from ...models.user import UserInDB
+from ...repositories.user_repository import UserRepository
+from ...security.password_hasher import PasswordHasher
+from ...services import user_service as user_service_module
+from ...services.user_service import UserService
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_pending=0, bulk_workers=4)
+    monkeypatch.setattr(user_service_module, "password_hasher", hasher)
+    engine = create_engine(f"sqlite:///{tmp_path / 'users.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    yield UserService(UserRepository(db))
+    hasher.shutdown()
+    db.close()
+
+
+def test_hash_many_keeps_order():
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_pending=0, bulk_workers=3)
+    passwords = [f"pw{i}" for i in range(10)]
+    try:
+        hashes = asyncio.run(hasher.hash_many_async(passwords))
+    finally:
+        hasher.shutdown()
+
+    assert len(hashes) == 10
+    assert all(hasher.verify(password, hashed) for password, hashed in zip(passwords, hashes))
+    assert not hasher.stats()["bulk_running"]
+
+
+def test_register_users_reports_each_row(service):
+    service.repository.create_user(
+        UserInDB(username="taken", email="taken@example.com", hashed_password="hash")
+    )
+    queries = []
+    event.listen(
+        service.repository.db.get_bind(), "before_cursor_execute",
+        lambda conn, cursor, statement, *args: queries.append(statement)
+    )
+    entries = [
+        {"username": "student1", "password": "pw1", "email": "s1@example.com"},
+        {"username": "student2", "password": "pw2", "email": "s2@example.com", "full_name": "S Two"},
+        {"username": "taken", "password": "pw", "email": "new@example.com"},
+        {"username": "student3", "password": "pw", "email": "taken@example.com"},
+        {"username": "student1", "password": "pw", "email": "other@example.com"},
+        {"username": "x", "password": "pw", "email": "bad"},
+        "not an object",
+    ]
+
+    result = asyncio.run(service.register_users(entries))
+    statements = [statement.lstrip().split()[0].upper() for statement in queries]
+
+    assert result["created"] == 2
+    assert result["failed"] == 5
+    assert [row.get("status") for row in result["results"]] == [
+        "created", "created", "error", "error", "error", "error", "error"
+    ]
+    assert result["results"][2]["detail"] == "Username already exists"
+    assert result["results"][3]["detail"] == "Email already registered"
+    assert result["results"][4]["detail"] == "Duplicate username in request"
+    # One existence query and one INSERT for the whole batch
+    assert statements.count("SELECT") == 1
+    assert statements.count("INSERT") == 1
+    assert service.repository.get_by_username("student2").full_name == "S Two"
+
+
+def test_register_users_enforces_row_limit(service):
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(service.register_users([{}] * 3, max_rows=2))
+    assert excinfo.value.status_code == 413
+
+
+def test_parse_registrations_from_csv_and_json():
+    csv_body = b"username,password,email,full_name\nalice,pw,a@example.com,\nbob,pw,b@example.com,Bob\n"
+    assert UserService.parse_registrations(csv_body, "text/csv") == [
+        {"username": "alice", "password": "pw", "email": "a@example.com"},
+        {"username": "bob", "password": "pw", "email": "b@example.com", "full_name": "Bob"},
+    ]
+    assert UserService.parse_registrations(b'[{"username": "alice"}]', "application/json") == [
+        {"username": "alice"}
+    ]
+
+    for body, content_type, code in [
+        (b"username,email\nalice,a@example.com\n", "text/csv", 400),
+        (b'{"username": "alice"}', "application/json", 400),
+        (b"alice", "text/plain", 415),
+    ]:
+        with pytest.raises(HTTPException) as excinfo:
+            UserService.parse_registrations(body, content_type)
+        assert excinfo.value.status_code == code
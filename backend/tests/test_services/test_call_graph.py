@@ -0,0 +1,196 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+
+from ...services.analysis_cache import AnalysisCache
+from ...services.analysis_scheduler import AnalysisScheduler
+from ...services.call_graph import CallGraph
+from ...services.call_graph_service import CallGraphService
+from ...services.code_analyzer import CallInfo, CodeAnalyzer, FileAnalysis
+from ...services.file_io import FileIO
+from ...services.inheritance_graph import InheritanceGraph
+from ...services.project_analysis_service import ProjectAnalysisService
+from ...services.project_workspace import ProjectWorkspace
+
+
+def build(files):
+    analyses = {name: CodeAnalyzer.analyze(source) for name, source in files.items()}
+    classes = InheritanceGraph()
+    classes.update(analyses)
+    return CallGraph.build(analyses, classes)
+
+
+def callees(graph, symbol):
+    [node] = graph.find(symbol)
+    return sorted((graph.names[target], count) for target, count in graph.callees(node))
+
+
+def test_calls_are_recorded_per_caller():
+    analysis = CodeAnalyzer.analyze(
+        "@deco(1)\n"
+        "def f(x=g()):\n"
+        "    h(); h()\n"
+        "    class K:\n"
+        "        y = k()\n"
+        "    return obj.attr.run()\n"
+    )
+    assert analysis.calls == (
+        CallInfo("", "deco", 1),
+        CallInfo("", "g", 2),
+        CallInfo("f", "h", 3, count=2),
+        CallInfo("f", "k", 5),
+        CallInfo("f", "obj.attr.run", 6),
+    )
+    assert FileAnalysis.from_dict(analysis.to_dict()) == analysis
+
+
+def test_calls_resolve_to_project_functions_and_methods():
+    graph = build({
+        "pkg/__init__.py": "from .util import helper\n",
+        "pkg/util.py": "def helper():\n    return len([])\n\nclass Plain:\n    pass\n",
+        "app.py": (
+            "import pkg\n"
+            "from pkg import util\n"
+            "class Base:\n"
+            "    def __init__(self):\n"
+            "        self.setup()\n"
+            "    def setup(self):\n"
+            "        pass\n"
+            "class Child(Base):\n"
+            "    def setup(self):\n"
+            "        super().setup()\n"
+            "        pkg.helper(); util.helper()\n"
+            "        util.Plain()\n"
+            "def main():\n"
+            "    def inner():\n"
+            "        Child()\n"
+            "    inner()\n"
+            "main()\n"
+        ),
+    })
+
+    # self.setup() is resolved statically through the MRO of Base
+    assert callees(graph, "app:Base.__init__") == [("app:Base.setup", 1)]
+    # Two names for the same function merge into one edge
+    assert callees(graph, "app:Child.setup") == [
+        ("app:Base.setup", 1), ("pkg.util:Plain", 1), ("pkg.util:helper", 2), ("super", 1),
+    ]
+    assert callees(graph, "inner") == [("app:Base.__init__", 1)]
+    assert callees(graph, "app:<module>") == [("app:main", 1)]
+
+    [helper] = graph.find("pkg.util.helper")
+    assert graph.node(helper) == {
+        "id": helper, "name": "pkg.util:helper", "kind": "function", "file": "pkg/util.py", "line": 1,
+    }
+    assert [graph.names[caller] for caller, _ in graph.callers(helper)] == ["app:Child.setup"]
+    assert graph.node(graph.find("len")[0])["kind"] == "external"
+    assert graph.node(graph.find("pkg.util:Plain")[0])["kind"] == "class"
+    assert len(graph.find("setup")) == 2
+
+
+def test_large_projects_build_quickly_into_compact_arrays():
+    source = "\n".join(
+        f"def f{n}():\n    pass\n" + "".join(f"    f{m}()\n" for m in range(n)) for n in range(40)
+    )
+    analysis = CodeAnalyzer.analyze(source)
+    analyses = {f"pkg/mod{n}.py": analysis for n in range(250)}
+    assert sum(call.count for call in analysis.calls) * 250 == 195_000
+
+    classes = InheritanceGraph()
+    classes.update(analyses)
+    started = time.perf_counter()
+    graph = CallGraph.build(analyses, classes)
+    assert time.perf_counter() - started < 10
+
+    assert graph.node_count == 250 * 41
+    assert graph.edge_count == 195_000
+    assert graph.out_targets.itemsize == 4
+    assert len(graph.callers(graph.find("pkg.mod7:f0")[0])) == 39
+
+
+def test_service_pages_through_the_graph(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    user_dir = tmp_path / "uploads" / "alice"
+    user_dir.mkdir(parents=True)
+    (user_dir / "a.py").write_text("def a():\n    b()\n\ndef b():\n    pass\n\na()\n")
+    (user_dir / "c.py").write_text("def b():\n    pass\n")
+
+    class Workspaces:
+        def __init__(self, workspace):
+            self.workspace = workspace
+
+        async def get_synced(self, username):
+            await self.workspace.sync()
+            return self.workspace
+
+    io = FileIO(max_workers=1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        scheduler = AnalysisScheduler(executor, max_concurrency=1, max_queue=1)
+        projects = ProjectAnalysisService(
+            AnalysisCache(max_bytes=1024 * 1024), executor, io=io, scheduler=scheduler
+        )
+        workspace = ProjectWorkspace("alice", projects, refresh_interval_seconds=60)
+        service = CallGraphService(Workspaces(workspace), io)
+
+        async def scenario():
+            callers = await service.get_callers("alice", "a:b")
+            assert [caller["name"] for caller in callers["callers"]] == ["a:a"]
+            assert callers["callers"][0]["calls"] == 1
+            with pytest.raises(HTTPException) as ambiguous:
+                await service.get_callees("alice", "b")
+            assert ambiguous.value.status_code == 409
+            with pytest.raises(HTTPException) as missing:
+                await service.get_callees("alice", "nope")
+            assert missing.value.status_code == 404
+
+            first = await service.export_graph("alice", limit=3)
+            assert first["node_count"] == 5 and first["edge_count"] == 2
+            second = await service.export_graph("alice", limit=3, cursor=first["next_cursor"])
+            assert second["next_cursor"] is None
+            nodes = first["nodes"] + second["nodes"]
+            assert [node["id"] for node in nodes] == list(range(5))
+            assert sum(len(node["calls"]) for node in nodes) == 2
+
+            (user_dir / "c.py").unlink()
+            workspace.mark_stale()
+            with pytest.raises(HTTPException) as changed:
+                await service.export_graph("alice", limit=3, cursor=first["next_cursor"])
+            assert changed.value.status_code == 409
+            with pytest.raises(HTTPException) as invalid:
+                await service.export_graph("alice", cursor="???")
+            assert invalid.value.status_code == 400
+
+        asyncio.run(scenario())
+    io.shutdown()
+
+
+def test_workspace_builds_the_call_graph_without_holding_its_lock(monkeypatch):
+    workspace = ProjectWorkspace("alice", projects=None)
+    source = "def f():\n    g()\n\ndef g():\n    pass\n"
+    workspace._apply(0.0, {}, {"a.py": CodeAnalyzer.analyze(source)}, [])
+    lock_free_during_build = []
+    build = CallGraph.build
+
+    def probe():
+        acquired = workspace.lock.acquire(timeout=5)
+        lock_free_during_build.append(acquired)
+        if acquired:
+            workspace.lock.release()
+
+    def checking_build(cls, analyses, classes, version):
+        # Another query thread must be able to take the workspace lock meanwhile
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join()
+        return build(analyses, classes, version)
+
+    monkeypatch.setattr(CallGraph, "build", classmethod(checking_build))
+    graph = workspace.call_graph()
+
+    assert lock_free_during_build == [True]
+    assert graph.version == workspace.version == 1
+    assert workspace.call_graph() is graph
@@ -0,0 +1,86 @@
+from ...services.code_analyzer import CodeAnalyzer
+from ...services.class_finder import ClassFinder
+from ...services.comment_finder import CommentFinder
+from ...services.function_finder import FunctionFinder
+from ...services.function_under_class import ClassFunctionFinder
+
+SOURCE = '''\
+import functools
+
+# module comment
+class Animal:
+    def speak(self):
+        pass
+
+class Dog(Animal):  # inline comment
+    @functools.lru_cache()
+    def speak(
+        self,
+        loud=False,
+    ):
+        def helper():
+            pass
+        return "#not a comment"
+
+    class Meta:
+        def options(self):
+            pass
+
+async def fetch():
+    pass
+
+def main():
+    pass
+'''
+
+
+def test_analysis_structure():
+    analysis = CodeAnalyzer.analyze(SOURCE)
+    assert [cls.qualname for cls in analysis.classes] == ["Animal", "Dog", "Dog.Meta"]
+    assert analysis.classes[1].bases == ("Animal",)
+    assert analysis.classes[1].methods == ("speak",)
+    assert [func.name for func in analysis.global_functions] == ["fetch", "main"]
+    assert analysis.functions[1].decorators == ("functools.lru_cache()",)
+    assert analysis.syntax_error is None
+
+
+def test_finders_accept_analysis_or_source():
+    analysis = CodeAnalyzer.analyze(SOURCE)
+    assert ClassFinder.find_classes(analysis) == ClassFinder.find_classes(SOURCE)
+    assert ClassFinder.find_classes_with_parents(analysis) == {"Animal": ["Dog"]}
+    assert FunctionFinder.find_functions(analysis) == [
+        "speak", "speak", "helper", "options", "fetch", "main"
+    ]
+    assert ClassFunctionFinder.find_functions_by_class(analysis) == {
+        "Global_Functions": ["fetch", "main"],
+        "Animal": ["speak"],
+        "Dog": ["speak"],
+        "Dog.Meta": ["options"],
+    }
+
+
+def test_comments_ignore_string_literals():
+    comments = CommentFinder.find_comments(SOURCE)
+    assert comments == "# module comment\n# inline comment\n"
+    assert CommentFinder.find_comments("x = 1\n") == "No comments found"
+
+
+def test_syntax_error_yields_empty_structure():
+    analysis = CodeAnalyzer.analyze("# header\ndef broken(:\n    pass\n")
+    assert analysis.has_syntax_error
+    assert analysis.syntax_error.line == 2
+    assert analysis.classes == () and analysis.functions == ()
+    assert [comment.text for comment in analysis.comments] == ["# header"]
+
+
+def test_structured_comments_and_docstrings():
+    source = '"""Module doc."""\n# full line\nx = "#" + "y"  # trailing\n\ndef f():\n    """Doc of f."""\n'
+    records = CommentFinder.extract_comments(source)
+    assert records == [
+        {"line": 1, "column": 0, "text": "Module doc.", "inline": False, "kind": "docstring"},
+        {"line": 2, "column": 0, "text": "# full line", "inline": False, "kind": "comment"},
+        {"line": 3, "column": 15, "text": "# trailing", "inline": True, "kind": "comment"},
+        {"line": 6, "column": 4, "text": "Doc of f.", "inline": False, "kind": "docstring"},
+    ]
+    assert len(CommentFinder.extract_comments(source, include_docstrings=False)) == 2
+    assert CommentFinder.find_comments(source) == "# full line\n# trailing\n"
@@ -0,0 +1,61 @@
+import asyncio
+import io
+import threading
+import time
+
+from fastapi import UploadFile
+
+from ...services.file_io import FileIO
+from ...services.file_service import FileService
+
+
+def test_blocking_calls_do_not_stall_the_event_loop():
+    pool = FileIO(max_workers=2)
+
+    async def scenario():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        await pool.run(time.sleep, 0.2)
+        beat.cancel()
+        return ticks
+
+    try:
+        assert asyncio.run(scenario()) >= 5
+    finally:
+        pool.shutdown()
+
+
+def test_multi_file_upload_writes_in_parallel(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pool = FileIO(max_workers=4)
+    service = FileService(io=pool)
+    threads = set()
+    original = FileService._write_file
+
+    def recording_write(self, file_path, file):
+        threads.add(threading.current_thread().name)
+        time.sleep(0.05)
+        return original(self, file_path, file)
+
+    monkeypatch.setattr(FileService, "_write_file", recording_write)
+    files = [
+        UploadFile(io.BytesIO(f"x = {i}\n".encode()), filename=f"m{i}.py")
+        for i in range(4)
+    ]
+
+    try:
+        result = asyncio.run(service.upload_files(files, "alice"))
+        listing = asyncio.run(service.get_user_files("alice"))
+    finally:
+        pool.shutdown()
+
+    assert result["count"] == 4
+    assert sorted(listing["files"]) == ["m0.py", "m1.py", "m2.py", "m3.py"]
+    assert len(threads) > 1
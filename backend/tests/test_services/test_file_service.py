@@ -0,0 +1,122 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from ...services.analysis_cache import AnalysisCache, content_hash
+from ...services.analysis_scheduler import AnalysisScheduler
+from ...services.analysis_service import AnalysisService
+from ...services.file_io import FileIO
+from ...services.file_service import FileService
+from ...services.path_finder import PathFinder
+
+
+def _upload(name, data=b"x = 1\n"):
+    return UploadFile(io.BytesIO(data), filename=name)
+
+
+def test_normalize_rejects_paths_outside_the_user_root():
+    assert PathFinder.normalize("pkg\\sub/../mod.py") == "pkg/mod.py"
+    for bad in ("../secret.py", "pkg/../../secret.py", "/etc/passwd.py", "C:/x.py", ""):
+        with pytest.raises(HTTPException) as excinfo:
+            PathFinder.normalize(bad)
+        assert excinfo.value.status_code == 400
+
+
+def test_nested_files_do_not_overwrite_each_other(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = FileService()
+    files = [_upload("a/__init__.py", b"A = 1\n"), _upload("b/__init__.py", b"B = 2\n")]
+
+    asyncio.run(service.upload_files(files, "alice"))
+
+    first = asyncio.run(service.get_file_content("a/__init__.py", "alice"))
+    second = asyncio.run(service.get_file_content("b/__init__.py", "alice"))
+    assert first["content"] == "A = 1\n"
+    assert second["content"] == "B = 2\n"
+
+
+def test_failed_upload_stores_none_of_its_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = FileService()
+    asyncio.run(service.upload_files([_upload("a.py", b"A = 1\n")], "alice"))
+
+    class _BrokenReader(io.BytesIO):
+        def read(self, size=-1):
+            raise OSError("connection reset")
+
+    files = [
+        _upload("a.py", b"A = 2\n"),
+        _upload("b.py"),
+        UploadFile(_BrokenReader(), filename="c.py"),
+    ]
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(service.upload_files(files, "alice"))
+
+    assert excinfo.value.status_code == 500
+    assert sorted(path.name for path in (tmp_path / "uploads" / "alice").iterdir()) == ["a.py"]
+    assert asyncio.run(service.get_file_content("a.py", "alice"))["content"] == "A = 1\n"
+
+
+def test_listing_pages_through_the_tree(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = FileService()
+    names = ["z.py", "a/x.py", "a/b/y.py", "a/b/c/w.py", "m.py"]
+    asyncio.run(service.upload_files([_upload(name) for name in names], "alice"))
+
+    seen, cursor = [], None
+    while True:
+        page = asyncio.run(service.get_user_files("alice", limit=2, cursor=cursor))
+        assert len(page["files"]) <= 2
+        seen.extend(page["files"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == ["a/b/c/w.py", "a/b/y.py", "a/x.py", "m.py", "z.py"]
+    assert asyncio.run(service.get_user_files("alice", limit=0))["files"] == ["a/b/c/w.py"]
+
+
+def test_delete_prunes_empty_directories(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = FileService()
+    asyncio.run(service.upload_files([_upload("pkg/sub/mod.py")], "alice"))
+
+    asyncio.run(service.delete_file("pkg/sub/mod.py", "alice"))
+
+    user_dir = tmp_path / "uploads" / "alice"
+    assert user_dir.exists()
+    assert list(user_dir.iterdir()) == []
+
+
+def test_upload_prewarms_analysis_in_the_background(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache = AnalysisCache(max_bytes=1024 * 1024)
+    io_pool = FileIO(max_workers=2)
+    with ThreadPoolExecutor(max_workers=1) as workers:
+        analysis = AnalysisService(
+            cache,
+            io=io_pool,
+            scheduler=AnalysisScheduler(workers, max_concurrency=1, max_queue=1),
+        )
+        service = FileService(io=io_pool, analysis=analysis)
+        source = b"class A:\n    pass\n"
+
+        async def scenario():
+            response = await service.upload_files(
+                [_upload("pkg/a.py", source), _upload("b.py", b"x = 1\n")], "alice", prewarm=True
+            )
+            pending = asyncio.all_tasks() - {asyncio.current_task()}
+            await asyncio.gather(*pending)
+            return response
+
+        response = asyncio.run(scenario())
+    io_pool.shutdown()
+
+    assert response["count"] == 2
+    assert response["prewarming"] == ["pkg/a.py", "b.py"]
+    warmed = cache.get(AnalysisCache.make_key(content_hash(source.decode())))
+    assert [cls.name for cls in warmed.classes] == ["A"]
+
@@ -0,0 +1,91 @@
+import io
+import os
+
+import pytest
+from fastapi import UploadFile
+
+from ...services.file_writer import FileTooLargeError, FileWriter
+
+
+class _CountingReader(io.BytesIO):
+    """Records the largest single read so chunking can be asserted."""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.largest_read = 0
+        self.total_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.largest_read = max(self.largest_read, len(chunk))
+        self.total_read += len(chunk)
+        return chunk
+
+
+def test_upload_is_streamed_in_chunks(tmp_path):
+    data = b"x = 1\n" * 1000
+    reader = _CountingReader(data)
+    target = tmp_path / "big.py"
+
+    result = FileWriter.write_file(
+        target, UploadFile(reader, filename="big.py"), max_size=len(data), chunk_size=512
+    )
+
+    assert target.read_bytes() == data
+    assert result["size"] == len(data)
+    assert reader.largest_read <= 512
+    assert [path.name for path in tmp_path.iterdir()] == ["big.py"]
+
+
+def test_stored_files_get_the_default_permissions(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        target = tmp_path / "mod.py"
+        FileWriter.write_file(target, UploadFile(io.BytesIO(b"x = 1\n"), filename="mod.py"))
+    finally:
+        os.umask(umask)
+
+    if os.name == "posix":
+        assert target.stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_oversized_upload_is_aborted_and_cleaned_up(tmp_path):
+    target = tmp_path / "big.py"
+    target.write_bytes(b"original = True\n")
+    reader = _CountingReader(b"y" * 10_000)
+
+    with pytest.raises(FileTooLargeError) as excinfo:
+        FileWriter.write_file(
+            target, UploadFile(reader, filename="big.py"), max_size=1000, chunk_size=256
+        )
+
+    assert excinfo.value.status_code == 413
+    assert reader.total_read < 2000  # aborted mid-stream, not after reading everything
+    assert target.read_bytes() == b"original = True\n"
+    assert [path.name for path in tmp_path.iterdir()] == ["big.py"]
+
+
+def test_concurrent_writes_of_one_path_do_not_share_a_part_file(tmp_path):
+    target = tmp_path / "mod.py"
+
+    class _InterleavingReader(io.BytesIO):
+        """Lets a second upload of the same path run between two chunks."""
+
+        def __init__(self, data: bytes):
+            super().__init__(data)
+            self.interleaved = False
+
+        def read(self, size=-1):
+            if not self.interleaved:
+                self.interleaved = True
+                FileWriter.write_file(
+                    target, UploadFile(io.BytesIO(b"second = 2\n"), filename="mod.py")
+                )
+            return super().read(size)
+
+    reader = _InterleavingReader(b"first = 1\n" * 100)
+    FileWriter.write_file(target, UploadFile(reader, filename="mod.py"), chunk_size=64)
+
+    # The upload that finished last wins, whole
+    assert target.read_bytes() == b"first = 1\n" * 100
+    assert [path.name for path in tmp_path.iterdir()] == ["mod.py"]
@@ -0,0 +1,80 @@
+import time
+
+from ...services.code_analyzer import CodeAnalyzer
+from ...services.import_graph import ImportGraph
+
+
+def analyze(files):
+    return {name: CodeAnalyzer.analyze(source) for name, source in files.items()}
+
+
+def modules(report):
+    return {node.module: (node.imports, node.imported_by, node.external) for node in report.modules}
+
+
+def test_relative_and_absolute_imports_resolve_to_project_modules():
+    graph = ImportGraph()
+    graph.update(analyze({
+        "pkg/__init__.py": "from . import a\nimport os.path\n",
+        "pkg/a.py": "from .b import thing\nimport requests.adapters\n",
+        "pkg/b.py": "from pkg import a\n\ndef f():\n    import pkg.c\n",
+        "pkg/c.py": "import pkg.b as b\nfrom ..outside import x\n",
+    }))
+    report = graph.report()
+
+    assert modules(report) == {
+        "pkg": (("pkg.a",), (), ("os",)),
+        "pkg.a": (("pkg.b",), ("pkg", "pkg.b"), ("requests",)),
+        "pkg.b": (("pkg.a", "pkg.c"), ("pkg.a", "pkg.c"), ()),
+        "pkg.c": (("pkg.b",), ("pkg.b",), ()),
+    }
+    assert report.edge_count == 5
+    # pkg.b -> pkg.c only runs inside a function, so it closes no cycle
+    assert report.cycles == (("pkg.a", "pkg.b"),)
+    assert graph.report() is report
+
+
+def test_updates_are_incremental_and_reports_are_reused():
+    graph = ImportGraph()
+    files = analyze({
+        "app.py": "from pkg import util\n",
+        "pkg/__init__.py": "",
+        "pkg/util.py": "import app\n",
+    })
+    graph.update(files)
+    first = graph.report()
+    assert first.cycles == (("app", "pkg.util"),)
+
+    # A body-only edit keeps the fingerprint and the cached report
+    graph.update(analyze({"pkg/util.py": "import app\n\ndef f():\n    pass\n"}))
+    assert graph.report() is first
+
+    # Removing the submodule re-points "from pkg import util" at the package
+    graph.update({}, removed=["pkg/util.py"])
+    assert graph.imports("app") == ["pkg"]
+    assert graph.report().cycles == ()
+
+    graph.update({"pkg/util.py": files["pkg/util.py"]})
+    assert graph.imports("app") == ["pkg.util"]
+    assert graph.report() is first
+
+
+def test_large_import_graph_with_a_long_cycle():
+    count = 20_000
+    files = {
+        f"mono/m{n}.py": CodeAnalyzer.analyze(
+            f"from . import m{(n + 1) % count}\nimport mono.m{n // 2}\n"
+        )
+        for n in range(count)
+    }
+    files["mono/__init__.py"] = CodeAnalyzer.analyze("")
+    graph = ImportGraph()
+
+    started = time.perf_counter()
+    graph.update(files)
+    report = graph.report()
+    assert time.perf_counter() - started < 10
+
+    assert [len(cycle) for cycle in report.cycles] == [count]
+    assert len(report.modules) == count + 1
+    assert max(node.fan_in for node in report.modules) == 3
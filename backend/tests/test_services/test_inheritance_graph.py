@@ -0,0 +1,89 @@
+import pytest
+
+from ...services.code_analyzer import CodeAnalyzer, FileAnalysis, ImportInfo
+from ...services.inheritance_graph import InheritanceError, InheritanceGraph
+from ...services.module_paths import imported_module, module_name
+
+
+def build(files):
+    graph = InheritanceGraph()
+    graph.update({name: CodeAnalyzer.analyze(source) for name, source in files.items()})
+    return graph
+
+
+def test_imports_are_recorded_and_resolved():
+    analysis = CodeAnalyzer.analyze(
+        "import a.b as c\nfrom ..x import Y\n\ndef f():\n    import z\n"
+    )
+    assert analysis.imports == (
+        ImportInfo("a.b", None, "c", 1),
+        ImportInfo("x", "Y", None, 2, level=2),
+        ImportInfo("z", None, None, 5, top_level=False),
+    )
+    assert FileAnalysis.from_dict(analysis.to_dict()) == analysis
+    assert module_name("pkg/sub/__init__.py") == "pkg.sub"
+    assert imported_module(analysis.imports[1], "pkg.sub.mod", package=False) == "pkg.x"
+    assert imported_module(analysis.imports[1], "top", package=False) is None
+
+
+def test_same_name_in_two_modules_is_resolved_through_imports():
+    graph = build({
+        "pkg/__init__.py": "from .models import Base\n",
+        "pkg/models.py": "class Base:\n    pass\n\nclass Mixin:\n    pass\n",
+        "app/views.py": (
+            "import pkg\n"
+            "from pkg import models as m\n"
+            "class Base(pkg.Base):\n    pass\n"
+            "class View(m.Mixin, Base, Generic[T]):\n    pass\n"
+        ),
+        "app/errors.py": "from app.views import *\nclass Failure(View, Exception):\n    pass\n",
+    })
+
+    assert graph.get("app.views:Base").bases == ("pkg.models:Base",)
+    assert graph.get("app.views:View").bases == ("pkg.models:Mixin", "app.views:Base", "Generic")
+    assert graph.mro("app.errors:Failure") == (
+        "app.errors:Failure", "app.views:View", "pkg.models:Mixin", "app.views:Base",
+        "pkg.models:Base", "Generic", "Exception", "object",
+    )
+    assert graph.subclasses("pkg.models:Base") == [
+        "app.views:Base", "app.views:View", "app.errors:Failure"
+    ]
+    assert graph.subclasses("pkg.models:Base", transitive=False) == ["app.views:Base"]
+    assert graph.find("Base") == ["app.views:Base", "pkg.models:Base"]
+
+
+def test_changes_invalidate_dependent_modules_and_orders():
+    graph = build({
+        "pkg/__init__.py": "from .models import Base\n",
+        "pkg/models.py": "class Base:\n    pass\n",
+        "app.py": "import pkg\nclass Child(pkg.Base):\n    pass\n",
+    })
+    assert graph.mro("app:Child") == ("app:Child", "pkg.models:Base", "object")
+
+    # Re-exported name disappears: the base falls back to its written name
+    graph.update({"pkg/models.py": CodeAnalyzer.analyze("class Other:\n    pass\n")})
+    assert graph.get("app:Child").bases == ("pkg.Base",)
+    assert graph.mro("app:Child") == ("app:Child", "pkg.Base", "object")
+
+    graph.update({}, removed=["app.py"])
+    assert graph.get("app:Child") is None
+    assert len(graph) == 1
+
+
+def test_inconsistent_and_deep_hierarchies():
+    graph = build({
+        "m.py": (
+            "class A:\n    pass\n"
+            "class B(A):\n    pass\n"
+            "class C(A, B):\n    pass\n"
+        ),
+    })
+    with pytest.raises(InheritanceError):
+        graph.mro("m:C")
+
+    chain = "class K0:\n    pass\n" + "".join(
+        f"class K{n}(K{n - 1}):\n    pass\n" for n in range(1, 3000)
+    )
+    graph = build({"deep.py": chain})
+    assert len(graph.mro("deep:K2999")) == 3001
+    assert len(graph.subclasses("deep:K0")) == 2999
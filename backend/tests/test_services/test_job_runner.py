@@ -0,0 +1,122 @@
+import socket
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from ...database.database import Base
+from ...models.analysis_job import JobStatus
+from ...repositories.job_repository import JobRepository
+from ...services.job_runner import JobRunner
+
+
+def _session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'jobs.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def test_job_runs_and_persists_progress_and_result(tmp_path):
+    session_factory = _session_factory(tmp_path)
+    runner = JobRunner(session_factory=session_factory, max_workers=1, progress_interval_seconds=0)
+
+    def handler(job, progress):
+        progress(1, 2)
+        progress(2, 2)
+        return {"owner": job.username}
+
+    runner.register("demo", handler)
+    with session_factory() as db:
+        job_id = JobRepository(db).create_job("alice", "demo").id
+    runner.enqueue(job_id)
+    runner.shutdown(wait=True)
+
+    with session_factory() as db:
+        job = JobRepository(db).get_for_user(job_id, "alice")
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.result == {"owner": "alice"}
+        assert (job.completed, job.total, job.progress) == (2, 2, 1.0)
+
+
+def test_failed_handler_marks_job_failed(tmp_path):
+    session_factory = _session_factory(tmp_path)
+    runner = JobRunner(session_factory=session_factory, max_workers=1)
+
+    def handler(job, progress):
+        raise RuntimeError("boom")
+
+    runner.register("demo", handler)
+    with session_factory() as db:
+        job_id = JobRepository(db).create_job("alice", "demo").id
+    runner.enqueue(job_id)
+    runner.shutdown(wait=True)
+
+    with session_factory() as db:
+        job = JobRepository(db).get(job_id)
+        assert job.status == JobStatus.FAILED
+        assert job.error == "RuntimeError: boom"
+
+
+def test_recover_requeues_jobs_of_dead_workers(tmp_path):
+    session_factory = _session_factory(tmp_path)
+    runner = JobRunner(session_factory=session_factory, max_workers=1)
+    runner.register("demo", lambda job, progress: "done")
+
+    with session_factory() as db:
+        repository = JobRepository(db)
+        pending_id = repository.create_job("alice", "demo").id
+        orphan_id = repository.create_job("alice", "demo").id
+        # Claimed by a worker on another host that is still reporting progress
+        live_id = repository.create_job("alice", "demo").id
+        # Claimed by a process on this host that no longer exists
+        repository.claim(orphan_id, f"{socket.gethostname()}:999999999:dead")
+        repository.claim(live_id, "other-host.invalid:1:live")
+
+    assert runner.recover() == 2
+    runner.shutdown(wait=True)
+
+    with session_factory() as db:
+        repository = JobRepository(db)
+        assert repository.get(pending_id).status == JobStatus.SUCCEEDED
+        assert repository.get(orphan_id).status == JobStatus.SUCCEEDED
+        assert repository.get(live_id).status == JobStatus.RUNNING
+
+
+def test_stale_worker_cannot_overwrite_the_new_owner(tmp_path):
+    session_factory = _session_factory(tmp_path)
+
+    with session_factory() as db:
+        repository = JobRepository(db)
+        job_id = repository.create_job("alice", "demo").id
+        assert repository.claim(job_id, "host:1:stale")
+        # Re-queued as stale and claimed again while the first worker still runs
+        assert repository.requeue(job_id, "host:1:stale")
+        assert repository.claim(job_id, "host:2:new")
+
+        assert not repository.update_progress(job_id, "host:1:stale", 1, 2)
+        assert not repository.mark_failed(job_id, "host:1:stale", "lost")
+        assert not repository.mark_succeeded(job_id, "host:1:stale", "old")
+        assert repository.update_progress(job_id, "host:2:new", 1, 2)
+        assert repository.mark_succeeded(job_id, "host:2:new", "new")
+        assert not repository.mark_failed(job_id, "host:2:new", "twice")
+
+        db.expire_all()
+        job = repository.get(job_id)
+        assert (job.status, job.result, job.error) == (JobStatus.SUCCEEDED, "new", None)
+
+
+def test_job_listing_does_not_load_results(tmp_path):
+    session_factory = _session_factory(tmp_path)
+
+    with session_factory() as db:
+        repository = JobRepository(db)
+        job_id = repository.create_job("alice", "demo").id
+        repository.claim(job_id, "host:1:a")
+        repository.mark_succeeded(job_id, "host:1:a", {"files": ["a.py"]})
+
+    with session_factory() as db:
+        [job] = JobRepository(db).list_for_user("alice", limit=5)
+        assert "result" not in job.__dict__
+        assert job.result == {"files": ["a.py"]}
@@ -0,0 +1,63 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from ...database.database import Base
+from ...models.user import UserInDB
+from ...repositories.user_repository import UserRepository
+from ...security.password_hasher import PasswordHasher
+from ...services import user_service as user_service_module
+from ...services.user_service import UserService
+
+
+def test_saturated_hasher_rejects_with_retry_after():
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_pending=1, retry_after_seconds=3)
+    release = threading.Event()
+    hasher.hash = lambda password: release.wait(5) and "hash"
+
+    async def scenario():
+        running = [asyncio.ensure_future(hasher.hash_async("pw")) for _ in range(2)]
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as excinfo:
+            await hasher.hash_async("pw")
+        release.set()
+        await asyncio.gather(*running)
+        return excinfo.value
+
+    try:
+        error = asyncio.run(scenario())
+    finally:
+        hasher.shutdown()
+
+    assert error.status_code == 503
+    assert error.headers["Retry-After"] == "3"
+    assert hasher.stats()["rejected"] == 1
+    assert hasher.stats()["in_flight"] == 0
+
+
+def test_login_rehashes_outdated_cost(tmp_path, monkeypatch):
+    old = PasswordHasher(rounds=4, max_workers=1, max_pending=0)
+    current = PasswordHasher(rounds=5, max_workers=1, max_pending=4)
+    monkeypatch.setattr(user_service_module, "password_hasher", current)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'users.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    repository = UserRepository(db)
+    repository.create_user(UserInDB(username="alice", hashed_password=old.hash("secret")))
+    service = UserService(repository)
+
+    try:
+        assert asyncio.run(service.authenticate_user("alice", "wrong")) is None
+        assert asyncio.run(service.authenticate_user("alice", "secret")) is not None
+        stored = repository.get_by_username("alice").hashed_password
+    finally:
+        current.shutdown()
+        db.close()
+
+    assert stored.startswith("$2b$05$")
+    assert current.verify("secret", stored)
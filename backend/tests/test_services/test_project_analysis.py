@@ -0,0 +1,37 @@
+import asyncio
+
+from ...services.analysis_cache import AnalysisCache
+from ...services.analysis_executor import AnalysisExecutor
+from ...services.analysis_scheduler import AnalysisScheduler
+from ...services.project_analysis_service import ProjectAnalysisService
+
+
+def test_project_report_merges_worker_and_cached_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    user_dir = tmp_path / "uploads" / "alice"
+    (user_dir / "pkg").mkdir(parents=True)
+    (user_dir / "a.py").write_text("class A:\n    def run(self):\n        pass\n")
+    (user_dir / "pkg" / "b.py").write_text("# note\ndef helper():\n    pass\n")
+    (user_dir / "broken.py").write_text("def broken(:\n")
+    (user_dir / "notes.txt").write_text("ignored")
+
+    cache = AnalysisCache(max_bytes=1024 * 1024)
+    executor = AnalysisExecutor(max_workers=2, start_method="spawn")
+    scheduler = AnalysisScheduler(executor, max_concurrency=2, max_queue=1)
+    service = ProjectAnalysisService(cache, executor, chunk_size=1, scheduler=scheduler)
+    try:
+        report = asyncio.run(service.analyze_project("alice"))
+        again = asyncio.run(service.analyze_project("alice"))
+    finally:
+        executor.shutdown()
+
+    assert sorted(report["files"]) == ["a.py", "broken.py", "pkg/b.py"]
+    assert report["files"]["a.py"]["functions_under_classes"] == {
+        "Global_Functions": [], "A": ["run"]
+    }
+    assert report["summary"]["syntax_error_count"] == 1
+    assert report["summary"]["comment_count"] == 1
+    assert report["summary"]["cached_file_count"] == 0
+    assert again["summary"]["cached_file_count"] == 3
+    assert again["files"] == report["files"]
+    assert scheduler.stats()["completed"] == 3
@@ -0,0 +1,118 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from ...core.config import DatabaseSettings
+from ...database.database import Base, create_async_database_engine
+from ...models.user import UserInDB
+from ...repositories.base import encode_cursor
+from ...repositories.user_repository import AsyncUserRepository, UserRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'users.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    yield UserRepository(db)
+    db.close()
+
+
+def _users(count):
+    return [UserInDB(username=f"user{i:03d}", hashed_password="hash") for i in range(count)]
+
+
+def _pages(repository, limit, order_by=None):
+    cursor, pages = None, []
+    while True:
+        page = repository.get_page(limit=limit, cursor=cursor, order_by=order_by)
+        pages.append([user.username for user in page.items])
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+def test_bulk_create_commits_once(repository):
+    commits = []
+    event.listen(repository.db, "after_commit", lambda session: commits.append(1))
+
+    assert repository.bulk_create(_users(25), batch_size=10) == 25
+    assert len(commits) == 1
+    assert repository.username_exists("user024")
+
+
+def test_pages_by_primary_key_cover_every_row_once(repository):
+    repository.bulk_create(_users(25))
+
+    pages = _pages(repository, limit=10)
+
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert sum(pages, []) == [f"user{i:03d}" for i in range(25)]
+
+
+def test_pages_by_created_at_break_ties_by_primary_key(repository):
+    same_second = datetime(2024, 1, 1, 12, 0, 0)
+    rows = [
+        {"username": name, "hashed_password": "hash", "created_at": same_second}
+        for name in ("carol", "alice", "bob")
+    ]
+    rows.append({"username": "aaron", "hashed_password": "hash", "created_at": datetime(2025, 1, 1)})
+    repository.bulk_create(rows)
+
+    pages = _pages(repository, limit=2, order_by="created_at")
+
+    assert pages == [["alice", "bob"], ["carol", "aaron"]]
+
+
+def test_invalid_cursors_are_rejected(repository):
+    repository.bulk_create(_users(3))
+
+    with pytest.raises(ValueError):
+        repository.get_page(cursor="not-a-cursor")
+    with pytest.raises(ValueError):
+        repository.get_page(cursor=encode_cursor("created_at", [datetime(2024, 1, 1), "x"]))
+    with pytest.raises(ValueError):
+        repository.get_page(order_by="no_such_column")
+
+
+def test_bulk_update_and_delete(repository):
+    repository.bulk_create(_users(5))
+
+    assert repository.bulk_update(
+        [{"username": "user001", "disabled": True}, {"username": "user002", "full_name": "Two"}]
+    ) == 2
+    assert repository.bulk_delete(["user003", "user004", "missing"], batch_size=2) == 2
+
+    repository.db.expire_all()
+    assert repository.get_by_username("user001").disabled
+    assert repository.get_by_username("user002").full_name == "Two"
+    assert _pages(repository, limit=10) == [["user000", "user001", "user002"]]
+
+
+def test_async_repository_pages_and_bulk_operations(tmp_path):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async def scenario():
+        engine = create_async_database_engine(
+            DatabaseSettings(url=f"sqlite:///{tmp_path / 'users.db'}")
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            repository = AsyncUserRepository(db)
+            assert await repository.bulk_create(_users(5)) == 5
+            first = await repository.get_page(limit=3)
+            second = await repository.get_page(limit=3, cursor=first.next_cursor)
+            assert [user.username for user in first.items + second.items] == [
+                f"user{i:03d}" for i in range(5)
+            ]
+            assert second.next_cursor is None
+            assert await repository.bulk_delete(["user000", "user001"]) == 2
+            assert len((await repository.get_page()).items) == 3
+        await engine.dispose()
+
+    asyncio.run(scenario())
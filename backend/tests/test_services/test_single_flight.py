@@ -0,0 +1,110 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ...services import analysis_service as analysis_service_module
+from ...services.analysis_cache import AnalysisCache
+from ...services.analysis_scheduler import AnalysisScheduler
+from ...services.analysis_service import AnalysisService
+from ...services.file_io import FileIO
+from ...services.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flights = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def scenario():
+        return await asyncio.gather(*(flights.do("key", work) for _ in range(5)))
+
+    assert asyncio.run(scenario()) == ["result"] * 5
+    assert len(calls) == 1
+    assert flights.stats() == {"in_flight": 0, "executions": 1, "shared": 4}
+
+
+def test_errors_are_shared_and_not_remembered():
+    flights = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def scenario():
+        results = await asyncio.gather(*(flights.do("key", fail) for _ in range(3)), return_exceptions=True)
+        again = await flights.do("key", lambda: asyncio.sleep(0, result="ok"))
+        return results, again
+
+    results, again = asyncio.run(scenario())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert again == "ok"
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    flights = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.02)
+        return 42
+
+    async def scenario():
+        first = asyncio.ensure_future(flights.do("key", work))
+        second = asyncio.ensure_future(flights.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario()) == 42
+
+
+def test_analysis_service_parses_concurrent_requests_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("uploads/alice")
+    with open("uploads/alice/mod.py", "w") as f:
+        f.write("class A:\n    pass\n")
+
+    parses = []
+    started = threading.Event()
+    release = threading.Event()
+    real_analyze = analysis_service_module.CodeAnalyzer.analyze
+
+    def slow_analyze(content):
+        parses.append(content)
+        started.set()
+        release.wait(5)
+        return real_analyze(content)
+
+    monkeypatch.setattr(analysis_service_module.CodeAnalyzer, "analyze", staticmethod(slow_analyze))
+    io = FileIO(max_workers=4)
+    workers = ThreadPoolExecutor(max_workers=2)
+    service = AnalysisService(
+        cache=AnalysisCache(max_bytes=1 << 20),
+        io=io,
+        flights=SingleFlight(),
+        scheduler=AnalysisScheduler(workers, max_concurrency=2, max_queue=4)
+    )
+
+    async def scenario():
+        requests = [
+            asyncio.ensure_future(service.analyze_file_async("mod.py", "alice")) for _ in range(4)
+        ]
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*requests)
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        release.set()
+        io.shutdown()
+        workers.shutdown()
+
+    assert len(parses) == 1
+    assert all(result is results[0] for result in results)
+    assert [cls.name for cls in results[0].classes] == ["A"]
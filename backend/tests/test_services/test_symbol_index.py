@@ -0,0 +1,128 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ...services.analysis_cache import AnalysisCache
+from ...services.analysis_executor import AnalysisBudgetError
+from ...services.analysis_scheduler import AnalysisScheduler
+from ...services.code_analyzer import CodeAnalyzer
+from ...services import project_analysis_service
+from ...services.project_analysis_service import ProjectAnalysisService, analyze_sources
+from ...services.project_workspace import ProjectWorkspace
+from ...services.symbol_index import SymbolIndex
+
+
+def names(symbols):
+    return [(symbol.name, symbol.kind, symbol.file, symbol.line) for symbol in symbols]
+
+
+def test_prefix_search_is_case_insensitive_and_incremental():
+    index = SymbolIndex()
+    index.update({
+        "svc.py": CodeAnalyzer.analyze(
+            "class UserService:\n    def get_user(self):\n        pass\n"
+        ),
+        "util.py": CodeAnalyzer.analyze("def get_config():\n    pass\n"),
+    })
+
+    symbols, truncated = index.search("GET_")
+    assert names(symbols) == [
+        ("get_config", "function", "util.py", 1),
+        ("get_user", "method", "svc.py", 2),
+    ]
+    assert not truncated
+    assert names(index.search("user", kind="class")[0]) == [
+        ("UserService", "class", "svc.py", 1)
+    ]
+    assert index.search("get", limit=1) == (symbols[:1], True)
+
+    index.update({"util.py": CodeAnalyzer.analyze("def load():\n    pass\n")}, removed=["svc.py"])
+    assert names(index.search("")[0]) == [("load", "function", "util.py", 1)]
+
+
+def test_search_takes_milliseconds_on_a_large_index():
+    source = "\n".join(
+        f"class Model{n}:\n    def get_{n}(self):\n        pass\n" for n in range(500)
+    )
+    analysis = CodeAnalyzer.analyze(source)
+    index = SymbolIndex()
+    index.update({f"pkg/mod{n}.py": analysis for n in range(100)})
+    assert len(index) == 100_000
+
+    started = time.perf_counter()
+    for prefix in ("get_42", "model1", "get_499", "missing"):
+        index.search(prefix)
+    assert time.perf_counter() - started < 0.05
+
+    # Replacing one file is an incremental update
+    index.update({"pkg/mod0.py": CodeAnalyzer.analyze("def only():\n    pass\n")})
+    assert len(index) == 99_001
+    assert names(index.search("only")[0]) == [("only", "function", "pkg/mod0.py", 1)]
+
+
+def test_workspace_reindexes_only_changed_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    user_dir = tmp_path / "uploads" / "alice"
+    (user_dir / "pkg").mkdir(parents=True)
+    (user_dir / "a.py").write_text("class A:\n    pass\n")
+    (user_dir / "pkg" / "b.py").write_text("def b():\n    pass\n")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        scheduler = AnalysisScheduler(executor, max_concurrency=1, max_queue=1)
+        projects = ProjectAnalysisService(
+            AnalysisCache(max_bytes=1024 * 1024), executor, scheduler=scheduler
+        )
+        workspace = ProjectWorkspace("alice", projects, refresh_interval_seconds=60)
+        assert asyncio.run(workspace.sync())
+        assert sorted(workspace.analyses) == ["a.py", "pkg/b.py"]
+        assert not asyncio.run(workspace.sync())  # still fresh
+
+        (user_dir / "pkg" / "b.py").write_text("def renamed():\n    pass\n")
+        os.utime(user_dir / "pkg" / "b.py", ns=(1, 1))
+        (user_dir / "a.py").unlink()
+        workspace.mark_stale()
+        assert asyncio.run(workspace.sync())
+
+    assert sorted(workspace.analyses) == ["pkg/b.py"]
+    assert names(workspace.symbols.search("")[0]) == [("renamed", "function", "pkg/b.py", 1)]
+    assert workspace.version == 2
+
+
+def test_workspace_skips_over_budget_files_until_they_change(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    user_dir = tmp_path / "uploads" / "alice"
+    user_dir.mkdir(parents=True)
+    (user_dir / "a.py").write_text("def a():\n    pass\n")
+    (user_dir / "huge.py").write_text("def huge():\n    pass\n")
+    parsed = []
+
+    def analyze(batch):
+        parsed.extend(filename for filename, _ in batch)
+        if any("huge" in source for _, source in batch):
+            raise AnalysisBudgetError("memory")
+        return analyze_sources(batch)
+
+    monkeypatch.setattr(project_analysis_service, "analyze_sources", analyze)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        scheduler = AnalysisScheduler(executor, max_concurrency=1, max_queue=1)
+        projects = ProjectAnalysisService(
+            AnalysisCache(max_bytes=1024 * 1024), executor, scheduler=scheduler
+        )
+        workspace = ProjectWorkspace("alice", projects, refresh_interval_seconds=60)
+        assert asyncio.run(workspace.sync())
+        assert sorted(workspace.analyses) == ["a.py"]
+
+        parsed.clear()
+        workspace.mark_stale()
+        assert not asyncio.run(workspace.sync())
+        assert parsed == []
+
+        (user_dir / "huge.py").write_text("def small():\n    pass\n")
+        os.utime(user_dir / "huge.py", ns=(1, 1))
+        workspace.mark_stale()
+        assert asyncio.run(workspace.sync())
+
+    assert parsed == ["huge.py"]
+    assert sorted(workspace.analyses) == ["a.py", "huge.py"]
+    assert names(workspace.symbols.search("")[0])[1] == ("small", "function", "huge.py", 1)
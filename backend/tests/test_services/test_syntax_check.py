@@ -0,0 +1,107 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ...services.analysis_cache import AnalysisCache
+from ...services.analysis_executor import AnalysisExecutor
+from ...services.analysis_scheduler import AnalysisScheduler
+from ...services.analysis_store import DiskAnalysisStore
+from ...services.syntax_check_service import SyntaxCheckService
+from ...services.syntax_checker import SyntaxCheck, SyntaxChecker, SyntaxIssue
+
+
+def test_compile_errors_are_reported_with_location_and_type():
+    # Parses fine; only the compiler rejects it
+    check = SyntaxChecker.check("def f():\n    pass\nreturn 1\n", "mod.py")
+    assert check.error.error_type == "SyntaxError"
+    assert check.error.message == "'return' outside function"
+    assert (check.error.line, check.error.column, check.error.text) == (3, 1, "return 1")
+
+    assert SyntaxChecker.check("if x:\npass\n").error.error_type == "IndentationError"
+    assert SyntaxChecker.check("x = 1\n").ok
+    assert SyntaxCheck.from_dict(check.to_dict()) == check
+
+
+def test_checks_are_persisted_under_their_own_analyzer(tmp_path):
+    check = SyntaxCheck(SyntaxIssue("SyntaxError", "invalid syntax", 1, 5))
+    key = SyntaxCheckService.make_key("def broken(:\n")
+    path = str(tmp_path / "cache" / "analysis.db")
+    AnalysisCache(max_bytes=1024 * 1024, store=DiskAnalysisStore(path, 1024 * 1024)).put(key, check)
+
+    cache = AnalysisCache(max_bytes=1024 * 1024, store=DiskAnalysisStore(path, 1024 * 1024))
+    assert cache.load(key) == check
+
+
+def test_batch_report_uses_the_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    user_dir = tmp_path / "uploads" / "alice"
+    (user_dir / "pkg").mkdir(parents=True)
+    (user_dir / "ok.py").write_text("def f():\n    return 1\n")
+    (user_dir / "pkg" / "bad.py").write_text("def f():\n    nonlocal x\n")
+
+    cache = AnalysisCache(max_bytes=1024 * 1024)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        service = SyntaxCheckService(cache, executor, chunk_size=1)
+        report = service.check_files_sync("alice", ["ok.py", "pkg/bad.py", "../escape.py"])
+        again = service.check_files_sync("alice", ["ok.py", "pkg/bad.py"])
+
+    assert report["summary"] == {
+        "file_count": 2, "error_count": 1, "cached_file_count": 0,
+        "unreadable_file_count": 1, "over_budget_file_count": 0,
+    }
+    [error] = report["errors"]
+    assert error["file"] == "pkg/bad.py"
+    assert (error["error_type"], error["line"]) == ("SyntaxError", 2)
+    assert "nonlocal" in error["message"]
+    assert report["unreadable"][0]["file"] == "../escape.py"
+    assert again["summary"]["cached_file_count"] == 2
+    assert again["errors"] == report["errors"]
+
+
+def test_project_is_compiled_in_worker_processes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    user_dir = tmp_path / "uploads" / "alice"
+    user_dir.mkdir(parents=True)
+    for index in range(3):
+        (user_dir / f"m{index}.py").write_text(f"VALUE = {index}\n")
+    (user_dir / "broken.py").write_text("def broken(:\n")
+
+    executor = AnalysisExecutor(max_workers=2, start_method="spawn")
+    scheduler = AnalysisScheduler(executor, max_concurrency=2, max_queue=1)
+    service = SyntaxCheckService(
+        AnalysisCache(max_bytes=1024 * 1024), executor, chunk_size=2, scheduler=scheduler
+    )
+    try:
+        report = asyncio.run(service.check_files("alice"))
+    finally:
+        executor.shutdown()
+
+    assert report["summary"]["file_count"] == 4
+    assert [error["file"] for error in report["errors"]] == ["broken.py"]
+    assert scheduler.stats()["completed"] == 2
+
+
+@pytest.mark.skipif(os.name != "posix", reason="budgets use POSIX rlimits")
+def test_files_over_the_memory_budget_are_listed_and_not_cached(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    user_dir = tmp_path / "uploads" / "alice"
+    user_dir.mkdir(parents=True)
+    (user_dir / "ok.py").write_text("VALUE = 1\n")
+    (user_dir / "huge.py").write_text("x = [" + "1, " * (22 * 1024 * 1024 // 3) + "]\n")
+
+    executor = AnalysisExecutor(max_workers=1, start_method="spawn", memory_limit_mb=300)
+    cache = AnalysisCache(max_bytes=1024 * 1024)
+    service = SyntaxCheckService(cache, executor, chunk_size=2)
+    try:
+        report = service.check_files_sync("alice")
+    finally:
+        executor.shutdown()
+
+    assert report["errors"] == []
+    assert [(entry["file"], entry["budget"]) for entry in report["over_budget"]] == [
+        ("huge.py", "memory")
+    ]
+    assert report["summary"]["file_count"] == 1
+    assert cache.load(SyntaxCheckService.make_key((user_dir / "huge.py").read_text())) is None
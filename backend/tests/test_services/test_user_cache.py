@@ -0,0 +1,82 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from ...database.database import Base
+from ...models.user import User, UserInDB
+from ...repositories.user_repository import UserRepository
+from ...security.user_cache import UserCache, user_cache
+from ...services.user_service import UserService
+
+
+def _row(username="alice", disabled=False):
+    return SimpleNamespace(
+        username=username, email=None, full_name=None,
+        disabled=disabled, hashed_password="hash"
+    )
+
+
+def test_hits_do_not_call_the_loader():
+    cache = UserCache(max_size=10, ttl_seconds=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return _row()
+
+    for _ in range(5):
+        assert cache.get_or_load("alice", loader).username == "alice"
+
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (4, 1)
+    assert stats["hit_rate"] == 0.8
+
+
+def test_expired_and_evicted_entries_are_reloaded(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("backend.security.user_cache.time.monotonic", lambda: now[0])
+    cache = UserCache(max_size=1, ttl_seconds=10)
+
+    cache.get_or_load("alice", _row)
+    now[0] += 11
+    assert cache.get("alice") is None
+    assert cache.stats()["expirations"] == 1
+
+    cache.get_or_load("alice", _row)
+    cache.get_or_load("bob", lambda: _row("bob"))
+    assert cache.get("alice") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_load_overlapping_an_invalidation_is_not_cached():
+    cache = UserCache(max_size=10, ttl_seconds=60)
+
+    def stale_loader():
+        cache.invalidate("alice")  # user updated while the old row was being read
+        return _row(disabled=False)
+
+    cache.get_or_load("alice", stale_loader)
+    assert cache.get("alice") is None
+
+
+def test_user_service_updates_invalidate_the_cache(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'users.db'}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    repository = UserRepository(db)
+    repository.create_user(UserInDB(username="alice", hashed_password="hash"))
+    service = UserService(repository)
+
+    user_cache.clear()
+    assert not user_cache.get_or_load("alice", lambda: repository.get_by_username("alice")).disabled
+
+    asyncio.run(service.update_user("alice", User(username="alice", disabled=True)))
+    assert user_cache.get("alice") is None
+    assert user_cache.get_or_load("alice", lambda: repository.get_by_username("alice")).disabled
+
+    asyncio.run(service.delete_user("alice"))
+    assert user_cache.get("alice") is None
+    db.close()